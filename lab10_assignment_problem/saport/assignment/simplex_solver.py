@@ -1,7 +1,8 @@
 import numpy as np
 from .model import AssignmentProblem, Assignment, NormalizedAssignmentProblem
 from ..simplex.model import Model
-from ..simplex.expressions.expression import Expression
+from ..simplex.solverfactory import Engine
+from ..simplex.expressions.builder import quicksum
 from dataclasses import dataclass
 from typing import List
 
@@ -27,7 +28,7 @@ class Solver:
         # 1) creates variables, one for each cost in the cost matrix
         # 2) add constraint, that sum of every row has to be equal 1
         # 3) add constraint, that sum of every col has to be equal 1
-        # 4) add constraint, that every variable has to be <= 1
+        # 4) bound every variable from above with 1
         # 5) create an objective expression, involving all variables weighted by their cost
         # 6) add the objective to model (minimize it!)
 
@@ -36,28 +37,20 @@ class Solver:
         xs = [[model.create_variable(f'x{i, j}') for j in range(ilosc_kolumn)] for i in range(ilosc_wierszy)]
 
         for i in range(ilosc_wierszy):
-            constraint = Expression()
-            for j in range(ilosc_kolumn):
-                constraint += xs[i][j]
-            model.add_constraint(constraint == 1)
+            model.add_constraint(quicksum(xs[i][j] for j in range(ilosc_kolumn)) == 1)
 
         for j in range(ilosc_kolumn):
-            constraint = Expression()
-            for i in range(ilosc_wierszy):
-                constraint += xs[i][j]
-            model.add_constraint(constraint == 1)
+            model.add_constraint(quicksum(xs[i][j] for i in range(ilosc_wierszy)) == 1)
 
         for i in range(ilosc_wierszy):
             for j in range(ilosc_kolumn):
-                model.add_constraint(xs[i][j] <= 1)
+                model.set_upper_bound(xs[i][j], 1)
 
-        obj = Expression()
-        for i in range(ilosc_wierszy):
-            for j in range(ilosc_kolumn):
-                obj += xs[i][j] * self.problem.costs[i][j]
+        obj = quicksum(xs[i][j] * self.problem.costs[i][j] for i in range(ilosc_wierszy) for j in range(ilosc_kolumn))
         model.minimize(obj)
 
-        solution = model.solve()
+        # the model is mostly zeros, so the sparse engine is used
+        solution = model.solve(Engine.SPARSE)
 
         # 1) extract assignment for the original problem from the solution object
         # tips:
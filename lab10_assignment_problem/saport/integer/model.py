@@ -22,7 +22,7 @@ class Model(lpmodel.Model):
 '''
         return text
 
-    def solve(self, timelimit = float('inf')):
+    def solve(self, timelimit = float('inf'), warm_start = True):
         if len(self.variables) == 0:
             raise Exception("Can't solve a model without any variables")
 
@@ -30,4 +30,4 @@ class Model(lpmodel.Model):
             raise Exception("Can't solve a model without an objective")
 
         self.solver = s.Solver()
-        return self.solver.solve(self.translate_to_standard_form(), timelimit)
\ No newline at end of file
+        return self.solver.solve(self.translate_to_standard_form(), timelimit, warm_start)
\ No newline at end of file
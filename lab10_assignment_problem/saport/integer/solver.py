@@ -1,5 +1,5 @@
-from copy import deepcopy
 from ..simplex import solver as lpsolver
+from ..simplex.history import Retention
 import math
 import time 
 
@@ -20,6 +20,10 @@ class Solver:
             when the solving started
         interrupted: bool
             whether solving has been interrupted (by timeout)
+        warm_start: bool
+            whether the relaxations of the child nodes are re-optimized with the dual simplex from the parent tableaux
+        iterations: int
+            total number of simplex pivots done while solving the relaxations
 
         Methods
         -------
@@ -32,19 +36,24 @@ class Solver:
         timeout() -> bool:
             whether solver should stop working due to the timeout
 
-        solve(model: Model, timelimit: int) -> Solution:
+        solve(model: Model, timelimit: int, warm_start: bool = True) -> Solution:
             solves the given model within a specified timelimit
-        branch_and_bound(model: Model):
-            processes given model in branch and bound fashion (recursively)
+        branch_and_bound(model: Model, parent_solution: Solution | None = None, constraint: Constraint | None = None):
+            processes given model in branch and bound fashion (recursively),
+            model is the parent model with the new branching constraint
+        solve_relaxation(model: Model, parent_solution: Solution | None, constraint: Constraint | None) -> Solution:
+            solves the linear relaxation of the model, warm starting from the parent solution if possible
         find_float_assignment(solution: Solution):
             finds a variable with non-integer value in the current solution
             returns None if the solution is a correct integer solution
         model_with_new_constraint(self, model, constraint):
-            creates a new model with an additional constraint
+            creates a new model with an additional constraint, sharing the rest of the model with the parent one
     """  
 
-    def solve(self, model, timelimit):
+    def solve(self, model, timelimit, warm_start = True):
         self.timelimit = timelimit
+        self.warm_start = warm_start
+        self.iterations = 0
         self.total_time = None
         self.start_time = None
         self.interrupted = False
@@ -59,8 +68,8 @@ class Solver:
 
         return self.best_solution
            
-    def branch_and_bound(self, model):
-        relaxed_solution = lpsolver.Solver().solve(model)
+    def branch_and_bound(self, model, parent_solution = None, constraint = None):
+        relaxed_solution = self.solve_relaxation(model, parent_solution, constraint)
 
         if relaxed_solution.assignment == None:
             if self.best_solution == None:
@@ -73,6 +82,8 @@ class Solver:
 
         var_to_branch = self.find_float_assignment(relaxed_solution)
         if var_to_branch == None:
+            # warm started relaxations may leave round-off errors in the integer values
+            relaxed_solution.assignment = [float(round(v)) for v in relaxed_solution.assignment]
             objective = relaxed_solution.objective_value()
             if objective > self.lower_bound:
                 self.lower_bound = objective
@@ -84,11 +95,20 @@ class Solver:
             return 
 
         current_value = relaxed_solution.value(var_to_branch)
-        new_model = self.model_with_new_constraint(model, var_to_branch >= math.ceil(current_value))
-        self.branch_and_bound(new_model)
-        new_model = self.model_with_new_constraint(model, var_to_branch <= math.floor(current_value))
-        self.branch_and_bound(new_model)
-
+        constraint = var_to_branch >= math.ceil(current_value)
+        self.branch_and_bound(self.model_with_new_constraint(model, constraint), relaxed_solution, constraint)
+        constraint = var_to_branch <= math.floor(current_value)
+        self.branch_and_bound(self.model_with_new_constraint(model, constraint), relaxed_solution, constraint)
+
+    def solve_relaxation(self, model, parent_solution, constraint):
+        # the nodes keep only what the warm start of their children needs: the final tableaux or nothing at all
+        lp_solver = lpsolver.Solver(retention = Retention.FINAL if self.warm_start else Retention.NONE)
+        if self.warm_start and parent_solution != None:
+            solution = lp_solver.reoptimize(parent_solution, [constraint])
+        else:
+            solution = lp_solver.solve(model)
+        self.iterations += solution.iterations
+        return solution
         
     def find_float_assignment(self, solution):
         eps = 0.0000001
@@ -99,7 +119,7 @@ class Solver:
         return None
 
     def model_with_new_constraint(self, model, constraint):
-        new_model = deepcopy(model)
+        new_model = model.copy()
         new_model.add_constraint(constraint)
         return new_model
 
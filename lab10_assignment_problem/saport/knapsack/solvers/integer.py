@@ -22,7 +22,7 @@ class IntegerSolver(AbstractSolver):
         m.maximize(Expression.from_vectors(vars, values))
         m.add_constraint(Expression.from_vectors(vars, weights) <= self.problem.capacity)
         for v in vars:
-            m.add_constraint(v <= 1)
+            m.set_upper_bound(v, 1)
         return m
     
     def solve(self) -> Solution:
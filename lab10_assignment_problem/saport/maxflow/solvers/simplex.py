@@ -1,16 +1,23 @@
 from .solver import AbstractSolver
 from ...simplex.model import Model as LinearModel
+from ...simplex.solverfactory import Engine
+from ...simplex.cache import SolutionCache
 from ...simplex.expressions.expression import Expression as LinearExpression
 from ..model import Network 
 
 class SimplexSolver(AbstractSolver):
 
+    def __init__(self, network: Network, cache: SolutionCache = None):
+        super().__init__(network)
+        # optional cache of the LP solutions, shared by the solvers of repeated networks
+        self.cache = cache
+
     def solve(self) -> int:
         m = LinearModel(self.network.name)
         vars = {(u,v) : m.create_variable(f"f({u},{v})") for u,v in self.network.digraph.edges()}
 
         for (u,v), var in vars.items():
-            m.add_constraint(var <= Network.capacity(self.network.digraph, u, v))
+            m.set_upper_bound(var, Network.capacity(self.network.digraph, u, v))
 
         for u in self.network.digraph.nodes():
             if u in { self.network.sink_node, self.network.source_node }:
@@ -29,7 +36,8 @@ class SimplexSolver(AbstractSolver):
         expression = LinearExpression.from_vectors(source_vars, [1.0] * len(source_vars))
         m.maximize(expression)
 
-        solution = m.solve()
+        # the incidence matrix is mostly zeros, so the sparse engine is used
+        solution = m.solve(Engine.SPARSE, cache=self.cache)
         return int(solution.objective_value())
 
 
@@ -1,14 +1,20 @@
 from dataclasses import dataclass
 from .solver import AbstractSolver
 from ..model import Game, Equilibrium, Strategy
-from ...simplex import model as lpmodel
+from ...simplex import array_model as lpmodel
 from ...simplex import solution as lpsolution
-from ...simplex.expressions import expression as expr
+from ...simplex.cache import SolutionCache
+from ...simplex.expressions.constraint import ConstraintType
 import numpy as np
 from typing import Tuple, List
 
 class MixedSolver(AbstractSolver):
 
+    def __init__(self, game: Game, cache: SolutionCache = None):
+        super().__init__(game)
+        # optional cache of the LP solutions, shared by the solvers of repeated games
+        self.cache = cache
+
     def solve(self) -> Equilibrium:
         shifted_game, shift = self.shift_game_rewards()
 
@@ -17,8 +23,8 @@ class MixedSolver(AbstractSolver):
 
         a_model = self.create_max_model(shifted_game)
         b_model = self.create_min_model(shifted_game)       
-        a_solution = a_model.solve()
-        b_solution = b_model.solve()
+        a_solution = a_model.solve(cache=self.cache)
+        b_solution = b_model.solve(cache=self.cache)
 
         a_probabilities = self.extract_probabilities(a_solution)
         b_probabilities = self.extract_probabilities(b_solution)
@@ -31,36 +37,35 @@ class MixedSolver(AbstractSolver):
         shift = 0 if maximin >= 0 else -maximin
         return Game(self.game.reward_matrix + shift), shift
 
-    def create_max_model(self, game: Game) -> lpmodel.Model:
-        a_num_actions, _ = game.reward_matrix.shape
-        a_actions = range(a_num_actions)
-        a_model = lpmodel.Model("A")
+    def create_max_model(self, game: Game) -> lpmodel.ArrayModel:
+        a_num_actions, b_num_actions = game.reward_matrix.shape
+        a_model = lpmodel.ArrayModel("A")
 
         v = a_model.create_variable("v")
-        xs = [a_model.create_variable(f"x{i}") for i in a_actions]
-        
-        a_model.add_constraint(expr.Expression.from_vectors(xs, [1 for _ in xs]) == 1)
-        for col in game.reward_matrix.T:
-            a_model.add_constraint(expr.Expression.from_vectors([v] + xs, [1] + list(-1 * col)) <= 0)
+        xs = a_model.create_variables(a_num_actions, "x")
+
+        a_model.add_constraints_from_arrays(np.ones((1, a_num_actions)), 1, ConstraintType.EQ, xs)
+        # v - sum of x_i * reward_ij <= 0, for every column j
+        a_model.add_constraints_from_arrays(np.column_stack([np.ones(b_num_actions), -game.reward_matrix.T]), 0, ConstraintType.LE)
         a_model.maximize(v)
 
         return a_model
 
-    def create_min_model(self, game: Game) -> lpmodel.Model:
-        _, b_num_actions = game.reward_matrix.shape
-        b_actions = range(b_num_actions)
+    def create_min_model(self, game: Game) -> lpmodel.ArrayModel:
+        a_num_actions, b_num_actions = game.reward_matrix.shape
+        b_model = lpmodel.ArrayModel("B")
 
-        b_model = lpmodel.Model("B")
         v = b_model.create_variable("v")
-        ys = [b_model.create_variable(f"y{i}") for i in b_actions]
-        
-        b_model.add_constraint(expr.Expression.from_vectors(ys, [1 for _ in ys]) == 1)
-        for row in game.reward_matrix:
-            b_model.add_constraint(expr.Expression.from_vectors([v] + ys, [1] + list(-1 * row)) >= 0)
+        ys = b_model.create_variables(b_num_actions, "y")
+
+        b_model.add_constraints_from_arrays(np.ones((1, b_num_actions)), 1, ConstraintType.EQ, ys)
+        # v - sum of y_j * reward_ij >= 0, for every row i
+        b_model.add_constraints_from_arrays(np.column_stack([np.ones(a_num_actions), -game.reward_matrix]), 0, ConstraintType.GE)
         b_model.minimize(v)
 
         return b_model
 
     def extract_probabilities(self, solution: lpsolution.Solution) -> List[float]:
-        return [solution.value(x) for x in solution.model.variables if not solution.model.objective.depends_on_variable(solution.model, x)]
+        objective = solution.model.objective
+        return [solution.value(x) for x in solution.model.variables if not objective.depends_on_variable(solution.model, x)]
 
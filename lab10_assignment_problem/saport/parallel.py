@@ -0,0 +1,305 @@
+from __future__ import annotations
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum
+from multiprocessing import connection as mpc
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, List, Optional, Tuple
+import math
+import multiprocessing
+import os
+import time
+
+# the other problem packages are imported by the task functions, so every worker imports only what it solves
+from .simplex import array_model as sam
+from .simplex import solverfactory as ssf
+from .simplex.expressions import objective as so
+from .simplex.sparse import SparseMatrix
+
+if TYPE_CHECKING:
+    from .assignment.model import Assignment
+    from .knapsack.model import Solution
+    from .knapsack.solverfactory import SolverType
+
+
+class TaskStatus(Enum):
+    """
+    An enum representing how a task has ended:
+    - DONE = the task returned its result
+    - FAILED = the task raised an exception (or its worker died)
+    - TIMEOUT = the task exceeded its time limit and its worker has been terminated
+    """
+    DONE = "done"
+    FAILED = "failed"
+    TIMEOUT = "timeout"
+
+
+@dataclass
+class Task:
+    """
+    A dataclass representing a task solved in a worker process.
+    Only the function (pickled by its qualified name, so it has to be defined at a module level)
+    and its arguments are sent to the worker, so the arguments should be a compact description
+    of the problem (a path, a few numpy arrays), not the object graph of the model.
+
+    Attributes
+    ----------
+    function : Callable
+        module level function solving the problem
+    args : Tuple
+        arguments of the function
+    name : str
+        name of the task reported with its result
+    timelimit : Optional[float]
+        how many seconds the task may run before its worker is terminated (None = the limit of solve_many, inf = no limit)
+    """
+    function: Callable
+    args: Tuple
+    name: str = ""
+    timelimit: Optional[float] = None
+
+
+@dataclass
+class TaskResult:
+    """
+    A dataclass representing a result of a task.
+
+    Attributes
+    ----------
+    index : int
+        position of the task in the tasks given to solve_many
+    name : str
+        name of the task
+    status : TaskStatus
+        how the task has ended
+    value : Any
+        value returned by the task function (None if it hasn't returned)
+    error : Optional[str]
+        description of the exception or the timeout
+    time : float
+        wall time (in seconds) from sending the task to the worker to receiving its result
+    """
+    index: int
+    name: str
+    status: TaskStatus
+    value: Any
+    error: Optional[str]
+    time: float
+
+
+@dataclass
+class LinearResult:
+    """
+    A dataclass representing a compact solution of a linear problem solved by simplex_task.
+
+    Attributes
+    ----------
+    is_feasible : bool
+        whether the problem is feasible
+    is_bounded : bool
+        whether the problem is bounded
+    assignment : Optional[List[float]]
+        value of every variable (None if there is no optimal solution)
+    objective_value : Optional[float]
+        value of the objective (None if there is no optimal solution)
+    """
+    is_feasible: bool
+    is_bounded: bool
+    assignment: Optional[List[float]]
+    objective_value: Optional[float]
+
+
+def solve_many(tasks: Iterable[Task], workers: Optional[int] = None, timelimit: Optional[float] = None) -> Iterator[TaskResult]:
+    """
+    solves the tasks in a pool of worker processes (os.cpu_count() of them by default)
+    and yields their results in the order they finish. A task running longer than its time limit
+    (task.timelimit or the timelimit argument) gets its worker terminated and replaced by a new one.
+    The workers are stopped when all the tasks are done or when the caller stops iterating the results.
+    """
+    pending = deque(enumerate(tasks))
+    workers = max(1, min(workers or os.cpu_count() or 1, len(pending)))
+    context = multiprocessing.get_context()
+    pool = [_Worker(context) for _ in range(workers)]
+    try:
+        while len(pending) > 0 or any(worker.busy() for worker in pool):
+            for worker in pool:
+                if not worker.busy() and len(pending) > 0:
+                    (index, task) = pending.popleft()
+                    worker.start(index, task, task.timelimit if task.timelimit != None else timelimit)
+
+            busy = [worker for worker in pool if worker.busy()]
+            deadlines = [worker.deadline for worker in busy if worker.deadline != None]
+            wait_time = max(0.0, min(deadlines) - time.perf_counter()) if len(deadlines) > 0 else None
+            ready = mpc.wait([worker.connection for worker in busy], wait_time)
+
+            for worker in busy:
+                if worker.connection in ready:
+                    yield worker.receive()
+                elif worker.expired():
+                    yield worker.timeout()
+    finally:
+        for worker in pool:
+            worker.stop()
+
+
+def knapsack_task(path: str, solver_type: SolverType, timelimit: int = 60, hard_timelimit: Optional[float] = None) -> Task:
+    """
+    creates a task solving the knapsack problem from the file with the given solver,
+    timelimit is passed to the solver (which stops on its own), hard_timelimit terminates the worker.
+    The task returns the knapsack Solution and the solving time measured by the solver.
+    """
+    return Task(_solve_knapsack, (path, solver_type.value, timelimit), f"{os.path.basename(path)} {solver_type.value}", hard_timelimit)
+
+
+def assignment_task(path: str, solver: str = "hungarian", timelimit: Optional[float] = None) -> Task:
+    """
+    creates a task solving the assignment problem from the file with the "hungarian" or "simplex" solver,
+    the task returns the Assignment
+    """
+    return Task(_solve_assignment, (path, solver), f"{os.path.basename(path)} {solver}", timelimit)
+
+
+def maxflow_task(path: str, solver: str = "edmonds-karp", timelimit: Optional[float] = None) -> Task:
+    """
+    creates a task computing the max flow of the network from the DNF file
+    with the "edmonds-karp", "simplex" or "networkx" solver, the task returns the max flow
+    """
+    return Task(_solve_maxflow, (path, solver), f"{os.path.basename(path)} {solver}", timelimit)
+
+
+def simplex_task(model, engine: Optional[ssf.Engine] = None, timelimit: Optional[float] = None) -> Task:
+    """
+    creates a task solving the linear problem (Model or ArrayModel), the model is sent to the worker
+    as its numpy arrays and solved as an ArrayModel (with its default engine if not given),
+    the task returns the LinearResult
+    """
+    if not isinstance(model, sam.ArrayModel):
+        model = sam.ArrayModel.from_model(model)
+    objective_type = None if model.objective_type == None else model.objective_type.value
+    description = (model.name, [var.name for var in model.variables], model.rows, model.columns, model.values,
+                   model.bounds, model.types, model.objective_factors, objective_type, model.lower_bounds, model.upper_bounds)
+    return Task(_solve_simplex, (description, None if engine == None else engine.value), model.name, timelimit)
+
+
+def _solve_knapsack(path: str, solver_type: str, timelimit: int) -> Tuple[Solution, float]:
+    from .knapsack import model as km
+    from .knapsack import solverfactory as ksf
+    solver = ksf.SolverFactory.solver(ksf.SolverType(solver_type), km.Problem.from_path(path), timelimit)
+    solution = solver.solve()
+    return (solution, solver.total_time)
+
+
+def _solve_assignment(path: str, solver: str) -> Assignment:
+    from .assignment import hungarian_solver as ahs
+    from .assignment import model as am
+    from .assignment import simplex_solver as ass
+    solvers = {"hungarian": ahs.Solver, "simplex": ass.Solver}
+    return solvers[solver](am.AssignmentProblem.from_file(path)).solve()
+
+
+def _solve_maxflow(path: str, solver: str) -> int:
+    from .maxflow import model as mm
+    from .maxflow.solvers import edmondskarp as mek
+    from .maxflow.solvers import networkx as mnx
+    from .maxflow.solvers import simplex as msx
+    solvers = {"edmonds-karp": mek.EdmondsKarp, "simplex": msx.SimplexSolver, "networkx": mnx.NetworkXSolver}
+    return solvers[solver](mm.Network.from_file(path)).solve()
+
+
+def _solve_simplex(description: Tuple, engine: Optional[str]) -> LinearResult:
+    (name, names, rows, columns, values, bounds, types, objective_factors, objective_type, lower_bounds, upper_bounds) = description
+    model = sam.ArrayModel(name)
+    model.create_named_variables(names)
+    model.add_constraints_from_arrays(SparseMatrix.from_triplets(rows, columns, values, (len(bounds), len(names))), bounds, types)
+    if objective_type != None:
+        model.set_objective(objective_factors, so.ObjectiveType(objective_type))
+    model.lower_bounds[:] = lower_bounds
+    model.upper_bounds[:] = upper_bounds
+
+    if engine == None:
+        solution = model.solve(retention = ssf.Retention.NONE)
+    else:
+        solution = model.solve(ssf.Engine(engine), retention = ssf.Retention.NONE)
+    if solution.assignment == None:
+        return LinearResult(solution.is_feasible, solution.is_bounded, None, None)
+    return LinearResult(solution.is_feasible, solution.is_bounded, list(solution.assignment), solution.objective_value())
+
+
+def _work(connection: mpc.Connection) -> None:
+    """
+    runs in the worker process: receives (function, args) messages until None
+    and sends back (status, value, error) of every call
+    """
+    while True:
+        message = connection.recv()
+        if message == None:
+            return
+        (function, args) = message
+        try:
+            connection.send((TaskStatus.DONE, function(*args), None))
+        except Exception as error:
+            connection.send((TaskStatus.FAILED, None, f"{type(error).__name__}: {error}"))
+
+
+class _Worker:
+    """
+    A worker process of solve_many with the task it is running.
+    """
+
+    def __init__(self, context):
+        self.context = context
+        self.task = None
+        self._spawn()
+
+    def busy(self) -> bool:
+        return self.task != None
+
+    def start(self, index: int, task: Task, timelimit: Optional[float]) -> None:
+        self.index = index
+        self.task = task
+        self.started = time.perf_counter()
+        # an infinite limit means no deadline, the wait for the results can't take an infinite timeout
+        self.deadline = None if timelimit == None or not math.isfinite(timelimit) else self.started + timelimit
+        self.connection.send((task.function, task.args))
+
+    def expired(self) -> bool:
+        return self.deadline != None and time.perf_counter() >= self.deadline
+
+    def receive(self) -> TaskResult:
+        try:
+            (status, value, error) = self.connection.recv()
+        except EOFError:
+            self.process.join()
+            (status, value, error) = (TaskStatus.FAILED, None, f"worker exited with code {self.process.exitcode}")
+            self._restart()
+        return self._finish(status, value, error)
+
+    def timeout(self) -> TaskResult:
+        self._restart()
+        return self._finish(TaskStatus.TIMEOUT, None, f"exceeded the time limit of {self.deadline - self.started:.2f}s")
+
+    def stop(self) -> None:
+        if self.process.is_alive() and not self.busy():
+            self.connection.send(None)
+            self.process.join(1.0)
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join()
+        self.connection.close()
+
+    def _finish(self, status: TaskStatus, value: Any, error: Optional[str]) -> TaskResult:
+        result = TaskResult(self.index, self.task.name, status, value, error, time.perf_counter() - self.started)
+        self.task = None
+        return result
+
+    def _spawn(self) -> None:
+        (self.connection, child_connection) = self.context.Pipe()
+        self.process = self.context.Process(target=_work, args=(child_connection,), daemon=True)
+        self.process.start()
+        child_connection.close()
+
+    def _restart(self) -> None:
+        """
+        replaces the (terminated or dead) process with a new one, the task is kept to report its result
+        """
+        self.stop()
+        self._spawn()
@@ -1,4 +1,5 @@
 from .analysis_tools.objective_sensitivity import ObjectiveSensitivityAnalyser
+from .analysis_tools.rhs_sensitivity import RHSSensitivityAnalyser
 
 class Analyser:
     """
@@ -12,21 +13,26 @@ class Analyser:
 
         Methods
         -------
-        analyse(solution: Solution) -> List:
-            returns list of various analysis results for the given solution
+        analyse(solution: Solution) -> dict:
+            returns results of every tool accepting the given solution, keyed by the tool name
+            (e.g. the cost coefficient sensitivity is skipped for a presolved solution)
         interpret_results(solution: Solution, results : List, print_function : Callable = print):
             prints an interpretation of the given analysis results via given print function
     """
     
     def __init__(self):
-        self.tools = [ObjectiveSensitivityAnalyser()]
+        self.tools = [ObjectiveSensitivityAnalyser(), RHSSensitivityAnalyser()]
 
     def analyse(self, solution):
+        if solution.tableaux == None:
+            raise Exception("Solution has no tableaux to analyse, solve the model with the tableaux or revised engine keeping at least the final tableaux")
         result = dict()
         for tool in self.tools:
-            result[tool.name] = tool.analyse(solution)
+            if tool.accepts(solution):
+                result[tool.name] = tool.analyse(solution)
         return result
 
     def interpret_results(self, solution, results, print_function = print):
         for tool in self.tools:
-            tool.interpret_results(solution, results[tool.name], print_function)
\ No newline at end of file
+            if tool.name in results:
+                tool.interpret_results(solution, results[tool.name], print_function)
\ No newline at end of file
@@ -1,3 +1,6 @@
+import numpy as np
+
+
 class ObjectiveSensitivityAnalyser:
     """
         A class used to analyse sensitivity to changes of the cost factors.
@@ -14,6 +17,8 @@ class ObjectiveSensitivityAnalyser:
             analyses the solution and returns list of tuples containing acceptable bounds for every objective coefficient, i.e.
             if the results contain tuple (-inf, 5.0) at index 1, it means that objective coefficient at index 1 should have value >= -inf and <= 5.0
             to keep the current solution an optimum
+        accepts(solution: Solution) -> bool
+            returns False for a presolved solution, its tableaux belongs to the reduced model
 
          interpret_results(solution: Solution, results : List(float, float), print_function : Callable = print):
             prints an interpretation of the given analysis results via given print function
@@ -26,29 +31,35 @@ class ObjectiveSensitivityAnalyser:
     def __init__(self):
         self.name = ObjectiveSensitivityAnalyser.name()
     
+    def accepts(self, solution):
+        return solution.presolve_stats == None
+
     def analyse(self, solution):
-        obj_coeffs = solution.normal_model.objective.expression.factors(solution.model)
-        final_obj_coeffs = solution.tableaux.table[0,:-1]
-        obj_coeffs_ranges = []
-
-        basis = solution.tableaux.extract_basis()
-        for (i, obj_coeff) in enumerate(obj_coeffs):
-            left_side, right_side = None, None
-            if i in basis:
-                row = basis.index(i)
-                row_coeffs = solution.tableaux.table[row + 1, :-1]
-                
-                left_side_bounds = [final_obj_coeffs[j] / a for (j, a) in enumerate(row_coeffs) if a > 0 and j != i]
-                left_side = float('-inf') if len(left_side_bounds) == 0 else obj_coeff - min(left_side_bounds)
-                right_side_bounds = [final_obj_coeffs[j] / a for (j, a) in enumerate(row_coeffs) if a < 0 and j != i]
-                right_side = float('inf') if len(right_side_bounds) == 0 else obj_coeff - max(right_side_bounds)           
-            else:
-                left_side = float('-inf')
-                right_side = obj_coeff + solution.tableaux.table[0,i]
-
-            obj_coeffs_ranges.append((left_side, right_side))
-        
-        return obj_coeffs_ranges
+        if not self.accepts(solution):
+            raise Exception("Cost coefficient sensitivity needs the tableaux of the whole model, solve it without the presolve")
+        tableaux = solution.tableaux
+        obj_coeffs = np.array(solution.normal_model.objective.expression.factors(solution.model), dtype=float)
+        final_obj_coeffs = tableaux.table[0, :-1]
+
+        # nonbasic variable stays nonbasic until its coefficient exceeds its reduced cost
+        left_sides = np.full(len(obj_coeffs), -np.inf)
+        right_sides = obj_coeffs + final_obj_coeffs[:len(obj_coeffs)]
+
+        # basic variable stays basic until one of the ratios of the reduced costs to its row changes sign, all rows are tested at once
+        basic_rows = np.flatnonzero((tableaux.basis >= 0) & (tableaux.basis < len(obj_coeffs)))
+        basic_vars = tableaux.basis[basic_rows]
+        row_coeffs = tableaux.table[basic_rows + 1, :-1]
+        others = np.ones(row_coeffs.shape, dtype=bool)
+        others[np.arange(len(basic_rows)), basic_vars] = False
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ratios = final_obj_coeffs / row_coeffs
+        left_side_bounds = np.where(others & (row_coeffs > 0), ratios, np.inf).min(axis=1, initial=np.inf)
+        right_side_bounds = np.where(others & (row_coeffs < 0), ratios, -np.inf).max(axis=1, initial=-np.inf)
+        # without any bound the difference is already the infinite side
+        left_sides[basic_vars] = obj_coeffs[basic_vars] - left_side_bounds
+        right_sides[basic_vars] = obj_coeffs[basic_vars] - right_side_bounds
+
+        return [(float(left_side), float(right_side)) for (left_side, right_side) in zip(left_sides, right_sides)]
 
 
     def interpret_results(self, solution, obj_coeffs_ranges, print_function):        
@@ -0,0 +1,293 @@
+from copy import deepcopy
+from enum import Enum
+
+from .rhs_sensitivity import RHSSensitivityAnalyser
+import numpy as np
+
+eps = 0.0000001
+
+
+class ParametricEnd(Enum):
+    """
+        An enum representing why the parametric analysis has stopped:
+        - LIMIT = the parameter has reached its maximal value
+        - UNBOUNDED = the model is unbounded for any bigger value of the parameter
+        - UNFEASIBLE = the model is unfeasible for any bigger value of the parameter
+    """
+    LIMIT = "limit"
+    UNBOUNDED = "unbounded"
+    UNFEASIBLE = "unfeasible"
+
+
+class ParametricSegment:
+    """
+        A class to represent one linear piece of the optimal value function, on which the basis stays optimal.
+
+        Attributes
+        ----------
+        start : float
+            parameter value where the piece starts
+        end : float
+            parameter value where the piece ends (a breakpoint or the limit of the parameter)
+        value : float
+            optimal objective value at the start of the piece
+        slope : float
+            change of the optimal objective value per unit of the parameter
+        basis : list[int]
+            the optimal basis (columns of the normal model)
+        assignment : list[float]
+            the optimal assignment at the start of the piece
+
+        Methods
+        -------
+        value_at(theta: float) -> float:
+            returns the optimal objective value for the parameter value inside the piece
+    """
+
+    def __init__(self, start, end, value, slope, basis, assignment):
+        self.start = start
+        self.end = end
+        self.value = value
+        self.slope = slope
+        self.basis = basis
+        self.assignment = assignment
+
+    def value_at(self, theta):
+        return self.value + self.slope * (theta - self.start)
+
+    def __str__(self):
+        return f"[{self.start:.3f}, {self.end:.3f}]: z = {self.value:.3f} + {self.slope:.3f} * (t - {self.start:.3f}), basis: {self.basis}"
+
+
+class ParametricResult:
+    """
+        A class to represent the piecewise linear optimal value function found by the parametric analysis.
+
+        Attributes
+        ----------
+        segments : list[ParametricSegment]
+            linear pieces of the function, ordered by the parameter
+        end : ParametricEnd
+            why the analysis has stopped after the last segment
+        pivots : int
+            number of pivots done to walk through all the breakpoints
+
+        Methods
+        -------
+        breakpoints() -> list[float]:
+            returns parameter values at which the optimal basis changes
+        value(theta: float) -> float | None:
+            returns the optimal objective value for the parameter value, None if there is no optimum
+    """
+
+    def __init__(self):
+        self.segments = []
+        self.end = ParametricEnd.LIMIT
+        self.pivots = 0
+
+    def breakpoints(self):
+        return [segment.start for segment in self.segments[1:]]
+
+    def value(self, theta):
+        for segment in self.segments:
+            if segment.start - eps <= theta <= segment.end + eps:
+                return segment.value_at(theta)
+        return None
+
+    def __str__(self):
+        text = "\n".join(str(segment) for segment in self.segments)
+        return text + f"\nend: {self.end.value}"
+
+
+class ParametricAnalyser:
+    """
+        A class used to trace how the optimum changes when the constraint bounds (b + t * direction)
+        or the cost factors (c + t * direction) move along a direction, for t from 0 up to the limit.
+        The walk starts at the final tableaux of the solution: the basis stays optimal until one of the basic
+        variables reaches its bound (for the bounds) or one of the reduced costs reaches zero (for the costs),
+        at such a breakpoint a single dual (or primal) simplex pivot gives the next optimal basis.
+        The direction is applied to the tableaux, so no model is solved again.
+        The tool needs a direction, so it isn't a part of the Analyser.
+
+        Attributes
+        ----------
+        name : str
+            unique name of the analysis tool
+
+        Methods
+        -------
+        analyse_rhs(solution: Solution, direction: Iterable[float], limit: float = inf) -> ParametricResult
+            traces the optimum for the bounds b + t * direction (a value for every constraint), 0 <= t <= limit
+        analyse_objective(solution: Solution, direction: Iterable[float], limit: float = inf) -> ParametricResult
+            traces the optimum for the cost factors c + t * direction (a value for every variable), 0 <= t <= limit
+        (both need the tableaux of the whole model, so they refuse presolved solutions)
+        interpret_results(solution: Solution, result: ParametricResult, print_function : Callable = print):
+            prints an interpretation of the given analysis results via given print function
+    """
+
+    @classmethod
+    def name(self):
+        return "Parametric Analysis"
+
+    def __init__(self):
+        self.name = ParametricAnalyser.name()
+
+    def analyse_rhs(self, solution, direction, limit = np.inf):
+        model = solution.model
+        direction = self._direction(direction, len(model.constraints), "constraint")
+        lower_bounds = np.array(model.lower_bounds, dtype=float)
+        costs = np.array(model.objective.expression.factors(model), dtype=float)
+
+        # change of the basic values (rows) and of the normal objective (row 0) per unit of t, it's pivoted along with the tableaux
+        rhs_analyser = RHSSensitivityAnalyser()
+        (directions, shadow_prices) = rhs_analyser.normal_directions(solution)
+        normal_direction = rhs_analyser.row_signs(model) * direction
+        change = np.append(shadow_prices.dot(normal_direction), directions.dot(normal_direction))
+
+        tableaux = deepcopy(solution.tableaux)
+        result = ParametricResult()
+        theta = 0.0
+        while True:
+            (step, row) = self._primal_step(tableaux, change[1:])
+            end = float(min(theta + step, limit))
+            assignment = np.array(tableaux.extract_assignment()[:len(costs)]) + lower_bounds
+            slope = model.objective.type.value * change[0]
+            self._add_segment(result, ParametricSegment(theta, end, float(costs.dot(assignment)), float(slope), tableaux.basis.tolist(), assignment.tolist()))
+            if end >= limit:
+                return result
+
+            tableaux.table[:, -1] += step * change
+            theta = end
+            if tableaux.basis[row - 1] < 0:
+                # a redundant row can't have any other bound than 0
+                result.end = ParametricEnd.UNFEASIBLE
+                return result
+            if change[row] > 0:
+                # basic variable has reached its upper bound and leaves the basis there
+                tableaux.flip_basic(row)
+                change[row] = -change[row]
+            col = tableaux.choose_dual_entering_variable(row)
+            if col == None:
+                result.end = ParametricEnd.UNFEASIBLE
+                return result
+            self._pivot_column(tableaux, row, col, change)
+            result.pivots += 1
+
+    def analyse_objective(self, solution, direction, limit = np.inf):
+        if solution.presolve_stats != None:
+            raise Exception("Parametric cost analysis needs the tableaux of the whole model, solve it without the presolve")
+        model = solution.model
+        direction = self._direction(direction, len(model.variables), "variable")
+        lower_bounds = np.array(model.lower_bounds, dtype=float)
+        costs = np.array(model.objective.expression.factors(model), dtype=float)
+
+        # change of the cost row per unit of t, the normal model always maximizes and its cost row keeps the negated factors
+        tableaux = deepcopy(solution.tableaux)
+        cost_change = np.zeros(tableaux.table.shape[1])
+        cost_change[:len(direction)] = -model.objective.type.value * direction
+        change = tableaux.express_in_basis(cost_change)
+
+        result = ParametricResult()
+        theta = 0.0
+        while True:
+            (step, col) = self._dual_step(tableaux, change[:-1])
+            end = float(min(theta + step, limit))
+            assignment = np.array(tableaux.extract_assignment()[:len(costs)]) + lower_bounds
+            value = (costs + theta * direction).dot(assignment)
+            self._add_segment(result, ParametricSegment(theta, end, float(value), float(direction.dot(assignment)), tableaux.basis.tolist(), assignment.tolist()))
+            if end >= limit:
+                return result
+
+            tableaux.table[0] += step * change
+            theta = end
+            if tableaux.is_unbounded(col):
+                result.end = ParametricEnd.UNBOUNDED
+                return result
+            row = tableaux.choose_leaving_variable(col)
+            if row == None:
+                # entering variable only moves to its other bound
+                change[-1] -= change[col] * tableaux.upper_bounds[col]
+                change[col] = -change[col]
+                tableaux.flip(col)
+            else:
+                if tableaux.table[row, col] < 0:
+                    tableaux.flip_basic(row)
+                self._pivot_row(tableaux, row, col, change)
+            result.pivots += 1
+
+    def _add_segment(self, result, segment):
+        """
+            _add_segment(result: ParametricResult, segment: ParametricSegment):
+                adds the segment to the result, skipping the empty ones between the degenerate pivots
+        """
+        if len(result.segments) > 0 and segment.end <= segment.start:
+            return
+        result.segments.append(segment)
+
+    def _direction(self, direction, length, kind):
+        """
+            _direction(direction: Iterable[float], length: int, kind: str) -> numpy.Array:
+                returns the direction as a vector, checking it has a value for every constraint / variable
+        """
+        direction = np.array(direction, dtype=float)
+        if direction.shape != (length,):
+            raise Exception(f"Direction needs a value for every {kind}, expected {length} values, got {direction.size}")
+        return direction
+
+    def _primal_step(self, tableaux, change):
+        """
+            _primal_step(tableaux: Tableaux, change: numpy.Array) -> (float, int | None):
+                returns how far the basic values can move along the change staying between 0 and their bounds,
+                and the row (in the table) of the first blocking basic variable, the rows without a basic variable have to stay at 0
+        """
+        values = tableaux.table[1:, -1]
+        upper_bounds = np.where(tableaux.basis >= 0, tableaux.upper_bounds[tableaux.basis], 0.0)
+        steps = np.full(len(values), np.inf)
+        decreasing, increasing = change < -eps, change > eps
+        steps[decreasing] = values[decreasing] / -change[decreasing]
+        steps[increasing] = (upper_bounds[increasing] - values[increasing]) / change[increasing]
+        steps = np.maximum(steps, 0.0)
+        if len(steps) == 0:
+            return (np.inf, None)
+        row = steps.argmin()
+        return (steps[row], row + 1)
+
+    def _dual_step(self, tableaux, change):
+        """
+            _dual_step(tableaux: Tableaux, change: numpy.Array) -> (float, int | None):
+                returns how far the reduced costs can move along the change staying nonnegative,
+                and the column of the first reduced cost reaching zero
+        """
+        costs = tableaux.cost_factors()
+        steps = np.full(len(costs), np.inf)
+        decreasing = change < -eps
+        steps[decreasing] = np.maximum(costs[decreasing], 0.0) / -change[decreasing]
+        col = steps.argmin()
+        return (steps[col], col)
+
+    def _pivot_column(self, tableaux, row, col, column):
+        """
+            _pivot_column(tableaux: Tableaux, row: int, col: int, column: numpy.Array):
+                pivots the tableaux, transforming the extra column (e.g. the change of the right-hand side) the same way
+        """
+        factors = tableaux.table[:, col].copy()
+        pivoted = column[row] / factors[row]
+        column -= factors * pivoted
+        column[row] = pivoted
+        tableaux.pivot(row, col)
+
+    def _pivot_row(self, tableaux, row, col, cost_row):
+        """
+            _pivot_row(tableaux: Tableaux, row: int, col: int, cost_row: numpy.Array):
+                pivots the tableaux, expressing the extra cost row (e.g. the change of the costs) in the new basis
+        """
+        tableaux.pivot(row, col)
+        cost_row -= cost_row[col] * tableaux.table[row]
+
+    def interpret_results(self, solution, result, print_function = print):
+        print_function("* Parametric Analysis:")
+        print_function(f"-> The optimal value function has {len(result.segments)} linear pieces ({result.pivots} pivots):")
+        for segment in result.segments:
+            print_function(f"\t {segment}")
+        if result.end != ParametricEnd.LIMIT:
+            print_function(f"-> Beyond t = {result.segments[-1].end:.3f} the model is {result.end.value}")
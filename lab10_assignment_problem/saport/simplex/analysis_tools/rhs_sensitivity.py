@@ -0,0 +1,163 @@
+from ..expressions import constraint as co
+from ..sparse import SparseMatrix
+import numpy as np
+
+eps = 0.0000001
+
+
+class RHSSensitivityAnalyser:
+    """
+        A class used to analyse sensitivity to changes of the constraint bounds (right-hand sides).
+        Everything is read from the final tableaux: a column of the slack (or surplus) variable of a constraint
+        is the B^-1 column of its row, its cost is the shadow price of the row. Only the equality constraints
+        (without such a column) need their B^-1 columns solved from the basic columns of the normal model.
+
+
+        Attributes
+        ----------
+        name : str
+            unique name of the analysis tool
+
+        Methods
+        -------
+        analyse(solution: Solution) -> List[(float, float, float)]
+            analyses the solution and returns list of tuples containing the shadow price and the acceptable bounds of every constraint bound, i.e.
+            if the results contain tuple (2.0, 10.0, 20.0) at index 1, it means that the bound of the constraint at index 1 can have any value
+            >= 10.0 and <= 20.0 keeping the current basis optimal and every unit of the bound changes the objective value by 2.0,
+            a presolved solution gets the shadow prices of the dual postsolve with unknown (nan) ranges
+        accepts(solution: Solution) -> bool
+            returns False for a presolved solution without the postsolved duals
+
+        shadow_prices(solution: Solution) -> list[float]
+            returns only the shadow price of every constraint bound, i.e. how the objective value changes per unit of the bound
+            (a presolved solution has them already mapped back to the model by the dual postsolve)
+        normal_directions(solution: Solution) -> (numpy.Array, numpy.Array)
+            returns columns of B^-1 of every normal row (how the basic variables of the final tableaux change with its bound)
+            and the shadow prices of the normal rows (of the maximized normal model)
+        row_signs(model: Model) -> numpy.Array
+            returns 1.0 for every constraint kept as it is in the normal model and -1.0 for the negated ones
+
+        interpret_results(solution: Solution, results : List(float, float, float), print_function : Callable = print):
+            prints an interpretation of the given analysis results via given print function
+    """
+
+    @classmethod
+    def name(self):
+        return "Right-Hand Side Sensitivity Analysis"
+
+    def __init__(self):
+        self.name = RHSSensitivityAnalyser.name()
+
+    def accepts(self, solution):
+        return solution.presolve_stats == None or solution.duals != None
+
+    def analyse(self, solution):
+        if solution.presolve_stats != None:
+            # the tableaux belongs to the reduced model, only the shadow prices are mapped back to the model
+            return [(dual, np.nan, np.nan) for dual in self.shadow_prices(solution)]
+        model = solution.model
+        (directions, shadow_prices) = self.normal_directions(solution)
+        (decrease, increase) = self._ranges(solution.tableaux, directions)
+
+        signs = self.row_signs(model)
+        bounds = np.array([c.bound for c in model.constraints], dtype=float)
+        shadow_prices = model.objective.type.value * signs * shadow_prices
+        lower_bounds = bounds + np.where(signs > 0, decrease, -increase)
+        upper_bounds = bounds + np.where(signs > 0, increase, -decrease)
+        # adding 0.0 turns the -0.0 shadow prices into 0.0
+        return [(float(y) + 0.0, float(l), float(u)) for (y, l, u) in zip(shadow_prices, lower_bounds, upper_bounds)]
+
+    def shadow_prices(self, solution):
+        if solution.duals != None:
+            return list(solution.duals)
+        model = solution.model
+        (_, shadow_prices) = self.normal_directions(solution)
+        shadow_prices = model.objective.type.value * self.row_signs(model) * shadow_prices
+        return [float(y) + 0.0 for y in shadow_prices]
+
+    def normal_directions(self, solution):
+        model, normal_model, tableaux = solution.model, solution.normal_model, solution.tableaux
+        if solution.presolve_stats != None or len(normal_model.constraints) != len(model.constraints):
+            raise Exception("Right-hand side sensitivity needs the tableaux of the whole model, solve it without the presolve")
+
+        rows_n = len(model.constraints)
+        columns_n = len(normal_model.variables)
+        matrix = SparseMatrix.from_constraints(normal_model.constraints, columns_n).to_dense()
+
+        # the slack and surplus variables are the normal model columns after the model variables, each in its own row with factor +1 / -1
+        directions = np.zeros((rows_n, rows_n))
+        shadow_prices = np.zeros(rows_n)
+        has_column = np.zeros(rows_n, dtype=bool)
+        for col in range(len(model.variables), columns_n):
+            row = np.flatnonzero(matrix[:, col])[0]
+            factor = matrix[row, col]
+            directions[:, row] = factor * tableaux.table[1:, col]
+            shadow_prices[row] = factor * tableaux.table[0, col]
+            has_column[row] = True
+
+        equalities = np.flatnonzero(~has_column)
+        if len(equalities) > 0:
+            directions[:, equalities] = self._basis_inverse_columns(matrix, tableaux, equalities)
+            # costs of the basic variables in the tableaux (flipped ones are represented by u - x)
+            factors = np.array(normal_model.objective.expression.factors(normal_model))
+            basic_costs = np.where(tableaux.basis >= 0, factors[tableaux.basis] * np.where(tableaux.flipped[tableaux.basis], -1, 1), 0.0)
+            shadow_prices[equalities] = basic_costs.dot(directions[:, equalities])
+        return (directions, shadow_prices)
+
+    def row_signs(self, model):
+        # normal rows are the model rows moved to "<=" (">=" rows negated) and negated once more if their shifted bound was negative
+        rows_n = len(model.constraints)
+        bounds = np.array([c.bound for c in model.constraints], dtype=float)
+        types = co.ConstraintType.codes([c.type for c in model.constraints], rows_n)
+        shift = SparseMatrix.from_constraints(model.constraints, len(model.variables)).dot(np.array(model.lower_bounds, dtype=float))
+        standard_signs = np.where(types == co.ConstraintType.GE.value, -1.0, 1.0)
+        return standard_signs * np.where(standard_signs * (bounds - shift) < 0, -1.0, 1.0)
+
+    def _basis_inverse_columns(self, matrix, tableaux, rows):
+        """
+            _basis_inverse_columns(matrix: numpy.Array, tableaux: Tableaux, rows: numpy.Array) -> numpy.Array:
+                returns columns of B^-1 of the given rows, B built of the basic columns of the normal model
+                (negated for the flipped variables, the same way the tableaux represents them)
+        """
+        basis = tableaux.basis
+        complete = basis >= 0
+        basic_columns = np.zeros((matrix.shape[0], len(basis)))
+        basic_columns[:, complete] = matrix[:, basis[complete]] * np.where(tableaux.flipped[basis[complete]], -1, 1)
+        units = np.eye(matrix.shape[0])[:, rows]
+        if complete.all():
+            return np.linalg.solve(basic_columns, units)
+
+        # a redundant row has no basic variable, changing only its bound makes the model unfeasible
+        columns = np.zeros((len(basis), len(rows)))
+        (solved, _, _, _) = np.linalg.lstsq(basic_columns[:, complete], units, rcond=None)
+        columns[complete] = solved
+        unreachable = np.abs(basic_columns.dot(columns) - units).max(axis=0) > eps
+        columns[~complete] = np.where(unreachable, 1.0, 0.0)
+        return columns
+
+    def _ranges(self, tableaux, directions):
+        """
+            _ranges(tableaux: Tableaux, directions: numpy.Array) -> (numpy.Array, numpy.Array):
+                returns how much the bound of every normal row can decrease (<= 0) and increase (>= 0)
+                keeping every basic variable between 0 and its upper bound, the rows without a basic variable have to stay at 0
+        """
+        values = tableaux.table[1:, -1][:, np.newaxis]
+        upper_bounds = np.where(tableaux.basis >= 0, tableaux.upper_bounds[tableaux.basis], 0.0)[:, np.newaxis]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # values + delta * direction has to stay in [0, upper bound] for every basic variable
+            to_zero = -values / directions
+            to_upper = (upper_bounds - values) / directions
+        positive, negative = directions > eps, directions < -eps
+        lower_steps = np.where(positive, to_zero, np.where(negative, to_upper, -np.inf))
+        upper_steps = np.where(positive, to_upper, np.where(negative, to_zero, np.inf))
+        decrease = np.minimum(lower_steps.max(axis=0, initial=-np.inf), 0.0)
+        increase = np.maximum(upper_steps.min(axis=0, initial=np.inf), 0.0)
+        return (decrease, increase)
+
+    def interpret_results(self, solution, rhs_ranges, print_function):
+        print_function("* Right-Hand Side Sensitivity Analysis:")
+        print_function("-> Shadow prices and the ranges, in which the constraint bounds keep the current basis optimal:")
+        col_width = max([max(len(f'{r[1]:.3f}'), len(f'{r[2]:.3f}')) for r in rhs_ranges], default=0)
+        for (i, r) in enumerate(rhs_ranges):
+            bounds = f"{r[1]:{col_width}.3f} <= b{i} <= {r[2]:{col_width}.3f}" if not np.isnan(r[1]) else f"b{i} in unknown range (presolved)"
+            print_function(f"\t {bounds}, shadow price: {r[0]:.3f} (originally: {solution.model.constraints[i].bound:.3f})")
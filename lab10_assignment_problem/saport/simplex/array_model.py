@@ -0,0 +1,316 @@
+from . import model as m
+from . import solverfactory as sf
+from .sparse import SparseMatrix
+from .expressions import atom as a
+from .expressions import constraint as co
+from .expressions import expression as ex
+from .expressions import objective as ob
+from .expressions import variable as va
+import numpy as np
+
+
+class _GrowingArray:
+    """
+        A numpy vector with amortized O(1) appends, the stored values are data[:size].
+    """
+
+    def __init__(self, dtype):
+        self.data = np.zeros(16, dtype=dtype)
+        self.size = 0
+
+    def append(self, value):
+        self.extend([value])
+
+    def extend(self, values):
+        values = np.asarray(values, dtype=self.data.dtype)
+        end = self.size + len(values)
+        if end > len(self.data):
+            data = np.zeros(max(end, 2 * len(self.data)), dtype=self.data.dtype)
+            data[:self.size] = self.data[:self.size]
+            self.data = data
+        self.data[self.size:end] = values
+        self.size = end
+
+    def view(self):
+        return self.data[:self.size]
+
+
+class ArrayModel:
+    """
+        A class to represent a linear programming problem stored in numpy arrays instead of the expression objects.
+        Every factor of the constraints is kept as a (row, column, value) triplet, the objective as a dense vector,
+        the constraint bounds, types and the variable bounds as vectors. The operator DSL works the same way as for the Model,
+        but the added constraints and objectives are only read once and written into the arrays.
+
+        Attributes
+        ----------
+        name : str
+            name of the problem
+        variables : list[Variable]
+            list with the problem variable, variable with index 'i' is always stored at the variables[i]
+        rows : numpy.Array
+            constraint (row) index of every stored factor
+        columns : numpy.Array
+            variable (column) index of every stored factor
+        values : numpy.Array
+            value of every stored factor, factors repeated at the same position are summed up
+        bounds : numpy.Array
+            right-hand side of every constraint
+        types : numpy.Array
+            type of every constraint, as the ConstraintType values (-1 = "<=", 0 = "=", 1 = ">=")
+        objective_factors : numpy.Array
+            factor of every variable in the objective
+        objective_type : ObjectiveType | None
+            type of the objective, None if it hasn't been set yet
+        objective : Objective | None
+            objective built from the objective factors (on every access)
+        lower_bounds : numpy.Array
+            lower bound of every variable (0.0 by default)
+        upper_bounds : numpy.Array
+            upper bound of every variable (inf by default)
+
+        Methods
+        -------
+        __init__(name: str) -> ArrayModel:
+            constructs new model with a specified name
+        from_model(model: Model) -> ArrayModel:
+            returns the array version of the model (the variables are shared)
+        create_variable(name: str) -> Variable
+            returns a new variable with a specified named, the variable is automatically indexed and added to the variables list
+        create_variables(n: int, prefix: str) -> list[Variable]
+            returns n new variables named prefix0, prefix1, ...
+        create_named_variables(names: Iterable[str]) -> list[Variable]
+            returns a new variable for every name, the arrays are extended once for all of them
+        set_lower_bound(variable: Variable, bound: float)
+            sets a finite lower bound of the variable
+        set_upper_bound(variable: Variable, bound: float)
+            sets an upper bound of the variable
+        has_bounds() -> bool
+            checks whether any variable has a bound other than the default 0 <= x < inf
+        add_constraint(constraint: Constraint) -> int
+            writes the constraint into the arrays, returns its row index
+        add_row(columns: Iterable[int], factors: Iterable[float], type: ConstraintType, bound: float) -> int
+            adds a constraint given directly by the variable indexes and factors, returns its row index
+        add_constraints_from_arrays(factors: numpy.Array | SparseMatrix, bounds: Iterable[float] | float, types: ConstraintType | Iterable[ConstraintType | int], variables: list[Variable] = None) -> range
+            adds a constraint for every row of the factors matrix the same way as Model.add_constraints_from_arrays,
+            the nonzeros are copied into the arrays at once, returns the row indexes of the new constraints
+        maximize(expression: Expression)
+            sets objective to maximize the specified Expression
+        minimize(expression: Expression)
+            sets objective to minimize the specified Expression
+        set_objective(factors: Iterable[float], type: ObjectiveType)
+            sets objective given directly by the factors of all the variables
+        constraint(row: int) -> Constraint
+            returns the constraint stored in the given row
+        matrix() -> SparseMatrix
+            returns the constraints matrix
+        to_model() -> Model
+            returns the equivalent Model built of the expression objects (the variables are shared)
+        solve(engine: Engine = Engine.SPARSE, pricing: Pricing = Pricing.DANTZIG, presolve: bool = False, cache: SolutionCache = None, hook: SolverHook = None, retention: Retention = Retention.INITIAL_AND_FINAL, strategy: Strategy = Strategy.PRIMAL) -> Solution
+            solves the model, the sparse engine reads the arrays directly (unless presolve is used),
+            the other engines solve the equivalent Model, with cache the solution of an identical model solved before is reused,
+            the hook is notified about the solver progress, retention decides which tableaux the solution keeps,
+            strategy other than the primal one is left to the equivalent Model (see Model.solve)
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.variables = []
+        self.objective_type = None
+        self._names = set()
+        self._rows = _GrowingArray(int)
+        self._columns = _GrowingArray(int)
+        self._values = _GrowingArray(float)
+        self._bounds = _GrowingArray(float)
+        self._types = _GrowingArray(int)
+        self._objective_factors = _GrowingArray(float)
+        self._lower_bounds = _GrowingArray(float)
+        self._upper_bounds = _GrowingArray(float)
+
+    @staticmethod
+    def from_model(model):
+        array_model = ArrayModel(model.name)
+        for var in model.variables:
+            array_model._add_variable(var)
+        array_model._lower_bounds.extend(model.lower_bounds)
+        array_model._upper_bounds.extend(model.upper_bounds)
+        for constraint in model.constraints:
+            array_model.add_constraint(constraint)
+        if model.objective != None:
+            array_model._set_objective_expression(model.objective.expression, model.objective.type)
+        return array_model
+
+    @property
+    def rows(self):
+        return self._rows.view()
+
+    @property
+    def columns(self):
+        return self._columns.view()
+
+    @property
+    def values(self):
+        return self._values.view()
+
+    @property
+    def bounds(self):
+        return self._bounds.view()
+
+    @property
+    def types(self):
+        return self._types.view()
+
+    @property
+    def objective_factors(self):
+        return self._objective_factors.view()
+
+    @property
+    def lower_bounds(self):
+        return self._lower_bounds.view()
+
+    @property
+    def upper_bounds(self):
+        return self._upper_bounds.view()
+
+    @property
+    def objective(self):
+        if self.objective_type == None:
+            return None
+        columns = np.flatnonzero(self.objective_factors)
+        return ob.Objective(self._expression(columns, self.objective_factors[columns]), self.objective_type)
+
+    def create_variable(self, name):
+        if name in self._names:
+            raise Exception(f"There is already a variable named {name}")
+
+        variable = va.Variable(name, len(self.variables))
+        self._add_variable(variable)
+        self._lower_bounds.append(0.0)
+        self._upper_bounds.append(float('inf'))
+        return variable
+
+    def create_variables(self, n, prefix):
+        return self.create_named_variables([f"{prefix}{i}" for i in range(n)])
+
+    def create_named_variables(self, names):
+        names = list(names)
+        if len(set(names)) != len(names):
+            raise Exception("Names of the new variables have to be unique")
+        for name in names:
+            if name in self._names:
+                raise Exception(f"There is already a variable named {name}")
+
+        n = len(names)
+        variables = [va.Variable(name, len(self.variables) + i) for (i, name) in enumerate(names)]
+        self.variables += variables
+        self._names.update(names)
+        self._objective_factors.extend(np.zeros(n))
+        self._lower_bounds.extend(np.zeros(n))
+        self._upper_bounds.extend(np.full(n, np.inf))
+        return variables
+
+    def _add_variable(self, variable):
+        self.variables.append(variable)
+        self._names.add(variable.name)
+        self._objective_factors.append(0.0)
+
+    def set_lower_bound(self, variable, bound):
+        if bound == float('-inf'):
+            raise Exception("Model doesn't support free variables, lower bound has to be finite")
+        self.lower_bounds[variable.index] = bound
+
+    def set_upper_bound(self, variable, bound):
+        self.upper_bounds[variable.index] = bound
+
+    def has_bounds(self):
+        return bool((self.lower_bounds != 0.0).any() or (self.upper_bounds != np.inf).any())
+
+    def add_constraint(self, constraint):
+        atoms = constraint.expression.atoms
+        return self.add_row([atom.var.index for atom in atoms], [atom.factor for atom in atoms], constraint.type, constraint.bound)
+
+    def add_row(self, columns, factors, type, bound):
+        row = self._bounds.size
+        columns = np.asarray(columns, dtype=int)
+        self._rows.extend(np.full(len(columns), row))
+        self._columns.extend(columns)
+        self._values.extend(factors)
+        self._bounds.append(bound)
+        self._types.append(type.value)
+        return row
+
+    def add_constraints_from_arrays(self, factors, bounds, types, variables = None):
+        variables = self.variables if variables == None else list(variables)
+        matrix = SparseMatrix.from_matrix(factors)
+        if matrix.shape[1] != len(variables):
+            raise Exception(f"Factors matrix has {matrix.shape[1]} columns, but there are {len(variables)} variables")
+        rows_n = matrix.shape[0]
+        first = self._bounds.size
+
+        (rows, cols, values) = matrix.triplets()
+        indexes = np.array([var.index for var in variables], dtype=int)
+        self._rows.extend(first + rows)
+        self._columns.extend(indexes[cols])
+        self._values.extend(values)
+        self._bounds.extend(np.broadcast_to(np.asarray(bounds, dtype=float), (rows_n,)))
+        self._types.extend(co.ConstraintType.codes(types, rows_n))
+        return range(first, first + rows_n)
+
+    def maximize(self, expression):
+        self._set_objective_expression(expression, ob.ObjectiveType.MAX)
+
+    def minimize(self, expression):
+        self._set_objective_expression(expression, ob.ObjectiveType.MIN)
+
+    def set_objective(self, factors, type):
+        factors = np.asarray(factors, dtype=float)
+        if len(factors) != len(self.variables):
+            raise Exception(f"Objective needs a factor for every variable, got {len(factors)} factors for {len(self.variables)} variables")
+        self.objective_factors[:] = factors
+        self.objective_type = type
+
+    def _set_objective_expression(self, expression, type):
+        factors = np.zeros(len(self.variables))
+        np.add.at(factors, [atom.var.index for atom in expression.atoms], [atom.factor for atom in expression.atoms])
+        self.set_objective(factors, type)
+
+    def constraint(self, row):
+        stored = np.flatnonzero(self.rows == row)
+        expression = self._expression(self.columns[stored], self.values[stored])
+        return co.Constraint(expression, float(self.bounds[row]), co.ConstraintType(int(self.types[row])))
+
+    def matrix(self):
+        return SparseMatrix.from_triplets(self.rows, self.columns, self.values, (self._bounds.size, len(self.variables)))
+
+    def to_model(self):
+        model = m.Model(self.name)
+        model.variables = list(self.variables)
+        model.lower_bounds = self.lower_bounds.tolist()
+        model.upper_bounds = self.upper_bounds.tolist()
+        model.add_constraints_from_arrays(self.matrix(), self.bounds, self.types)
+        model.objective = self.objective
+        return model
+
+    def _expression(self, columns, factors):
+        return ex.Expression(*[a.Atom(self.variables[col], factor) for (col, factor) in zip(columns.tolist(), factors.tolist())])
+
+    def solve(self, engine = sf.Engine.SPARSE, pricing = sf.Pricing.DANTZIG, presolve = False, cache = None, hook = None, retention = sf.Retention.INITIAL_AND_FINAL, strategy = sf.Strategy.PRIMAL):
+        if len(self.variables) == 0:
+            raise Exception("Can't solve a model without any variables")
+
+        if self.objective_type == None:
+            raise Exception("Can't solve a model without an objective")
+
+        if sf.Strategy(strategy) != sf.Strategy.PRIMAL:
+            return self.to_model().solve(engine, pricing, presolve, cache, hook, retention, strategy)
+
+        if cache != None:
+            return cache.solve(self, engine, pricing, presolve, hook, retention)
+
+        solver = sf.SolverFactory.solver(engine, pricing, presolve, hook, retention)
+        if engine == sf.Engine.SPARSE and not presolve:
+            return solver.solve_arrays(self)
+        return solver.solve(self.to_model())
+
+    def __str__(self):
+        return str(self.to_model())
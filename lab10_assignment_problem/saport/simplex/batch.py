@@ -0,0 +1,279 @@
+from . import solver as s
+from . import tableaux as t
+from . import pricing as p
+from . import history as hi
+from .sparse import SparseMatrix
+from .expressions import constraint as co
+from .expressions import expression as ex
+from .expressions import objective as ob
+import numpy as np
+
+eps = s.eps
+
+
+def solve_batch(model, rhs_list = None, cost_list = None, pricing = p.Pricing.DANTZIG):
+    """
+        solve_batch(model: Model, rhs_list: Iterable[Iterable[float]] | None = None, cost_list: Iterable[Iterable[float]] | None = None, pricing: Pricing = Pricing.DANTZIG) -> BatchSolution:
+            solves the model for every scenario, i.e. every right-hand side (bounds of the constraints in their order) and / or objective
+            (factors of all the model variables), when both lists are given the scenario i uses rhs_list[i] and cost_list[i],
+            see BatchSolver for the details
+    """
+    return BatchSolver(pricing).solve(model, rhs_list, cost_list)
+
+
+class BatchSolution:
+    """
+        A class to represent solutions of all the scenarios of a batch, stacked in numpy arrays (one row per scenario).
+
+        Attributes
+        ----------
+        assignments : numpy.Array
+            value of every variable in every scenario (rows of NaN for the unfeasible and unbounded scenarios)
+        objective_values : numpy.Array
+            objective value of every scenario (NaN if there is no optimal solution)
+        is_feasible : numpy.Array
+            whether the scenario is feasible
+        is_bounded : numpy.Array
+            whether the scenario is bounded
+        iterations : numpy.Array
+            number of pivots needed by the scenario (0 if the basis of the previous scenario has been optimal right away)
+        warm_started : numpy.Array
+            whether the scenario has been solved from the basis of another one, instead of from scratch
+
+        Methods
+        -------
+        __init__(scenarios_n: int, variables_n: int) -> BatchSolution:
+            constructs a batch of scenarios without any solution yet
+        __len__() -> int:
+            returns number of the scenarios
+    """
+
+    def __init__(self, scenarios_n, variables_n):
+        self.assignments = np.full((scenarios_n, variables_n), np.nan)
+        self.objective_values = np.full(scenarios_n, np.nan)
+        self.is_feasible = np.ones(scenarios_n, dtype=bool)
+        self.is_bounded = np.ones(scenarios_n, dtype=bool)
+        self.iterations = np.zeros(scenarios_n, dtype=int)
+        self.warm_started = np.zeros(scenarios_n, dtype=bool)
+
+    def __len__(self):
+        return len(self.objective_values)
+
+
+class BatchSolver:
+    """
+        A class to solve many scenarios of one model, differing only in the right-hand sides and / or objectives.
+        The model is normalized once, with the first scenario solved from scratch. Every later scenario starts
+        from the last optimal basis: the new basic values (B^-1 b) and reduced costs of all the remaining scenarios
+        are computed at once, the scenarios that are both primal and dual feasible are already optimal (no pivots at all),
+        the others are re-optimized one by one with the primal simplex (if the basis is still feasible),
+        the dual simplex (if it's still optimal) or solved from scratch otherwise. Only the tableaux engine is used,
+        because the warm start needs the tableaux.
+
+        Attributes
+        ----------
+        solver : Solver
+            tableaux solver used for the cold solves and the re-optimization
+
+        Methods
+        -------
+        __init__(pricing: Pricing = Pricing.DANTZIG) -> BatchSolver:
+            constructs a new batch solver using the given pricing rule
+        solve(model: Model, rhs_list: Iterable[Iterable[float]] | None = None, cost_list: Iterable[Iterable[float]] | None = None) -> BatchSolution:
+            solves all the scenarios of the model, at least one of the lists has to be given
+    """
+
+    def __init__(self, pricing = p.Pricing.DANTZIG):
+        self.solver = s.Solver(pricing, retention = hi.Retention.FINAL)
+
+    def solve(self, model, rhs_list = None, cost_list = None):
+        (rhs, costs) = self._scenarios(model, rhs_list, cost_list)
+        self.model = model
+        self.lower_bounds = np.array(model.lower_bounds, dtype=float)
+        self.types = co.ConstraintType.codes([c.type for c in model.constraints], len(model.constraints))
+        # A * l, every scenario shifts its bounds by the lower bounds the same way
+        self.shift = SparseMatrix.from_constraints(model.constraints, len(model.variables)).dot(self.lower_bounds)
+
+        batch = BatchSolution(len(rhs), len(model.variables))
+        pending = list(range(len(rhs)))
+        self.tableaux = None
+        while len(pending) > 0:
+            if self.tableaux != None:
+                # every scenario that is optimal in the current basis is finished right away
+                optimal = self._finish_optimal(batch, pending, rhs, costs)
+                pending = [i for (i, finished) in zip(pending, optimal) if not finished]
+                if len(pending) == 0:
+                    break
+
+            scenario = pending.pop(0)
+            if self.tableaux == None or not self._warm_start(batch, scenario, rhs[scenario], costs[scenario]):
+                self._cold_solve(batch, scenario, rhs[scenario], costs[scenario])
+
+        solved = batch.is_feasible & batch.is_bounded
+        batch.objective_values[solved] = (batch.assignments[solved] * costs[solved]).sum(axis=1)
+        return batch
+
+    def _scenarios(self, model, rhs_list, cost_list):
+        """
+            _scenarios(model: Model, rhs_list: Iterable[Iterable[float]] | None, cost_list: Iterable[Iterable[float]] | None) -> (numpy.Array, numpy.Array):
+                returns the right-hand sides and objective factors of all the scenarios, one row per scenario
+        """
+        if rhs_list is None and cost_list is None:
+            raise Exception("Batch needs at least one list of the right-hand sides or objectives")
+        if model.objective == None:
+            raise Exception("Can't solve a model without an objective")
+
+        rows_n, columns_n = len(model.constraints), len(model.variables)
+        rhs = None if rhs_list is None else np.array(rhs_list, dtype=float).reshape(-1, rows_n)
+        costs = None if cost_list is None else np.array(cost_list, dtype=float).reshape(-1, columns_n)
+        if rhs is not None and costs is not None and len(rhs) != len(costs):
+            raise Exception(f"Every scenario needs both the right-hand side and the objective, got {len(rhs)} right-hand sides and {len(costs)} objectives")
+
+        scenarios_n = len(rhs) if rhs is not None else len(costs)
+        if rhs is None:
+            rhs = np.tile([c.bound for c in model.constraints], (scenarios_n, 1)).reshape(scenarios_n, rows_n)
+        if costs is None:
+            costs = np.tile(model.objective.expression.factors(model), (scenarios_n, 1)).reshape(scenarios_n, columns_n)
+        return (rhs, costs)
+
+    def _scenario_model(self, rhs, costs):
+        """
+            _scenario_model(rhs: numpy.Array, costs: numpy.Array) -> Model:
+                returns a copy of the model with the bounds and the objective of the scenario
+        """
+        model = self.model.copy()
+        model.constraints = [co.Constraint(c.expression, bound, c.type) for (c, bound) in zip(model.constraints, rhs.tolist())]
+        model.objective = ob.Objective(ex.Expression.from_vectors(model.variables, costs.tolist()), model.objective.type)
+        return model
+
+    def _cold_solve(self, batch, scenario, rhs, costs):
+        """
+            _cold_solve(batch: BatchSolution, scenario: int, rhs: numpy.Array, costs: numpy.Array):
+                solves the scenario from scratch, its optimal tableaux becomes the start of the next scenarios
+        """
+        solution = self.solver.solve(self._scenario_model(rhs, costs))
+        batch.iterations[scenario] = solution.iterations
+        self._store(batch, scenario, solution.is_feasible, solution.is_bounded, solution.assignment)
+        if solution.assignment == None:
+            return
+
+        self.tableaux = solution.tableaux
+        self.normal_model = solution.normal_model
+        # crossed variable bounds add rows and redundant rows leave no basic variable, such tableaux can't be reused
+        if len(self.normal_model.constraints) != len(self.model.constraints) or (self.tableaux.basis < 0).any():
+            self.tableaux = None
+            return
+
+        # rows of the normal model are the model rows translated to "<=" (">=" rows negated) and negated once more if their shifted bound was negative
+        standard_signs = np.where(self.types == co.ConstraintType.GE.value, -1.0, 1.0)
+        shifted = standard_signs * (rhs - self.shift)
+        self.row_signs = standard_signs * np.where(shifted < 0, -1.0, 1.0)
+        self.matrix = SparseMatrix.from_constraints(self.normal_model.constraints, len(self.normal_model.variables)).to_dense()
+
+    def _basic_values(self, rhs):
+        """
+            _basic_values(rhs: numpy.Array) -> numpy.Array:
+                returns values of the basic variables of the current tableaux for every right-hand side (one row per scenario)
+        """
+        tableaux = self.tableaux
+        normal_rhs = self.row_signs * (rhs - self.shift)
+        # nonbasic variables flipped to their upper bounds are moved to the right-hand side
+        at_upper = tableaux.flipped.copy()
+        at_upper[tableaux.basis] = False
+        normal_rhs = normal_rhs - self.matrix[:, at_upper].dot(tableaux.upper_bounds[at_upper])
+        return np.linalg.solve(self.matrix[:, tableaux.basis], normal_rhs.T).T
+
+    def _cost_rows(self, costs, reduced = True):
+        """
+            _cost_rows(costs: numpy.Array, reduced: bool = True) -> numpy.Array:
+                returns the cost row of the current tableaux for every objective (one row per scenario),
+                expressed in the basis the same way Tableaux.express_in_basis does unless reduced is False
+        """
+        tableaux = self.tableaux
+        rows = np.zeros((len(costs), tableaux.table.shape[1]))
+        # the normal model always maximizes and the cost row keeps the negated factors
+        rows[:, :costs.shape[1]] = -self.model.objective.type.value * costs
+        rows[:, -1] -= rows[:, :-1][:, tableaux.flipped].dot(tableaux.upper_bounds[tableaux.flipped])
+        rows[:, :-1][:, tableaux.flipped] *= -1
+        return rows - rows[:, tableaux.basis].dot(tableaux.table[1:]) if reduced else rows
+
+    def _feasibility(self, rhs, costs):
+        """
+            _feasibility(rhs: numpy.Array, costs: numpy.Array) -> (numpy.Array, numpy.Array, numpy.Array, numpy.Array):
+                returns the basic values and the cost rows of the scenarios in the current basis,
+                with the flags telling which scenarios are primal and which are dual feasible
+        """
+        basic_values = self._basic_values(rhs)
+        cost_rows = self._cost_rows(costs)
+        basic_bounds = self.tableaux.upper_bounds[self.tableaux.basis]
+        primal_feasible = ((basic_values >= -eps) & (basic_values <= basic_bounds + eps)).all(axis=1)
+        dual_feasible = (cost_rows[:, :-1] >= -eps).all(axis=1)
+        return (basic_values, cost_rows, primal_feasible, dual_feasible)
+
+    def _finish_optimal(self, batch, pending, rhs, costs):
+        """
+            _finish_optimal(batch: BatchSolution, pending: list[int], rhs: numpy.Array, costs: numpy.Array) -> numpy.Array:
+                stores the solution of every pending scenario that is optimal in the current basis, returns which ones they were
+        """
+        (basic_values, _, primal_feasible, dual_feasible) = self._feasibility(rhs[pending], costs[pending])
+        optimal = primal_feasible & dual_feasible
+        if optimal.any():
+            tableaux = self.tableaux
+            columns = np.zeros((optimal.sum(), tableaux.table.shape[1] - 1))
+            at_upper = tableaux.flipped.copy()
+            at_upper[tableaux.basis] = False
+            columns[:, at_upper] = tableaux.upper_bounds[at_upper]
+            columns[:, tableaux.basis] = basic_values[optimal]
+            scenarios = np.array(pending)[optimal]
+            batch.assignments[scenarios] = columns[:, :len(self.model.variables)] + self.lower_bounds
+            batch.warm_started[scenarios] = True
+        return optimal
+
+    def _warm_start(self, batch, scenario, rhs, costs):
+        """
+            _warm_start(batch: BatchSolution, scenario: int, rhs: numpy.Array, costs: numpy.Array) -> bool:
+                re-optimizes the scenario from the current tableaux with the primal or the dual simplex,
+                returns False if the basis is neither primal nor dual feasible for it
+        """
+        (basic_values, cost_rows, primal_feasible, dual_feasible) = self._feasibility(rhs[np.newaxis], costs[np.newaxis])
+        basic_costs = self._cost_rows(costs[np.newaxis], reduced = False)[:, self.tableaux.basis]
+        if not primal_feasible[0] and not dual_feasible[0]:
+            return False
+
+        tableaux = self.tableaux
+        basis = tableaux.basis
+        table = tableaux.table.copy()
+        # flipped basic variables are represented by their distance from the upper bound
+        flipped_basic = tableaux.flipped[basis]
+        table[1:, -1] = np.where(flipped_basic, tableaux.upper_bounds[basis] - basic_values[0], basic_values[0])
+        # the objective value of the cost row has been computed for the old right-hand side
+        table[0] = cost_rows[0]
+        table[0, -1] -= basic_costs[0].dot(table[1:, -1] - tableaux.table[1:, -1])
+        warm_tableaux = t.Tableaux(self.normal_model, table, basis, tableaux.upper_bounds, tableaux.flipped)
+
+        self.solver._start_solve()
+        if primal_feasible[0]:
+            bounded = self.solver._optimize(warm_tableaux)
+            (feasible, optimal) = (True, bounded)
+        else:
+            feasible = self.solver._dual_optimize(warm_tableaux)
+            (bounded, optimal) = (True, feasible)
+
+        batch.iterations[scenario] = self.solver.iterations
+        batch.warm_started[scenario] = True
+        assignment = None
+        if optimal:
+            assignment = (np.array(warm_tableaux.extract_assignment()[:len(self.model.variables)]) + self.lower_bounds).tolist()
+            self.tableaux = warm_tableaux
+        self._store(batch, scenario, feasible, bounded, assignment)
+        return True
+
+    def _store(self, batch, scenario, feasible, bounded, assignment):
+        """
+            _store(batch: BatchSolution, scenario: int, feasible: bool, bounded: bool, assignment: list[float] | None):
+                stores the result of the scenario in the batch
+        """
+        batch.is_feasible[scenario] = feasible
+        batch.is_bounded[scenario] = bounded
+        if assignment != None:
+            batch.assignments[scenario] = assignment
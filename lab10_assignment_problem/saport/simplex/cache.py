@@ -0,0 +1,129 @@
+import copy
+import hashlib
+from collections import OrderedDict
+
+from . import solverfactory as sf
+from .expressions import constraint as c
+import numpy as np
+
+
+def canonical_form(model):
+    """
+        canonical_form(model: Model | ArrayModel) -> tuple[numpy.Array, ...]:
+            returns arrays describing the model in the standard form (max objective, "<=" and "=" constraints), ignoring names of the variables:
+            number of variables, objective factors, lower bounds, upper bounds, then row, column and value of every nonzero factor
+            (ordered by rows and columns), the constraint bounds and types; two models are equivalent if all the arrays are equal
+    """
+    if hasattr(model, "matrix"):
+        (rows, cols, values) = model.matrix().triplets()
+        bounds = np.array(model.bounds, dtype=float)
+        types = np.array(model.types, dtype=int)
+        objective = model.objective_type.value * np.asarray(model.objective_factors, dtype=float)
+    else:
+        rows, cols, values = [], [], []
+        for (i, constraint) in enumerate(model.constraints):
+            for atom in constraint.expression.simplify().atoms:
+                rows.append(i)
+                cols.append(atom.var.index)
+                values.append(atom.factor)
+        bounds = np.array([constraint.bound for constraint in model.constraints], dtype=float)
+        types = np.array([constraint.type.value for constraint in model.constraints], dtype=int)
+        objective = model.objective.type.value * np.array(model.objective.expression.factors(model), dtype=float)
+
+    (rows, cols, values) = (np.asarray(rows, dtype=int), np.asarray(cols, dtype=int), np.asarray(values, dtype=float))
+    order = np.lexsort((cols, rows))
+    nonzero = values[order] != 0
+    (rows, cols, values) = (rows[order][nonzero], cols[order][nonzero], values[order][nonzero])
+
+    # ">=" rows are inverted, the same way as in translate_to_standard_form
+    signs = np.where(types == c.ConstraintType.GE.value, -1.0, 1.0)
+    types = np.where(types == c.ConstraintType.GE.value, c.ConstraintType.LE.value, types)
+    # adding 0.0 turns -0.0 into 0.0
+    return (
+        np.array([len(model.variables)]),
+        objective + 0.0,
+        np.array(model.lower_bounds, dtype=float),
+        np.array(model.upper_bounds, dtype=float),
+        rows,
+        cols,
+        signs[rows] * values + 0.0,
+        signs * bounds + 0.0,
+        types
+    )
+
+
+def fingerprint(model):
+    """
+        fingerprint(model: Model | ArrayModel) -> str:
+            returns hash of the canonical form of the model, models differing only in the names of the variables have the same fingerprint
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    for array in canonical_form(model):
+        digest.update(str(array.shape).encode())
+        digest.update(np.ascontiguousarray(array).tobytes())
+    return digest.hexdigest()
+
+
+class SolutionCache:
+    """
+        A class to represent a bounded in-process cache of the simplex solutions.
+        Solutions are indexed by the fingerprint of the model and the solver options, so identical models
+        (even with differently named variables) are solved only once. When the cache is full,
+        the least recently used solution is dropped.
+
+        Attributes
+        ----------
+        max_size : int
+            maximal number of the cached solutions
+        hits : int
+            how many solutions have been found in the cache
+        misses : int
+            how many models had to be solved
+
+        Methods
+        -------
+        __init__(max_size: int = 128) -> SolutionCache:
+            constructs an empty cache keeping at most max_size solutions
+        solve(model: Model | ArrayModel, engine: Engine = Engine.TABLEAUX, pricing: Pricing = Pricing.DANTZIG, presolve: bool = False, hook: SolverHook = None, retention: Retention = Retention.INITIAL_AND_FINAL) -> Solution:
+            returns solution of the model, solving it only if an identical model hasn't been solved with the same options,
+            the returned solution is a copy belonging to the given model, the hook is notified only when the model is solved
+        clear():
+            removes all the cached solutions and resets the counters
+        __len__() -> int:
+            returns number of the cached solutions
+    """
+
+    def __init__(self, max_size = 128):
+        if max_size < 1:
+            raise Exception("Solution cache has to keep at least one solution")
+        self.max_size = max_size
+        self.clear()
+
+    def solve(self, model, engine = sf.Engine.TABLEAUX, pricing = sf.Pricing.DANTZIG, presolve = False, hook = None, retention = sf.Retention.INITIAL_AND_FINAL):
+        key = (fingerprint(model), engine, pricing, presolve, retention)
+        solution = self.solutions.get(key)
+        if solution == None:
+            self.misses += 1
+            solution = model.solve(engine, pricing, presolve, hook = hook, retention = retention)
+            self.solutions[key] = solution
+            if len(self.solutions) > self.max_size:
+                self.solutions.popitem(last=False)
+        else:
+            self.hits += 1
+            self.solutions.move_to_end(key)
+        return self._copy(solution, model)
+
+    def _copy(self, solution, model):
+        copied = copy.copy(solution)
+        # Model.solve keeps a copy of the solved model in the solution, the array models are kept as they are
+        copied.model = model.copy() if hasattr(model, "copy") else model
+        copied.assignment = None if solution.assignment == None else list(solution.assignment)
+        return copied
+
+    def clear(self):
+        self.solutions = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.solutions)
@@ -0,0 +1,79 @@
+from . import atom as a
+from . import expression as e
+
+
+class ExpressionBuilder:
+    """
+        A class to build a linear expression term by term in linear time.
+        Expression.__add__ copies all the atoms into a new expression, so summing k terms one by one costs O(k^2).
+        The builder keeps one factor per variable in a dictionary instead, repeated variables are merged on the fly,
+        so every added atom costs O(1) and the whole expression O(k).
+
+        Attributes
+        ----------
+        variables : dict[int, Variable]
+            every variable added so far, indexed by the variable index
+        factors : dict[int, float]
+            merged factor of every variable added so far, indexed by the variable index
+
+        Methods
+        -------
+        __init__(*expressions : *Expression) -> ExpressionBuilder:
+            constructs a builder starting with the sum of the given expressions
+        add(expression: Expression, factor: float = 1.0) -> ExpressionBuilder:
+            adds the expression multiplied by the factor, returns the builder itself
+        __iadd__(expression: Expression) -> ExpressionBuilder:
+            adds the expression
+        __isub__(expression: Expression) -> ExpressionBuilder:
+            subtracts the whole expression (all of its atoms are inverted, unlike in Expression.__sub__)
+        expression() -> Expression:
+            returns the built expression, the variables are in the order of their first occurrence
+        __eq__(bound: float) -> Constraint:
+            returns a new equality constraint
+        __le__(bound: float) -> Constraint:
+            returns a new "less than or equal" constraint
+        __ge__(bound: float) -> Constraint:
+            returns a new "greater than or equal" constraint
+    """
+
+    def __init__(self, *expressions):
+        self.variables = dict()
+        self.factors = dict()
+        for expression in expressions:
+            self.add(expression)
+
+    def add(self, expression, factor = 1.0):
+        for atom in expression.atoms:
+            index = atom.var.index
+            self.variables[index] = atom.var
+            self.factors[index] = self.factors.get(index, 0.0) + factor * atom.factor
+        return self
+
+    def __iadd__(self, expression):
+        return self.add(expression)
+
+    def __isub__(self, expression):
+        return self.add(expression, -1.0)
+
+    def expression(self):
+        return e.Expression(*[a.Atom(self.variables[index], factor) for (index, factor) in self.factors.items()])
+
+    def __eq__(self, bound):
+        return self.expression() == bound
+
+    def __ge__(self, bound):
+        return self.expression() >= bound
+
+    def __le__(self, bound):
+        return self.expression() <= bound
+
+    def __str__(self):
+        return str(self.expression())
+
+
+def quicksum(expressions):
+    """
+        quicksum(expressions: Iterable[Expression]) -> Expression:
+            returns sum of the expressions, built in time linear in the number of their atoms
+    """
+    return ExpressionBuilder(*expressions).expression()
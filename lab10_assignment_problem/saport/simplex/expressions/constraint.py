@@ -1,4 +1,5 @@
 from enum import Enum
+import numpy as np
 
 class ConstraintType(Enum):
     """
@@ -18,6 +19,19 @@ class ConstraintType(Enum):
             ConstraintType.GE: ">="
         }[self]
 
+    @staticmethod
+    def codes(types, rows_n):
+        """
+            codes(types: ConstraintType | Iterable[ConstraintType | int], rows_n: int) -> numpy.Array:
+                returns values of the constraint types of rows_n rows, a single type is used for all of them
+        """
+        if isinstance(types, ConstraintType):
+            return np.full(rows_n, types.value, dtype=int)
+        codes = np.array([t.value if isinstance(t, ConstraintType) else int(t) for t in types], dtype=int)
+        if len(codes) != rows_n or not np.isin(codes, [-1, 0, 1]).all():
+            raise Exception(f"Expected {rows_n} constraint types (-1, 0 or 1), got {list(codes)}")
+        return codes
+
 class Constraint:
     """
         A class to represent a constraint in the linear programming expression, e.g. 4x + 5y <= 13, etc.
@@ -39,6 +53,8 @@ class Constraint:
             returns new constraint with the simplified polynomial
         invert():
             inverts type of the constraint (multiplies constraint times -1)
+        inverted() -> Constraint:
+            returns new inverted constraint, leaving this one intact
     """
     def __init__(self, expression, bound, type = ConstraintType.GE):
         self.expression = expression
@@ -53,5 +69,8 @@ class Constraint:
         self.expression = self.expression * -1
         self.bound = self.bound * -1
 
+    def inverted(self):
+        return Constraint(self.expression * -1, self.bound * -1, ConstraintType(self.type.value * -1))
+
     def __str__(self):
         return f"{self.expression} {self.type} {self.bound}"
\ No newline at end of file
@@ -1,7 +1,7 @@
 from . import constraint as co
 
-from itertools import groupby
 from functools import reduce
+import numpy as np
 
 
 class Expression:
@@ -23,9 +23,13 @@ class Expression:
             returns value of the expression for the given assignment
             assignment is just a list of values with order corresponding to the variables in the model
         simplify() -> Expression:
-            returns a new expression with sorted and atoms and reduced factors 
+            returns an expression with sorted atoms and reduced factors (built once and reused)
         factors(model: Model) -> list[float]:
             return list of factors corresponding to the variables in the model
+        nonzeros() -> (numpy.Array, numpy.Array):
+            returns the variable index and the factor of every atom (not reduced, in the order of the atoms)
+        coefficient(variable: Variable) -> float:
+            returns the (reduced) factor of the variable in the expression, 0.0 if the variable doesn't occur in it
         __add__(other: Expression) -> Expression:
             returns sum of the two polynomials
         __sub__(other: Expression) -> Expression:
@@ -41,6 +45,9 @@ class Expression:
             returns a new "greater than or equal" constraint
     """
 
+    # reduced factors are computed once and kept until the atoms are replaced, see _coefficients()
+    _cache = None
+
     def __init__(self, *atoms):
         self.atoms = atoms 
 
@@ -57,23 +64,41 @@ class Expression:
 
     def simplify(self):
         from . import atom
-        projection = lambda a: a.var.index
-        reduce_atoms = lambda a1, a2: atom.Atom(a1.var, a1.factor + a2.factor)
-        reduce_group = lambda g: reduce(reduce_atoms, g[1:], g[0])
-    
-        sorted_atoms = sorted(self.atoms, key=projection)
-        grouped_atoms = [list(g[1]) for g in groupby(sorted_atoms, key=projection)]
- 
-        new_atoms = (reduce_group(g) for g in grouped_atoms) 
-        return Expression(*new_atoms)
+        (variables, coefficients, simplified) = self._coefficients()
+        if simplified is None:
+            simplified = Expression(*[atom.Atom(variables[index], coefficients[index]) for index in sorted(coefficients)])
+            simplified._cache = (simplified.atoms, variables, coefficients, simplified)
+            self._cache = (self.atoms, variables, coefficients, simplified)
+        return simplified
 
     def factors(self, model):
-        simplified_expression = self.simplify()
-        factors = [0.0 for _ in model.variables]
-        for a in simplified_expression.atoms:
-            factors[a.var.index] = a.factor
+        factors = [0.0] * len(model.variables)
+        for (index, factor) in self._coefficients()[1].items():
+            factors[index] = factor
         return factors
 
+    def nonzeros(self):
+        return (np.array([a.var.index for a in self.atoms], dtype=int), np.array([a.factor for a in self.atoms], dtype=float))
+
+    def coefficient(self, variable):
+        return self._coefficients()[1].get(variable.index, 0.0)
+
+    def _coefficients(self):
+        """
+            _coefficients() -> (dict[int, Variable], dict[int, float], Expression | None):
+                returns variables and their reduced factors indexed by the variable index, and the simplified expression if it's been built already,
+                they are computed once (in O(atoms)) and recomputed only if the atoms of the expression have been replaced
+        """
+        if self._cache is None or self._cache[0] is not self.atoms:
+            variables = dict()
+            coefficients = dict()
+            for a in self.atoms:
+                index = a.var.index
+                variables[index] = a.var
+                coefficients[index] = coefficients.get(index, 0.0) + a.factor
+            self._cache = (self.atoms, variables, coefficients, None)
+        return self._cache[1:]
+
     def __add__(self, other):
         new_atoms = list(self.atoms)
         new_atoms += other.atoms;
@@ -103,10 +128,87 @@ class Expression:
         return co.Constraint(self, bound, co.ConstraintType.LE)
 
     def __str__(self):
+        if len(self.atoms) == 0:
+            return "0"
+
         text = str(self.atoms[0])
         
         for atom in self.atoms[1:]:
             text += ' + ' if atom.factor >= 0 else ' - '
             factor = "" if abs(atom.factor) == 1.0 else f"{abs(atom.factor)}*"
             text += f'{factor}{atom.var.name}'
-        return text
\ No newline at end of file
+        return text
+
+
+class RowExpression(Expression):
+    """
+        A class to represent an expression of a row of a factors matrix (see Model.add_constraints_from_arrays).
+        The row is kept as the arrays of its variable indexes and factors, the atoms are created only when they're read for the first time,
+        so building a model from a large matrix costs only the slicing of the arrays, and neither multiplying the row
+        nor reading its factors creates them.
+
+        Attributes
+        ----------
+        variables : list[Variable]
+            variables of the model, variables[i] is the variable with index i
+        indexes : numpy.Array
+            indexes of the variables with the nonzero factors, increasing if the row is simplified
+        values : numpy.Array
+            nonzero factors of the row
+        atoms : tuple[Atom]
+            atoms of the expression, created on the first access
+
+        Methods
+        -------
+        __init__(variables: list[Variable], indexes: numpy.Array, values: numpy.Array) -> RowExpression:
+            constructs an expression of the row without creating its atoms
+        simplify() -> Expression:
+            returns the row itself if its indexes are increasing (it's simplified already), otherwise the simplified expression of its atoms
+        factors(model: Model) -> list[float]:
+            return list of factors corresponding to the variables in the model
+        nonzeros() -> (numpy.Array, numpy.Array):
+            returns the variable indexes and the factors of the row
+        __mul__(factor: float) -> RowExpression:
+            return a new row with all factors multiplied by the given number
+    """
+
+    def __init__(self, variables, indexes, values):
+        self.variables = variables
+        self.indexes = indexes
+        self.values = values
+        self._atoms = None
+
+    @property
+    def atoms(self):
+        if self._atoms is None:
+            from .atom import Atom
+            self._atoms = tuple(Atom(self.variables[index], value) for (index, value) in zip(self.indexes.tolist(), self.values.tolist()))
+        return self._atoms
+
+    @atoms.setter
+    def atoms(self, atoms):
+        self._atoms = atoms
+
+    def simplify(self):
+        if self._atoms is None and (np.diff(self.indexes) > 0).all() and (self.values != 0).all():
+            return self
+        return super().simplify()
+
+    def factors(self, model):
+        if self._atoms is not None:
+            return super().factors(model)
+        factors = np.zeros(len(model.variables))
+        np.add.at(factors, self.indexes, self.values)
+        return factors.tolist()
+
+    def nonzeros(self):
+        if self._atoms is not None:
+            return super().nonzeros()
+        return (self.indexes, self.values)
+
+    def __mul__(self, factor):
+        if self._atoms is not None:
+            return super().__mul__(factor)
+        return RowExpression(self.variables, self.indexes, self.values * factor)
+
+    __rmul__ = __mul__
@@ -37,6 +37,8 @@ class Objective:
             returns new objective with the simplified polynomial
         invert():
             inverts the objective, keeping the "objective variable factor" intact  
+        inverted() -> Objective:
+            returns new inverted objective, leaving this one intact
         evaluate(assignemnt: list[float]) -> float:
             returns value of the objective for the given assignment
             assignment is just a list of floats corresponding (by index) to the variables in the model 
@@ -52,11 +54,14 @@ class Objective:
         self.expression = self.expression * -1
         self.factor = self.factor * -1
 
+    def inverted(self):
+        return Objective(self.expression * -1, ObjectiveType(self.type.value * -1), self.factor * -1)
+
     def simplify(self):
         return Objective(self.expression.simplify(), self.type, self.factor)
 
     def depends_on_variable(self, model, variable):
-        return self.expression.factors(model)[variable.index] != 0
+        return self.expression.coefficient(variable) != 0
 
     def evaluate(self, assignment):
         return self.expression.evaluate(assignment)
@@ -0,0 +1,108 @@
+import numpy as np
+
+eps = 0.0000001
+
+class BasisFactorization:
+    """
+        A class to represent a factorized basis matrix used by the revised simplex.
+        The basis is kept as an LU decomposition with partial pivoting (P * B = L * U),
+        every basis change is appended as an eta matrix (product form of the inverse)
+        and after a number of updates the basis is factorized from scratch.
+
+
+        Attributes
+        ----------
+        refactorization_period : int
+            how many eta updates are allowed before the basis has to be factorized again
+        updates : int
+            number of eta updates since the last refactorization
+
+        Methods
+        -------
+        __init__(basis_matrix: numpy.Array, refactorization_period: int = 64) -> BasisFactorization:
+            factorizes the given basis matrix
+        refactorize(basis_matrix: numpy.Array):
+            computes a new LU decomposition and drops all the eta updates
+        needs_refactorization() -> bool:
+            checks whether the eta file got long enough to refactorize the basis
+        ftran(column: numpy.Array) -> numpy.Array:
+            returns x solving B * x = column
+        btran(row: numpy.Array) -> numpy.Array:
+            returns y solving y * B = row
+        update(position: int, alpha: numpy.Array):
+            replaces the basis column at the given position, alpha is the entering column after ftran
+    """
+
+    def __init__(self, basis_matrix, refactorization_period = 64):
+        self.refactorization_period = refactorization_period
+        self.refactorize(basis_matrix)
+
+    def refactorize(self, basis_matrix):
+        upper = np.array(basis_matrix, dtype=float)
+        size = upper.shape[0]
+        lower = np.eye(size)
+        permutation = np.arange(size)
+
+        for k in range(size):
+            pivot = k + np.abs(upper[k:, k]).argmax()
+            if abs(upper[pivot, k]) < eps:
+                raise Exception("Basis matrix is singular")
+            if pivot != k:
+                upper[[k, pivot], k:] = upper[[pivot, k], k:]
+                lower[[k, pivot], :k] = lower[[pivot, k], :k]
+                permutation[[k, pivot]] = permutation[[pivot, k]]
+            multipliers = upper[k+1:, k] / upper[k, k]
+            lower[k+1:, k] = multipliers
+            upper[k+1:, k:] -= np.outer(multipliers, upper[k, k:])
+
+        self._lower = lower
+        self._upper = upper
+        self._permutation = permutation
+        self._etas = []
+        self.updates = 0
+
+    def needs_refactorization(self):
+        return self.updates >= self.refactorization_period
+
+    def ftran(self, column):
+        x = self._solve_lu(np.asarray(column, dtype=float)[self._permutation])
+        for (position, alpha) in self._etas:
+            x_r = x[position] / alpha[position]
+            x -= x_r * alpha
+            x[position] = x_r
+        return x
+
+    def btran(self, row):
+        y = np.array(row, dtype=float)
+        for (position, alpha) in reversed(self._etas):
+            y_r = y[position]
+            y[position] = 0.0
+            y[position] = (y_r - y.dot(alpha)) / alpha[position]
+        w = self._solve_lu_transposed(y)
+        result = np.empty_like(w)
+        result[self._permutation] = w
+        return result
+
+    def update(self, position, alpha):
+        self._etas.append((position, np.array(alpha, dtype=float)))
+        self.updates += 1
+
+    def _solve_lu(self, b):
+        size = len(b)
+        z = np.empty(size)
+        for i in range(size):
+            z[i] = b[i] - self._lower[i, :i].dot(z[:i])
+        x = np.empty(size)
+        for i in reversed(range(size)):
+            x[i] = (z[i] - self._upper[i, i+1:].dot(x[i+1:])) / self._upper[i, i]
+        return x
+
+    def _solve_lu_transposed(self, c):
+        size = len(c)
+        z = np.empty(size)
+        for i in range(size):
+            z[i] = (c[i] - self._upper[:i, i].dot(z[:i])) / self._upper[i, i]
+        w = np.empty(size)
+        for i in reversed(range(size)):
+            w[i] = z[i] - self._lower[i+1:, i].dot(w[i+1:])
+        return w
@@ -0,0 +1,157 @@
+import array
+import gzip
+
+from .. import array_model as am
+from ..sparse import SparseMatrix
+from ..expressions import constraint as co
+from ..expressions import objective as ob
+import numpy as np
+
+
+def open_text(path, mode = "r"):
+    """
+        open_text(path: str, mode: str = "r") -> TextIO:
+            opens the text file for reading ("r") or writing ("w"), files ending with ".gz" are (de)compressed on the fly
+    """
+    if str(path).endswith(".gz"):
+        return gzip.open(path, mode + "t")
+    return open(path, mode)
+
+
+def parse_number(token, line_number):
+    """
+        parse_number(token: str, line_number: int) -> float:
+            returns the number written in the token (including "inf" and "infinity"), reports the line of the file otherwise
+    """
+    try:
+        return float(token)
+    except ValueError:
+        raise Exception(f"Line {line_number}: expected a number, got '{token}'")
+
+
+class ModelBuffer:
+    """
+        A class to collect a model while its file is being read, before it becomes an ArrayModel.
+        Every number goes straight into a typed array (8 bytes per value, no Python objects are kept per factor),
+        so the memory used by a file with millions of nonzeros stays flat and the file is read in a single pass.
+
+        Attributes
+        ----------
+        name : str
+            name of the problem
+        columns : dict[str, int]
+            index of every variable by its name, in the order of the first occurrence
+        rows : dict[str, int]
+            index of every named constraint
+        objective_type : ObjectiveType
+            type of the objective (minimization by default, like in the file formats)
+        objective : array
+            objective factor of every variable
+        lower_bounds : array
+            lower bound of every variable
+        upper_bounds : array
+            upper bound of every variable
+        types : array
+            ConstraintType value of every constraint
+        bounds : array
+            right-hand side of every constraint
+        entry_rows : array
+            constraint of every read factor
+        entry_columns : array
+            variable of every read factor
+        entry_values : array
+            value of every read factor, repeated factors are summed up when the model is built
+
+        Methods
+        -------
+        __init__(name: str) -> ModelBuffer:
+            constructs an empty buffer of the named problem
+        column(name: str) -> int:
+            returns index of the named variable, the variable is added on its first occurrence
+        add_row(name: str | None, type: ConstraintType, bound: float = 0.0) -> int:
+            adds a constraint without any factors, returns its index
+        add_entry(row: int, column: int, value: float):
+            adds a factor of the variable in the constraint
+        set_lower_bound(column: int, bound: float):
+            sets a finite lower bound of the variable
+        set_upper_bound(column: int, bound: float):
+            sets an upper bound of the variable
+        copy_rows(rows: Iterable[int], types: Iterable[ConstraintType], bounds: Iterable[float]):
+            adds a new constraint with the factors of every given row, but its own type and bound
+        to_array_model() -> ArrayModel:
+            returns the collected model
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.columns = dict()
+        self.rows = dict()
+        self.objective_type = ob.ObjectiveType.MIN
+        self.objective = array.array('d')
+        self.lower_bounds = array.array('d')
+        self.upper_bounds = array.array('d')
+        self.types = array.array('q')
+        self.bounds = array.array('d')
+        self.entry_rows = array.array('q')
+        self.entry_columns = array.array('q')
+        self.entry_values = array.array('d')
+
+    def column(self, name):
+        index = self.columns.get(name)
+        if index == None:
+            index = len(self.columns)
+            self.columns[name] = index
+            self.objective.append(0.0)
+            self.lower_bounds.append(0.0)
+            self.upper_bounds.append(float('inf'))
+        return index
+
+    def add_row(self, name, type, bound = 0.0):
+        if name in self.rows:
+            raise Exception(f"There is already a constraint named {name}")
+        index = len(self.types)
+        if name != None:
+            self.rows[name] = index
+        self.types.append(type.value)
+        self.bounds.append(bound)
+        return index
+
+    def add_entry(self, row, column, value):
+        self.entry_rows.append(row)
+        self.entry_columns.append(column)
+        self.entry_values.append(value)
+
+    def set_lower_bound(self, column, bound):
+        if bound == float('-inf'):
+            raise Exception("Model doesn't support free variables, lower bound has to be finite")
+        self.lower_bounds[column] = bound
+
+    def set_upper_bound(self, column, bound):
+        self.upper_bounds[column] = bound
+
+    def copy_rows(self, rows, types, bounds):
+        rows = np.asarray(rows, dtype=int)
+        # copies, not views, the typed arrays can't grow while they are viewed by numpy
+        entry_rows = np.array(self.entry_rows, dtype=int)
+        copied = np.flatnonzero(np.isin(entry_rows, rows))
+        # every copied row gets the index following the already added ones
+        new_rows = np.zeros(len(self.types), dtype=int)
+        new_rows[rows] = len(self.types) + np.arange(len(rows))
+        (copied_rows, copied_columns, copied_values) = (new_rows[entry_rows[copied]], np.array(self.entry_columns, dtype=int)[copied], np.array(self.entry_values)[copied])
+
+        self.entry_rows.extend(copied_rows.tolist())
+        self.entry_columns.extend(copied_columns.tolist())
+        self.entry_values.extend(copied_values.tolist())
+        for (type, bound) in zip(types, bounds):
+            self.add_row(None, type, bound)
+
+    def to_array_model(self):
+        model = am.ArrayModel(self.name)
+        model.create_named_variables(self.columns.keys())
+        model.lower_bounds[:] = np.frombuffer(self.lower_bounds)
+        model.upper_bounds[:] = np.frombuffer(self.upper_bounds)
+        shape = (len(self.types), len(self.columns))
+        matrix = SparseMatrix.from_triplets(np.frombuffer(self.entry_rows, dtype=np.int64), np.frombuffer(self.entry_columns, dtype=np.int64), np.frombuffer(self.entry_values), shape)
+        model.add_constraints_from_arrays(matrix, np.frombuffer(self.bounds), co.ConstraintType.codes(np.frombuffer(self.types, dtype=np.int64), shape[0]))
+        model.set_objective(np.frombuffer(self.objective), self.objective_type)
+        return model
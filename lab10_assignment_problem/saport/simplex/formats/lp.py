@@ -0,0 +1,290 @@
+import re
+
+from . import buffer as b
+from .. import array_model as am
+from ..expressions import constraint as co
+from ..expressions import objective as ob
+
+_HEADER = re.compile(r"^\s*(maximize|maximise|maximum|max|minimize|minimise|minimum|min|subject\s+to|such\s+that|s\.t\.|st|bounds?|generals?|gen|integers?|binary|binaries|bin|semi-continuous|semis?|end)(?=\s|$)(.*)$", re.IGNORECASE)
+_TOKEN = re.compile(r"<=|>=|=<|=>|<|>|=|[+-]|(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?|:|[^\s:+\-<>=]+")
+# kind of the token by its first character, all the other tokens are names
+_KINDS = {**{c: "operator" for c in "<>="}, "+": "sign", "-": "sign", ":": "colon", **{c: "number" for c in ".0123456789"}}
+_PROBLEM_NAME = re.compile(r"\\\s*Problem name:\s*(.*)$")
+_RELATIONS = {
+    "<": co.ConstraintType.LE, "<=": co.ConstraintType.LE, "=<": co.ConstraintType.LE,
+    ">": co.ConstraintType.GE, ">=": co.ConstraintType.GE, "=>": co.ConstraintType.GE,
+    "=": co.ConstraintType.EQ
+}
+_INFINITIES = {"inf", "infinity"}
+_TERMS_PER_LINE = 8
+
+
+def read_lp(path):
+    """
+        read_lp(path: str) -> ArrayModel:
+            reads the linear problem written in the CPLEX LP format, the file is read line by line
+            and the factors of every constraint go straight into the arrays of the model as soon as the constraint ends.
+            Supported sections: Maximize / Minimize, Subject To, Bounds, Generals, Binaries and End,
+            integer sections are read as the LP relaxation (binaries get the 0 <= x <= 1 bounds);
+            free variables, objective constants and semi-continuous variables are not supported
+    """
+    buffer = b.ModelBuffer("")
+    section = None
+    statement = []
+    relation = False
+
+    with b.open_text(path) as file:
+        for (line_number, line) in enumerate(file, 1):
+            (line, separator, comment) = line.partition("\\")
+            name = _PROBLEM_NAME.match(separator + comment)
+            if name != None:
+                buffer.name = name.group(1).strip()
+
+            header = _HEADER.match(line)
+            if header != None:
+                _read_statement(buffer, section, statement, line_number)
+                (section, statement, relation) = (_section(header.group(1), line_number), [], False)
+                if section == "end":
+                    break
+                if section == "objective":
+                    buffer.objective_type = ob.ObjectiveType.MAX if header.group(1).lower().startswith("max") else ob.ObjectiveType.MIN
+                line = header.group(2)
+
+            tokens = _tokens(line)
+            if len(tokens) == 0:
+                continue
+            if section == None:
+                raise Exception(f"Line {line_number}: expected the objective section")
+            elif section == "bounds":
+                _read_bound(buffer, tokens, line_number)
+            elif section == "binaries":
+                for (_, name) in tokens:
+                    column = buffer.column(name)
+                    buffer.set_lower_bound(column, 0.0)
+                    buffer.set_upper_bound(column, 1.0)
+            elif section == "generals":
+                for (_, name) in tokens:
+                    buffer.column(name)
+            elif section == "constraints":
+                # the constraint ends with the first number after its relation
+                for token in tokens:
+                    statement.append(token)
+                    if token[0] == "operator":
+                        relation = True
+                    elif relation and token[0] == "number":
+                        _read_statement(buffer, section, statement, line_number)
+                        (statement, relation) = ([], False)
+            else:
+                statement += tokens
+        _read_statement(buffer, section, statement, line_number)
+
+    return buffer.to_array_model()
+
+
+def _section(header, line_number):
+    """
+        _section(header: str, line_number: int) -> str:
+            returns the section starting with the header: "objective", "constraints", "bounds", "generals", "binaries" or "end"
+    """
+    header = header.lower()
+    if header.startswith("max") or header.startswith("min"):
+        return "objective"
+    if header in ("st", "s.t.") or header.startswith("subject") or header.startswith("such"):
+        return "constraints"
+    if header.startswith("bound"):
+        return "bounds"
+    if header.startswith("gen") or header.startswith("integer"):
+        return "generals"
+    if header.startswith("bin"):
+        return "binaries"
+    if header == "end":
+        return "end"
+    raise Exception(f"Line {line_number}: semi-continuous variables are not supported")
+
+
+def _tokens(line):
+    """
+        _tokens(line: str) -> list[(str, str | float)]:
+            splits the line into (kind, value) tokens, the numbers (and "inf" / "infinity") are already parsed
+    """
+    # every character other than a whitespace belongs to one of the token kinds, so nothing is skipped
+    tokens = [(_KINDS.get(token[0], "name"), token) for token in _TOKEN.findall(line)]
+    return [("number", float(value)) if kind == "number" or (kind == "name" and value.lower() in _INFINITIES) else (kind, value) for (kind, value) in tokens]
+
+
+def _is_complete(statement):
+    """
+        _is_complete(statement: list[(str, str | float)]) -> bool:
+            checks whether the constraint ends with the relation and its (optionally signed) right-hand side
+    """
+    kinds = [kind for (kind, _) in statement[-3:]]
+    return kinds[-1] == "number" and (kinds[-2:-1] == ["operator"] or kinds[-3:-1] == ["operator", "sign"])
+
+
+def _label(statement):
+    """
+        _label(statement: list[(str, str | float)]) -> (str | None, list[(str, str | float)]):
+            returns the name of the statement ("name:" prefix) and its remaining tokens
+    """
+    if len(statement) > 1 and statement[0][0] == "name" and statement[1][0] == "colon":
+        return (statement[0][1], statement[2:])
+    return (None, statement)
+
+
+def _terms(tokens, line_number):
+    """
+        _terms(tokens: list[(str, str | float)], line_number: int) -> (list[(str, float)], float):
+            returns (variable name, factor) of every term of the linear expression and the sum of its constants
+    """
+    (terms, constant) = ([], 0.0)
+    (sign, factor) = (1.0, None)
+    for (kind, value) in tokens:
+        if kind == "sign":
+            if factor != None:
+                constant += sign * factor
+                (sign, factor) = (1.0, None)
+            sign *= -1.0 if value == "-" else 1.0
+        elif kind == "number":
+            if factor != None:
+                raise Exception(f"Line {line_number}: two numbers without an operator between them")
+            factor = value
+        elif kind == "name":
+            terms.append((value, sign * (1.0 if factor == None else factor)))
+            (sign, factor) = (1.0, None)
+        else:
+            raise Exception(f"Line {line_number}: unexpected '{value}' in the linear expression")
+    if factor != None:
+        constant += sign * factor
+    return (terms, constant)
+
+
+def _read_statement(buffer, section, statement, line_number):
+    """
+        _read_statement(buffer: ModelBuffer, section: str, statement: list[(str, str | float)], line_number: int):
+            adds the objective or constraint read from the statement tokens to the buffer
+    """
+    if len(statement) == 0:
+        return
+    if section == "constraints" and not _is_complete(statement):
+        raise Exception(f"Line {line_number}: constraint has to end with a relation and a number")
+
+    (name, tokens) = _label(statement)
+    if section == "objective":
+        (terms, constant) = _terms(tokens, line_number)
+        if constant != 0:
+            raise Exception(f"Line {line_number}: objective constants are not supported")
+        for (variable, factor) in terms:
+            buffer.objective[buffer.column(variable)] += factor
+        return
+
+    relation = max(i for (i, (kind, _)) in enumerate(tokens) if kind == "operator")
+    (terms, constant) = _terms(tokens[:relation], line_number)
+    if constant != 0:
+        raise Exception(f"Line {line_number}: constants are allowed only on the right-hand side")
+    (_, bound) = _terms(tokens[relation + 1:], line_number)
+    row = buffer.add_row(name, _RELATIONS[tokens[relation][1]], bound)
+    for (variable, factor) in terms:
+        buffer.add_entry(row, buffer.column(variable), factor)
+
+
+def _read_bound(buffer, tokens, line_number):
+    """
+        _read_bound(buffer: ModelBuffer, tokens: list[(str, str | float)], line_number: int):
+            sets the bounds written in one line of the Bounds section: "x free", "x <= u", "x >= l", "x = v", "l <= x", "l <= x <= u"
+    """
+    items = []
+    sign = 1.0
+    for (kind, value) in tokens:
+        if kind == "sign":
+            sign *= -1.0 if value == "-" else 1.0
+            continue
+        items.append((kind, sign * value if kind == "number" else value))
+        sign = 1.0
+    kinds = [kind for (kind, _) in items]
+
+    if kinds == ["name", "name"] and items[1][1].lower() == "free":
+        buffer.set_lower_bound(buffer.column(items[0][1]), float('-inf'))
+    elif kinds == ["number", "operator", "name", "operator", "number"]:
+        column = buffer.column(items[2][1])
+        _set_bound(buffer, column, _mirrored(items[1][1]), items[0][1])
+        _set_bound(buffer, column, items[3][1], items[4][1])
+    elif kinds == ["name", "operator", "number"]:
+        _set_bound(buffer, buffer.column(items[0][1]), items[1][1], items[2][1])
+    elif kinds == ["number", "operator", "name"]:
+        _set_bound(buffer, buffer.column(items[2][1]), _mirrored(items[1][1]), items[0][1])
+    else:
+        raise Exception(f"Line {line_number}: can't read the bound")
+
+
+def _mirrored(operator):
+    """
+        _mirrored(operator: str) -> str:
+            returns the operator relating the sides in the reversed order ("l <= x" is "x >= l")
+    """
+    return {co.ConstraintType.LE: ">=", co.ConstraintType.GE: "<=", co.ConstraintType.EQ: "="}[_RELATIONS[operator]]
+
+
+def _set_bound(buffer, column, operator, value):
+    """
+        _set_bound(buffer: ModelBuffer, column: int, operator: str, value: float):
+            sets the bound "x operator value" of the variable
+    """
+    relation = _RELATIONS[operator]
+    if relation != co.ConstraintType.LE:
+        buffer.set_lower_bound(column, value)
+    if relation != co.ConstraintType.GE:
+        buffer.set_upper_bound(column, value)
+
+
+def write_lp(model, path):
+    """
+        write_lp(model: Model | ArrayModel, path: str):
+            writes the model in the CPLEX LP format, constraints are named c0, c1, ...,
+            every variable is listed in the objective (with a zero factor if needed),
+            so reading the file back gives an equivalent model with the same order of variables
+    """
+    if not isinstance(model, am.ArrayModel):
+        model = am.ArrayModel.from_model(model)
+    names = [var.name for var in model.variables]
+    for name in names:
+        tokens = _tokens(name)
+        if len(tokens) != 1 or tokens[0][0] != "name" or name[0] in ".0123456789":
+            raise Exception(f"Variable name '{name}' can't be written in the LP format")
+
+    # columns of the transposed matrix are the rows of the constraints
+    rows = model.matrix().transpose()
+    (indices, data, indptr) = (rows.indices.tolist(), rows.data.tolist(), rows.indptr.tolist())
+
+    with b.open_text(path, "w") as file:
+        file.write(f"\\ Problem name: {model.name}\n\n")
+        file.write("Maximize\n" if model.objective_type == ob.ObjectiveType.MAX else "Minimize\n")
+        file.write(f" obj: {_expression(names, range(len(names)), model.objective_factors.tolist())}\n")
+
+        file.write("Subject To\n")
+        for (i, (type, bound)) in enumerate(zip(model.types.tolist(), model.bounds.tolist())):
+            (start, end) = (indptr[i], indptr[i + 1])
+            expression = _expression(names, indices[start:end], data[start:end]) if end > start else f"0 {names[0]}"
+            file.write(f" c{i}: {expression} {co.ConstraintType(type)} {bound!r}\n")
+
+        file.write("Bounds\n")
+        for (name, lower, upper) in zip(names, model.lower_bounds.tolist(), model.upper_bounds.tolist()):
+            if lower == upper:
+                file.write(f" {name} = {lower!r}\n")
+            elif upper != float('inf'):
+                file.write(f" {lower!r} <= {name} <= {upper!r}\n")
+            elif lower != 0:
+                file.write(f" {name} >= {lower!r}\n")
+        file.write("End\n")
+
+
+def _expression(names, columns, factors):
+    """
+        _expression(names: list[str], columns: Iterable[int], factors: Iterable[float]) -> str:
+            returns the linear expression in the LP format, broken into lines of a few terms
+    """
+    terms = []
+    for (i, (column, factor)) in enumerate(zip(columns, factors)):
+        sign = "-" if factor < 0 or (factor == 0 and str(factor).startswith("-")) else "+"
+        separator = "\n   " if i > 0 and i % _TERMS_PER_LINE == 0 else " "
+        terms.append(f"{separator}{sign} {abs(factor)!r} {names[column]}")
+    return "".join(terms).lstrip(" ")
@@ -0,0 +1,216 @@
+from . import buffer as b
+from .. import array_model as am
+from ..expressions import constraint as co
+from ..expressions import objective as ob
+
+_SECTIONS = {"NAME", "OBJSENSE", "ROWS", "COLUMNS", "RHS", "RANGES", "BOUNDS", "ENDATA"}
+_ROW_TYPES = {"L": co.ConstraintType.LE, "E": co.ConstraintType.EQ, "G": co.ConstraintType.GE}
+_SENSES = {"MAX": ob.ObjectiveType.MAX, "MAXIMIZE": ob.ObjectiveType.MAX, "MIN": ob.ObjectiveType.MIN, "MINIMIZE": ob.ObjectiveType.MIN}
+_OBJECTIVE_ROW = "obj"
+
+
+def read_mps(path):
+    """
+        read_mps(path: str) -> ArrayModel:
+            reads the linear problem written in the free MPS format (fields separated by whitespace, section names in the first column),
+            the file is read line by line and the factors go straight into the arrays of the model.
+            Supported sections: NAME, OBJSENSE, ROWS, COLUMNS, RHS, RANGES, BOUNDS (UP, LO, FX, PL, BV, LI, UI) and ENDATA,
+            integer markers and bounds are read as the LP relaxation; free variables (FR, MI) and objective constants are not supported
+    """
+    buffer = b.ModelBuffer("")
+    section = None
+    objective_row = None
+    free_rows = set()
+    ranges = dict()
+
+    with b.open_text(path) as file:
+        for (line_number, line) in enumerate(file, 1):
+            fields = line.split()
+            if len(fields) == 0 or line.startswith("*"):
+                continue
+
+            if not line[0].isspace():
+                section = fields[0].upper()
+                if section not in _SECTIONS:
+                    raise Exception(f"Line {line_number}: unknown MPS section {fields[0]}")
+                if section == "NAME":
+                    buffer.name = " ".join(fields[1:])
+                elif section == "OBJSENSE" and len(fields) > 1:
+                    buffer.objective_type = _sense(fields[1], line_number)
+                elif section == "ENDATA":
+                    break
+                continue
+
+            if section == "COLUMNS":
+                if len(fields) > 2 and fields[1] == "'MARKER'":
+                    continue
+                column = buffer.column(fields[0])
+                for i in range(1, len(fields) - 1, 2):
+                    row = fields[i]
+                    value = b.parse_number(fields[i + 1], line_number)
+                    if row == objective_row:
+                        buffer.objective[column] += value
+                    elif row not in free_rows:
+                        buffer.add_entry(_row(buffer, row, line_number), column, value)
+            elif section == "ROWS":
+                (type, row) = (fields[0].upper(), fields[1])
+                if type == "N":
+                    if objective_row == None:
+                        objective_row = row
+                    else:
+                        free_rows.add(row)
+                elif type in _ROW_TYPES:
+                    buffer.add_row(row, _ROW_TYPES[type])
+                else:
+                    raise Exception(f"Line {line_number}: unknown row type {fields[0]}")
+            elif section == "RHS" or section == "RANGES":
+                # the name of the vector is optional, the rest are (row, value) pairs
+                for i in range(len(fields) % 2, len(fields) - 1, 2):
+                    row = fields[i]
+                    value = b.parse_number(fields[i + 1], line_number)
+                    if row in free_rows:
+                        continue
+                    if row == objective_row:
+                        if section == "RHS" and value != 0:
+                            raise Exception(f"Line {line_number}: objective constants are not supported")
+                        continue
+                    if section == "RHS":
+                        buffer.bounds[_row(buffer, row, line_number)] = value
+                    else:
+                        ranges[_row(buffer, row, line_number)] = value
+            elif section == "BOUNDS":
+                _read_bound(buffer, fields, line_number)
+            elif section == "OBJSENSE":
+                buffer.objective_type = _sense(fields[0], line_number)
+            else:
+                raise Exception(f"Line {line_number}: data outside of any MPS section")
+
+    _add_ranges(buffer, ranges)
+    return buffer.to_array_model()
+
+
+def _sense(field, line_number):
+    """
+        _sense(field: str, line_number: int) -> ObjectiveType:
+            returns the objective type written in the OBJSENSE section
+    """
+    sense = _SENSES.get(field.upper())
+    if sense == None:
+        raise Exception(f"Line {line_number}: unknown objective sense {field}")
+    return sense
+
+
+def _row(buffer, name, line_number):
+    """
+        _row(buffer: ModelBuffer, name: str, line_number: int) -> int:
+            returns index of the constraint declared in the ROWS section
+    """
+    row = buffer.rows.get(name)
+    if row == None:
+        raise Exception(f"Line {line_number}: unknown row {name}")
+    return row
+
+
+def _read_bound(buffer, fields, line_number):
+    """
+        _read_bound(buffer: ModelBuffer, fields: list[str], line_number: int):
+            sets the bound written in one line of the BOUNDS section, the name of the bound vector is optional
+    """
+    type = fields[0].upper()
+    if type in ("UP", "LO", "FX", "LI", "UI"):
+        (column, value) = (buffer.column(fields[-2]), b.parse_number(fields[-1], line_number))
+    elif type in ("PL", "BV", "FR", "MI"):
+        (column, value) = (buffer.column(fields[-1]), None)
+    else:
+        raise Exception(f"Line {line_number}: unsupported bound type {fields[0]}")
+
+    if type in ("LO", "LI"):
+        buffer.set_lower_bound(column, value)
+    elif type in ("UP", "UI"):
+        # MPS convention: a negative upper bound of a variable without a lower bound makes the variable free
+        if value < 0 and buffer.lower_bounds[column] == 0.0:
+            buffer.set_lower_bound(column, float('-inf'))
+        buffer.set_upper_bound(column, value)
+    elif type == "FX":
+        buffer.set_lower_bound(column, value)
+        buffer.set_upper_bound(column, value)
+    elif type == "PL":
+        buffer.set_upper_bound(column, float('inf'))
+    elif type == "BV":
+        buffer.set_lower_bound(column, 0.0)
+        buffer.set_upper_bound(column, 1.0)
+    else:
+        buffer.set_lower_bound(column, float('-inf'))
+
+
+def _add_ranges(buffer, ranges):
+    """
+        _add_ranges(buffer: ModelBuffer, ranges: dict[int, float]):
+            turns every ranged constraint into two constraints, the second one (bounding the other side) is added at the end
+    """
+    (rows, types, bounds) = ([], [], [])
+    for (row, value) in ranges.items():
+        (type, bound) = (co.ConstraintType(buffer.types[row]), buffer.bounds[row])
+        if type == co.ConstraintType.LE:
+            (other_type, other_bound) = (co.ConstraintType.GE, bound - abs(value))
+        elif type == co.ConstraintType.GE:
+            (other_type, other_bound) = (co.ConstraintType.LE, bound + abs(value))
+        elif value >= 0:
+            buffer.types[row] = co.ConstraintType.GE.value
+            (other_type, other_bound) = (co.ConstraintType.LE, bound + value)
+        else:
+            buffer.types[row] = co.ConstraintType.LE.value
+            (other_type, other_bound) = (co.ConstraintType.GE, bound + value)
+        rows.append(row)
+        types.append(other_type)
+        bounds.append(other_bound)
+    if len(rows) > 0:
+        buffer.copy_rows(rows, types, bounds)
+
+
+def write_mps(model, path):
+    """
+        write_mps(model: Model | ArrayModel, path: str):
+            writes the model in the free MPS format, constraints are named c0, c1, ... and the objective is named obj,
+            every variable is listed in the COLUMNS section (with a zero objective factor if it has no other factor),
+            so reading the file back gives an equivalent model with the same order of variables
+    """
+    if not isinstance(model, am.ArrayModel):
+        model = am.ArrayModel.from_model(model)
+    names = [var.name for var in model.variables]
+    for name in names:
+        if len(name.split()) != 1:
+            raise Exception(f"Variable name '{name}' can't be written in the free MPS format")
+
+    matrix = model.matrix()
+    (indices, data, indptr) = (matrix.indices.tolist(), matrix.data.tolist(), matrix.indptr.tolist())
+    objective = model.objective_factors.tolist()
+    codes = {c.value: code for (code, c) in _ROW_TYPES.items()}
+
+    with b.open_text(path, "w") as file:
+        file.write(f"NAME {model.name}\n")
+        if model.objective_type == ob.ObjectiveType.MAX:
+            file.write("OBJSENSE\n    MAX\n")
+        file.write(f"ROWS\n N  {_OBJECTIVE_ROW}\n")
+        file.writelines(f" {codes[type]}  c{i}\n" for (i, type) in enumerate(model.types.tolist()))
+
+        file.write("COLUMNS\n")
+        for (j, name) in enumerate(names):
+            if objective[j] != 0 or indptr[j] == indptr[j + 1]:
+                file.write(f"    {name}  {_OBJECTIVE_ROW}  {objective[j]!r}\n")
+            file.writelines(f"    {name}  c{indices[k]}  {data[k]!r}\n" for k in range(indptr[j], indptr[j + 1]))
+
+        file.write("RHS\n")
+        file.writelines(f"    rhs  c{i}  {bound!r}\n" for (i, bound) in enumerate(model.bounds.tolist()) if bound != 0)
+
+        file.write("BOUNDS\n")
+        for (name, lower, upper) in zip(names, model.lower_bounds.tolist(), model.upper_bounds.tolist()):
+            if lower == upper:
+                file.write(f" FX bnd  {name}  {lower!r}\n")
+                continue
+            # without an explicit lower bound, a negative upper bound would make the variable free
+            if lower != 0 or upper < 0:
+                file.write(f" LO bnd  {name}  {lower!r}\n")
+            if upper != float('inf'):
+                file.write(f" UP bnd  {name}  {upper!r}\n")
+        file.write("ENDATA\n")
@@ -0,0 +1,85 @@
+from enum import Enum
+import os
+import shutil
+import tempfile
+import weakref
+
+import numpy as np
+
+
+class Retention(Enum):
+    """
+        An enum representing how much of the simplex tableaux a solution keeps:
+        - NONE = only the assignment, without any tableaux or normal model (the lean mode, e.g. for branch and bound nodes)
+        - FINAL = the final tableaux and the normal model, enough for the analysers and the re-optimization
+        - INITIAL_AND_FINAL = the initial tableaux as well (the default)
+        - HISTORY = the initial and final tableaux and the tableaux after every pivot, spilled to disk (see TableauxHistory)
+    """
+    NONE = "none"
+    FINAL = "final"
+    INITIAL_AND_FINAL = "initial-and-final"
+    HISTORY = "history"
+
+    def keeps_final(self):
+        return self != Retention.NONE
+
+    def keeps_initial(self):
+        return self in (Retention.INITIAL_AND_FINAL, Retention.HISTORY)
+
+
+class TableauxHistory:
+    """
+        A class to represent the tableaux after every pivot of a solve, stored on disk instead of the memory.
+        Every entry is written to its own file in a temporary directory as soon as the pivot is done
+        and loaded (memory mapped) only when it's accessed. The directory is removed with the history.
+        The tableaux engine records the whole tables, the revised engines record only the basis
+        (they never build the table, so the table of their entries is None).
+
+        Attributes
+        ----------
+        directory : str
+            directory with the stored entries
+        phases : list[Phase]
+            phase of every recorded pivot
+
+        Methods
+        -------
+        __init__(directory: str = None) -> TableauxHistory:
+            constructs an empty history stored in a new temporary directory (created in the given one if set)
+        record(phase: Phase, table: numpy.Array | None, basis: Iterable[int]):
+            writes the table and basis after a pivot done in the phase
+        __len__() -> int:
+            returns number of the recorded pivots
+        __getitem__(index: int) -> (Phase, numpy.Array | None, numpy.Array):
+            returns phase, table and basis after the pivot with the given index
+        close():
+            removes the stored entries
+    """
+
+    def __init__(self, directory = None):
+        self.directory = tempfile.mkdtemp(prefix="saport-history-", dir=directory)
+        self.phases = []
+        self._has_tables = []
+        self._cleanup = weakref.finalize(self, shutil.rmtree, self.directory, True)
+
+    def record(self, phase, table, basis):
+        index = len(self.phases)
+        if table is not None:
+            np.save(self._path(index, "table"), table)
+        np.save(self._path(index, "basis"), np.asarray(basis, dtype=int))
+        self.phases.append(phase)
+        self._has_tables.append(table is not None)
+
+    def __len__(self):
+        return len(self.phases)
+
+    def __getitem__(self, index):
+        index = range(len(self.phases))[index]
+        table = np.load(self._path(index, "table"), mmap_mode='r') if self._has_tables[index] else None
+        return (self.phases[index], table, np.load(self._path(index, "basis")))
+
+    def close(self):
+        self._cleanup()
+
+    def _path(self, index, name):
+        return os.path.join(self.directory, f"{index}-{name}.npy")
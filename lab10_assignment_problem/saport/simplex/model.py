@@ -1,8 +1,11 @@
-from copy import deepcopy
 import enum
 from itertools import permutations
 
-from . import solver as s
+from . import solverfactory as sf
+from . import cache as ca
+from . import solution as so
+from .analysis_tools import rhs_sensitivity as rhs
+from .sparse import SparseMatrix
 from .expressions import expression as ex
 from .expressions import variable as va
 from .expressions import objective as ob
@@ -24,6 +27,10 @@ class Model:
             list containing problem constraints
         objective : Objective
             object representing the objective function
+        lower_bounds : list[float]
+            lower bound of every variable (0.0 by default), lower_bounds[i] belongs to variables[i]
+        upper_bounds : list[float]
+            upper bound of every variable (inf by default), upper_bounds[i] belongs to variables[i]
 
         Methods
         -------
@@ -31,21 +38,47 @@ class Model:
             constructs new model with a specified name
         create_variable(name: str) -> Variable
             returns a new variable with a specified named, the variable is automatically indexed and added to the variables list
+        create_variables(n: int, prefix: str) -> list[Variable]
+            returns n new variables named prefix0, prefix1, ..., checking the names only once
+        set_lower_bound(variable: Variable, bound: float)
+            sets a finite lower bound of the variable, bounds are handled by the solver without adding constraints
+        set_upper_bound(variable: Variable, bound: float)
+            sets an upper bound of the variable, bounds are handled by the solver without adding constraints
+        has_bounds() -> bool
+            checks whether any variable has a bound other than the default 0 <= x < inf
         add_constraint(constraint: Constraint)
             add a new constraint to the model
+        add_constraints_from_arrays(factors: numpy.Array | SparseMatrix, bounds: Iterable[float] | float, types: ConstraintType | Iterable[ConstraintType | int], variables: list[Variable] = None)
+            adds a constraint for every row of the factors matrix (dense, SparseMatrix or scipy.sparse),
+            columns of the matrix correspond to the given variables (all the model variables by default),
+            types can be a single type or a type (or its value: -1, 0, 1) of every row,
+            the rows are kept as slices of the matrix arrays (see RowExpression), their atoms are created only when they're read
         maximize(expression: Expression)
             sets objective to maximize the specified Expression
         minimize(expression: Expression)
             sets objective to minimize the specified Expression
         translate_to_standard_form() -> Model
             creates a new equivalent model in a standard form (max objective and <= / = constraints)
+        copy() -> Model
+            returns a copy of the model sharing the variables, constraints and objective with the original,
+            only the lists are copied, so it costs O(variables + constraints) instead of copying every atom;
+            shared constraints and objective are never changed in place, they are replaced in the lists of the copy
         is_equivalent(other: Model) -> bool
-            checks whether the model is equivalent to another one (ignores variables' names, etc.), useful when writing tests
+            checks whether the model is equivalent to another one (ignores variables' names, etc.), useful when writing tests,
+            the models are compared by their canonical forms (see cache.canonical_form)
         dual() -> Model
-            creates a dual model 
+            creates a dual model, the model has no free variables, so the free dual variable of an equality constraint
+            is represented by a difference of two variables (the equality is split into two opposite "<=" constraints),
+            the bounds become constraints and a variable with a negative lower bound gets an equality dual constraint
 
-        solve() -> Solution
-            solves the current model using Simplex solver and returns the result
+        solve(engine: Engine = Engine.TABLEAUX, pricing: Pricing = Pricing.DANTZIG, presolve: bool = False, cache: SolutionCache = None, hook: SolverHook = None, retention: Retention = Retention.INITIAL_AND_FINAL, strategy: Strategy = Strategy.PRIMAL) -> Solution
+            solves the current model using Simplex solver with the given engine and pricing rule and returns the result,
+            with presolve the model is reduced first (the solution's tableaux then belongs to the reduced model),
+            with cache the solution of an identical model solved before is reused,
+            the hook is notified about the solver progress (only if the model is really solved),
+            retention decides which tableaux the solution keeps,
+            strategy (or its value: "primal", "dual", "auto") decides whether the model or its dual is solved,
+            the solution found through the dual has only the assignment, the tableaux (and the hook) belong to the dual
             when called, the model should already contain at least one variable and objective
     """
     
@@ -54,6 +87,8 @@ class Model:
         self.variables = []
         self.constraints = []
         self.objective = None
+        self.lower_bounds = []
+        self.upper_bounds = []
 
     def create_variable(self, name):
         for var in self.variables:
@@ -63,10 +98,56 @@ class Model:
         new_index = len(self.variables)
         variable = va.Variable(name, new_index)
         self.variables.append(variable)
+        self.lower_bounds.append(0.0)
+        self.upper_bounds.append(float('inf'))
         return variable 
 
+    def create_variables(self, n, prefix):
+        names = set(var.name for var in self.variables)
+        new_names = [f"{prefix}{i}" for i in range(n)]
+        for name in new_names:
+            if name in names:
+                raise Exception(f"There is already a variable named {name}")
+
+        variables = [va.Variable(name, len(self.variables) + i) for (i, name) in enumerate(new_names)]
+        self.variables += variables
+        self.lower_bounds += [0.0] * n
+        self.upper_bounds += [float('inf')] * n
+        return variables
+
+    def set_lower_bound(self, variable, bound):
+        if bound == float('-inf'):
+            raise Exception("Model doesn't support free variables, lower bound has to be finite")
+        self.lower_bounds[variable.index] = float(bound)
+
+    def set_upper_bound(self, variable, bound):
+        self.upper_bounds[variable.index] = float(bound)
+
+    def has_bounds(self):
+        return any(l != 0.0 for l in self.lower_bounds) or any(u != float('inf') for u in self.upper_bounds)
+
     def add_constraint(self, constraint):
         self.constraints.append(constraint)
+
+    def add_constraints_from_arrays(self, factors, bounds, types, variables = None):
+        variables = self.variables if variables == None else list(variables)
+        matrix = SparseMatrix.from_matrix(factors)
+        if matrix.shape[1] != len(variables):
+            raise Exception(f"Factors matrix has {matrix.shape[1]} columns, but there are {len(variables)} variables")
+        rows_n = matrix.shape[0]
+        bounds = np.broadcast_to(np.asarray(bounds, dtype=float), (rows_n,)).tolist()
+        types = co.ConstraintType.codes(types, rows_n).tolist()
+
+        # factors are grouped by rows once, every constraint keeps only a view of its slice
+        (rows, cols, values) = matrix.triplets()
+        order = np.argsort(rows, kind='stable')
+        splits = np.searchsorted(rows[order], np.arange(1, rows_n))
+        indexes = np.array([var.index for var in variables], dtype=int)
+        row_indexes = np.split(indexes[cols[order]], splits)
+        row_values = np.split(values[order], splits)
+        for row in range(rows_n):
+            expression = ex.RowExpression(self.variables, row_indexes[row], row_values[row])
+            self.add_constraint(co.Constraint(expression, bounds[row], co.ConstraintType(types[row])))
          
     def maximize(self, expression):
         self.objective = ob.Objective(expression, ob.ObjectiveType.MAX)
@@ -74,6 +155,15 @@ class Model:
     def minimize(self, expression):
         self.objective = ob.Objective(expression, ob.ObjectiveType.MIN)
         
+    def copy(self):
+        copied = type(self)(self.name)
+        copied.variables = list(self.variables)
+        copied.constraints = list(self.constraints)
+        copied.lower_bounds = list(self.lower_bounds)
+        copied.upper_bounds = list(self.upper_bounds)
+        copied.objective = self.objective
+        return copied
+
     def _simplify(self):
         self.constraints = [c.simplify() for c in self.constraints]
         self.objective = self.objective.simplify()
@@ -82,100 +172,128 @@ class Model:
         if not isinstance(other, Model):
             return False
 
-        m1 = self.translate_to_standard_form()
-        m2 = other.translate_to_standard_form()
-
-        if len(m1.variables) != len(m1.variables):
-            return False 
-        
-        if len(m1.constraints) != len(m2.constraints):
-            return False 
-
-        if m1.objective.type != m2.objective.type:
-            return False
-
-        if m1.objective.expression.factors(self) != m2.objective.expression.factors(other):
-            return False 
-
-        for (i, c) in enumerate(m1.constraints):
-            oc = m2.constraints[i]
-            
-            if c.bound != oc.bound:
-                return False 
-
-            if c.type != oc.type:
-                return False
-
-            fs = c.expression.factors(self)
-            ofs = oc.expression.factors(other)
-            if fs != ofs:
-                return False
-
-        return True
+        return all(np.array_equal(a1, a2) for (a1, a2) in zip(ca.canonical_form(self), ca.canonical_form(other)))
         
     def dual(self):
-        self._check_if_creating_dual_is_possible()
-
         primal = self.translate_to_standard_form()
+        primal._split_equalities()
+        # a variable with a negative lower bound can be negative, so its dual constraint is an equality
+        dual_types = [co.ConstraintType.EQ if l < 0.0 else co.ConstraintType.GE for l in primal.lower_bounds]
+        primal._move_bounds_to_constraints()
         dual = Model(f"{primal.name} (dual)")
         self._create_dual_variables(primal, dual)
         self._create_dual_objective(primal, dual)
-        self._create_dual_constraints(primal, dual)
+        self._create_dual_constraints(primal, dual, dual_types)
         return dual
 
     def translate_to_standard_form(self):
-        standard = deepcopy(self)
+        standard = self.copy()
         standard._simplify()
         standard._change_constraints_to_LE()
         standard._change_objective_to_max()
         return standard
         
-    def _check_if_creating_dual_is_possible(self):
-        for constraint in self.constraints:
-            if constraint.type == co.ConstraintType.EQ:
-                raise Exception("Model doesn't support (yet) duals for problems with equality constraints")
-
-    def _create_dual_constraints(self, primal, dual):
-        factors_matrix = np.array([c.expression.factors(primal) for c in primal.constraints])
-        dual_factors_matrix = factors_matrix.T
-        for (i, f) in enumerate(primal.objective.expression.factors(primal)):
-            e = ex.Expression.from_vectors(dual.variables, dual_factors_matrix[i])
-            dual.add_constraint(e >= f)
+    def _split_equalities(self):
+        # a free dual variable y is represented by y' - y'', y' belongs to the equality and y'' to its negated copy
+        equalities = [c for c in self.constraints if c.type == co.ConstraintType.EQ]
+        self.constraints = [co.Constraint(c.expression, c.bound, co.ConstraintType.LE) if c.type == co.ConstraintType.EQ else c for c in self.constraints]
+        self.constraints += [co.Constraint(c.expression * -1, -c.bound, co.ConstraintType.LE) for c in equalities]
+
+    def _move_bounds_to_constraints(self):
+        for var in self.variables:
+            lower, upper = self.lower_bounds[var.index], self.upper_bounds[var.index]
+            if lower != 0.0:
+                self.add_constraint(-1 * var <= -lower)
+            if upper != float('inf'):
+                self.add_constraint(var <= upper)
+            self.lower_bounds[var.index] = 0.0
+            self.upper_bounds[var.index] = float('inf')
+
+    def _create_dual_constraints(self, primal, dual, types):
+        factors_matrix = SparseMatrix.from_constraints(primal.constraints, len(primal.variables))
+        dual.add_constraints_from_arrays(factors_matrix.transpose(), primal.objective.expression.factors(primal), types)
 
     def _create_dual_objective(self, primal, dual):
         dual_obj_factors = [c.bound for c in primal.constraints]
         dual.minimize(ex.Expression.from_vectors(dual.variables, dual_obj_factors))
 
     def _create_dual_variables(self, primal, dual):
-        for (i, _) in enumerate(primal.constraints):
-            dual.create_variable(f"y{i}")
+        dual.create_variables(len(primal.constraints), "y")
 
     def _change_objective_to_max(self):
         if self.objective.type == ob.ObjectiveType.MIN:
-            self.objective.invert()
+            self.objective = self.objective.inverted()
 
     def _change_constraints_to_LE(self):
-        for constraint in self.constraints:
+        for (i, constraint) in enumerate(self.constraints):
             if constraint.type == co.ConstraintType.GE:
-                constraint.invert()
+                self.constraints[i] = constraint.inverted()
 
-    def solve(self):
+    def solve(self, engine = sf.Engine.TABLEAUX, pricing = sf.Pricing.DANTZIG, presolve = False, cache = None, hook = None, retention = sf.Retention.INITIAL_AND_FINAL, strategy = sf.Strategy.PRIMAL):
         if len(self.variables) == 0:
             raise Exception("Can't solve a model without any variables")
 
         if self.objective == None:
             raise Exception("Can't solve a model without an objective")
 
-        solver = s.Solver()
-        return solver.solve(deepcopy(self))
+        if self._solves_dual(sf.Strategy(strategy), engine, presolve):
+            return self._solve_dual(engine, pricing, cache, hook, retention)
+
+        if cache != None:
+            return cache.solve(self, engine, pricing, presolve, hook, retention)
+
+        solver = sf.SolverFactory.solver(engine, pricing, presolve, hook, retention)
+        return solver.solve(self.copy())
+
+    def _solves_dual(self, strategy, engine, presolve):
+        if strategy == sf.Strategy.PRIMAL:
+            return False
+
+        # the assignment is read from the final tableaux of the dual, the sparse engine and the presolve don't keep it
+        possible = engine != sf.Engine.SPARSE and not presolve
+        if strategy == sf.Strategy.DUAL:
+            if not possible:
+                raise Exception("Solving the dual needs its final tableaux, it can't be used with the sparse engine or the presolve")
+            return True
+
+        # the dual tableaux has a row for every variable and a column for every standard form row
+        # (with both halves of the equalities and the moved bounds), the primal one keeps the bounds out of the rows
+        rows_n, columns_n = len(self.constraints), len(self.variables)
+        dual_columns_n = rows_n + sum(c.type == co.ConstraintType.EQ for c in self.constraints)
+        dual_columns_n += sum(l != 0.0 for l in self.lower_bounds) + sum(u != float('inf') for u in self.upper_bounds)
+        return possible and 2 * columns_n * (columns_n + dual_columns_n) < rows_n * (rows_n + columns_n)
+
+    def _solve_dual(self, engine, pricing, cache, hook, retention):
+        dual_retention = retention if retention.keeps_final() else sf.Retention.FINAL
+        dual_solution = self.dual().solve(engine, pricing, False, cache, hook, dual_retention)
+        if not dual_solution.is_feasible:
+            # the model is either unbounded or unfeasible, only solving it tells which one
+            return self.solve(engine, pricing, False, cache, hook, retention)
+
+        if not dual_solution.is_bounded:
+            solution = so.Solution.unfeasible(self.copy(), None, None, None)
+        else:
+            # optimal values of the variables are the shadow prices of their dual constraints
+            assignment = rhs.RHSSensitivityAnalyser().shadow_prices(dual_solution)
+            solution = so.Solution.with_assignment(self.copy(), assignment, None, None, None)
+        solution.iterations = dual_solution.iterations
+        solution.stats = dual_solution.stats
+        solution.history = dual_solution.history
+        return solution
 
     def __str__(self):
         separator = '\n\t'
         text = f'''- name: {self.name}
-- variables:{separator}{separator.join([f"{v.name} >= 0" for v in self.variables])}
+- variables:{separator}{separator.join([self._variable_domain(v) for v in self.variables])}
 - constraints:{separator}{separator.join([str(c) for c in self.constraints])}
 - objective:{separator}{self.objective}
 '''
         return text
+
+    def _variable_domain(self, variable):
+        lower, upper = self.lower_bounds[variable.index], self.upper_bounds[variable.index]
+        if upper == float('inf'):
+            return f"{variable.name} >= {lower:g}"
+        return f"{lower:g} <= {variable.name} <= {upper:g}"
     
 
@@ -0,0 +1,345 @@
+import time
+
+from . import model as m
+from .expressions import constraint as c
+from .expressions import expression as ex
+import numpy as np
+
+eps = 0.0000001
+
+class PresolveStats:
+    """
+        A class to represent statistics of the presolve pass.
+
+        Attributes
+        ----------
+        rows_removed : int
+            how many constraints have been removed (empty, singleton, duplicate and dominated ones)
+        columns_removed : int
+            how many variables have been fixed and removed from the model
+        bounds_tightened : int
+            how many variable bounds have been tightened
+        time : float
+            how long the presolve took (in seconds)
+    """
+
+    def __init__(self):
+        self.rows_removed = 0
+        self.columns_removed = 0
+        self.bounds_tightened = 0
+        self.time = 0.0
+
+    def __str__(self):
+        return f"presolve removed {self.rows_removed} rows and {self.columns_removed} columns, tightened {self.bounds_tightened} bounds in {self.time:.4f}s"
+
+
+class Presolver:
+    """
+        A class reducing the linear programming model before it gets to the simplex tableaux.
+        The reductions are repeated until none of them changes the model:
+        - empty rows are checked and removed
+        - singleton rows are turned into variable bounds
+        - variables with equal bounds are fixed and substituted into the constraints
+        - duplicate (parallel) rows are merged into the tightest one
+        - rows that can't be violated within the variable bounds are removed
+        - bounds implied by the rows are tightened
+
+        Attributes
+        ----------
+        stats : PresolveStats
+            statistics of the last presolve
+        is_feasible : bool
+            False if the presolve proved the model unfeasible
+        columns : list[int]
+            indexes of the original variables kept in the reduced model, columns[i] is the reduced variable i
+        rows : list[int]
+            indexes of the original constraints kept in the reduced model, rows[i] is the reduced constraint i
+            (a merged duplicate row keeps the index of its first occurrence)
+        sources : list[((int, float), (int, float))]
+            original row and scale of the upper and lower side of every row (original row = scale * row),
+            a merged duplicate row takes every side from the row that gave its tightest bound
+        bound_rows : list[(int, int, int, float)]
+            bounds set by the rows in order, as (column, 1 = upper / -1 = lower, original row, factor of the column in it)
+
+        Methods
+        -------
+        presolve(model: Model) -> Model | None:
+            returns the reduced model, or None if the model has been proven unfeasible
+        postsolve(assignment: list[float]) -> list[float]:
+            maps assignment of the reduced model back to the variables of the original model
+        postsolve_duals(duals: list[float]) -> list[float]:
+            maps shadow prices of the reduced model rows back to all the original constraints,
+            the removed rows get zero, the rows turned into active bounds get the reduced costs of their variables
+    """
+
+    max_rounds = 32
+
+    def presolve(self, model):
+        start = time.time()
+        self.stats = PresolveStats()
+        self._load(model)
+
+        self.is_feasible = True
+        for _ in range(self.max_rounds):
+            changed = self._fix_variables()
+            changed = self._remove_empty_rows() or changed
+            changed = self._remove_singleton_rows() or changed
+            changed = self._merge_duplicate_rows() or changed
+            changed = self._remove_dominated_rows() or changed
+            changed = self._tighten_bounds() or changed
+            if not self.is_feasible or not changed:
+                break
+
+        self.columns = list(np.flatnonzero(self.active_columns))
+        self.rows = list(np.flatnonzero(self.active_rows))
+        self.stats.rows_removed = len(self.active_rows) - len(self.rows)
+        self.stats.columns_removed = len(self.active_columns) - len(self.columns)
+        reduced_model = self._reduced_model(model) if self.is_feasible else None
+        self.stats.time = time.time() - start
+        return reduced_model
+
+    def postsolve(self, assignment):
+        values = np.array(self.fixed_values)
+        values[self.columns] = assignment
+        return values.tolist()
+
+    def postsolve_duals(self, duals):
+        # everything is computed as for a maximized model, the reduced costs of the kept variables are the ones of the reduced model
+        y = np.zeros(len(self.active_rows))
+        for (row, dual) in zip(self.rows, self.objective_sign * np.array(duals, dtype=float)):
+            (source, scale) = self.sources[row][0 if dual > 0 else 1]
+            y[source] += dual / scale
+
+        # the last bound set on a side is the one the solution sees, a variable with an improving reduced cost is kept there by its row
+        reduced_costs = self.costs - self.original_a.T.dot(y)
+        seen = set()
+        for (col, side, source, factor) in reversed(self.bound_rows):
+            if (col, side) in seen:
+                continue
+            seen.add((col, side))
+            if side * reduced_costs[col] > eps:
+                dual = reduced_costs[col] / factor
+                y[source] += dual
+                reduced_costs -= dual * self.original_a[source]
+        return [float(dual) + 0.0 for dual in self.objective_sign * y]
+
+    def _load(self, model):
+        simplified = [constraint.simplify() for constraint in model.constraints]
+        self.a = np.array([constraint.expression.factors(model) for constraint in simplified], dtype=float).reshape(len(simplified), len(model.variables))
+        self.b = np.array([constraint.bound for constraint in simplified], dtype=float)
+        # 1 = ">=", 0 = "=", -1 = "<="
+        self.types = np.array([constraint.type.value for constraint in simplified], dtype=int)
+        self.lower_bounds = np.array(model.lower_bounds, dtype=float)
+        self.upper_bounds = np.array(model.upper_bounds, dtype=float)
+        self.fixed_values = np.zeros(len(model.variables))
+        self.active_rows = np.ones(len(simplified), dtype=bool)
+        self.active_columns = np.ones(len(model.variables), dtype=bool)
+        # kept for the dual postsolve, the presolve changes the rows in place
+        self.original_a = self.a.copy()
+        self.objective_sign = model.objective.type.value
+        self.costs = self.objective_sign * np.array(model.objective.expression.factors(model), dtype=float)
+        self.sources = [((row, 1.0), (row, 1.0)) for row in range(len(simplified))]
+        self.bound_rows = []
+
+    def _unfeasible(self):
+        self.is_feasible = False
+        return True
+
+    def _fix_variables(self):
+        fixed = self.active_columns & (self.upper_bounds - self.lower_bounds <= eps)
+        if not fixed.any():
+            return False
+        if (self.upper_bounds[fixed] < self.lower_bounds[fixed] - eps).any():
+            return self._unfeasible()
+
+        self.fixed_values[fixed] = self.lower_bounds[fixed]
+        self.b -= self.a[:, fixed].dot(self.lower_bounds[fixed])
+        self.a[:, fixed] = 0.0
+        self.active_columns[fixed] = False
+        return True
+
+    def _row_nonzeros(self):
+        return (np.abs(self.a) > eps) & self.active_columns
+
+    def _remove_empty_rows(self):
+        empty = self.active_rows & ~self._row_nonzeros().any(axis=1)
+        if not empty.any():
+            return False
+        if not self._is_satisfied(np.zeros(len(self.b)), empty):
+            return self._unfeasible()
+        self.active_rows[empty] = False
+        return True
+
+    def _is_satisfied(self, activity, rows):
+        satisfied = np.where(self.types <= 0, activity <= self.b + eps, True) & np.where(self.types >= 0, activity >= self.b - eps, True)
+        return satisfied[rows].all()
+
+    def _remove_singleton_rows(self):
+        nonzeros = self._row_nonzeros()
+        singletons = np.flatnonzero(self.active_rows & (nonzeros.sum(axis=1) == 1))
+        for row in singletons:
+            col = np.flatnonzero(nonzeros[row])[0]
+            factor = self.a[row, col]
+            value = self.b[row] / factor
+            row_type = self.types[row] if factor > 0 else -self.types[row]
+            if row_type <= 0:
+                self._set_upper_bound(col, value, row, factor)
+            if row_type >= 0:
+                self._set_lower_bound(col, value, row, factor)
+            self.active_rows[row] = False
+        if (self.upper_bounds < self.lower_bounds - eps).any():
+            return self._unfeasible()
+        return len(singletons) > 0
+
+    def _set_upper_bound(self, col, value, row, factor):
+        if value < self.upper_bounds[col] - eps:
+            self.upper_bounds[col] = value
+            self._add_bound_row(col, 1, row, factor)
+            return True
+        return False
+
+    def _set_lower_bound(self, col, value, row, factor):
+        if value > self.lower_bounds[col] + eps:
+            self.lower_bounds[col] = value
+            self._add_bound_row(col, -1, row, factor)
+            return True
+        return False
+
+    def _add_bound_row(self, col, side, row, factor):
+        """
+            _add_bound_row(col: int, side: int, row: int, factor: float):
+                remembers that the row with the given factor of the column has set its upper (1) or lower (-1) bound
+        """
+        # an upper bound of a variable with a positive factor comes from the upper side of the row
+        (source, scale) = self.sources[row][0 if side * factor > 0 else 1]
+        self.bound_rows.append((col, side, source, factor * scale))
+
+    def _merge_duplicate_rows(self):
+        # rows are scaled so their first nonzero factor is 1, parallel rows become identical
+        nonzeros = self._row_nonzeros()
+        groups = dict()
+        for row in np.flatnonzero(self.active_rows & nonzeros.any(axis=1)):
+            first = self.a[row, np.flatnonzero(nonzeros[row])[0]]
+            key = tuple(np.round(self.a[row] / first, 9) + 0.0)
+            groups.setdefault(key, []).append((row, first))
+
+        changed = False
+        for rows in groups.values():
+            if len(rows) < 2:
+                continue
+            lower, upper = -np.inf, np.inf
+            lower_source, upper_source = None, None
+            for (row, first) in rows:
+                bound = self.b[row] / first
+                row_type = self.types[row] if first > 0 else -self.types[row]
+                # dividing by a negative factor swaps the sides of the row
+                (upper_side, lower_side) = self.sources[row] if first > 0 else reversed(self.sources[row])
+                if row_type <= 0 and bound < upper:
+                    upper, upper_source = bound, (upper_side[0], upper_side[1] * first)
+                if row_type >= 0 and bound > lower:
+                    lower, lower_source = bound, (lower_side[0], lower_side[1] * first)
+                self.active_rows[row] = False
+            if lower > upper + eps:
+                return self._unfeasible()
+
+            (kept, first) = rows[0]
+            self.active_rows[kept] = True
+            self.a[kept] = self.a[kept] / first
+            kept_n = 1
+            if upper - lower <= eps:
+                self.b[kept], self.types[kept] = lower, 0
+                self.sources[kept] = (upper_source, lower_source)
+            elif upper < np.inf:
+                self.b[kept], self.types[kept] = upper, -1
+                self.sources[kept] = (upper_source, upper_source)
+                if lower > -np.inf:
+                    # the lower side needs its own row, the one of the second occurrence is reused
+                    second = rows[1][0]
+                    self.active_rows[second] = True
+                    self.a[second] = self.a[kept]
+                    self.b[second], self.types[second] = lower, 1
+                    self.sources[second] = (lower_source, lower_source)
+                    kept_n = 2
+            else:
+                self.b[kept], self.types[kept] = lower, 1
+                self.sources[kept] = (lower_source, lower_source)
+            changed = changed or len(rows) > kept_n
+        return changed
+
+    def _activity_bounds(self):
+        positive = np.where(self.a > 0, self.a, 0.0)
+        negative = np.where(self.a < 0, self.a, 0.0)
+        with np.errstate(invalid='ignore'):
+            lowers = np.where(self.active_columns, self.lower_bounds, 0.0)
+            uppers = np.where(self.active_columns, self.upper_bounds, 0.0)
+            min_activity = positive.dot(lowers) + self._dot_with_infinities(negative, uppers)
+            max_activity = self._dot_with_infinities(positive, uppers) + negative.dot(lowers)
+        return (min_activity, max_activity)
+
+    def _dot_with_infinities(self, factors, values):
+        # 0 * inf has to be 0 here, the variable doesn't occur in the row
+        finite = np.isfinite(values)
+        result = factors[:, finite].dot(values[finite])
+        infinite = (factors[:, ~finite] != 0).any(axis=1)
+        return np.where(infinite, np.sign(factors[:, ~finite].sum(axis=1)) * np.inf, result)
+
+    def _remove_dominated_rows(self):
+        (min_activity, max_activity) = self._activity_bounds()
+        less = self.active_rows & (self.types <= 0)
+        greater = self.active_rows & (self.types >= 0)
+        if (less & (min_activity > self.b + eps)).any() or (greater & (max_activity < self.b - eps)).any():
+            return self._unfeasible()
+
+        dominated = self.active_rows & np.where(less, max_activity <= self.b + eps, True) & np.where(greater, min_activity >= self.b - eps, True)
+        self.active_rows[dominated] = False
+        return dominated.any()
+
+    def _tighten_bounds(self):
+        tightened = 0
+        # ">=" rows are handled as "<=" rows multiplied by -1
+        for row in np.flatnonzero(self.active_rows):
+            for (sign, row_type) in [(1.0, -1), (-1.0, 1)]:
+                if self.types[row] != 0 and self.types[row] != row_type:
+                    continue
+                factors = sign * self.a[row]
+                bound = sign * self.b[row]
+                activity = self._min_activity(factors)
+                if activity == -np.inf:
+                    continue
+                for col in np.flatnonzero((np.abs(factors) > eps) & self.active_columns):
+                    # minimal activity of the rest of the row
+                    rest = activity - factors[col] * (self.lower_bounds[col] if factors[col] > 0 else self.upper_bounds[col])
+                    if factors[col] > 0:
+                        tightened += self._set_upper_bound(col, (bound - rest) / factors[col], row, self.a[row, col])
+                    else:
+                        tightened += self._set_lower_bound(col, (bound - rest) / factors[col], row, self.a[row, col])
+        self.stats.bounds_tightened += tightened
+        if (self.upper_bounds < self.lower_bounds - eps).any():
+            return self._unfeasible()
+        return tightened > 0
+
+    def _min_activity(self, factors):
+        active = self.active_columns & (np.abs(factors) > eps)
+        values = np.where(factors > 0, self.lower_bounds, self.upper_bounds)[active]
+        if not np.isfinite(values).all():
+            return -np.inf
+        return factors[active].dot(values)
+
+    def _reduced_model(self, model):
+        reduced_model = m.Model(model.name)
+        variables = [reduced_model.create_variable(model.variables[col].name) for col in self.columns]
+        for (var, col) in zip(variables, self.columns):
+            reduced_model.set_lower_bound(var, self.lower_bounds[col])
+            reduced_model.set_upper_bound(var, self.upper_bounds[col])
+
+        for row in self.rows:
+            expression = self._expression(variables, self.a[row, self.columns])
+            reduced_model.add_constraint(c.Constraint(expression, self.b[row], c.ConstraintType(int(self.types[row]))))
+
+        objective_factors = np.array(model.objective.expression.factors(model))[self.columns]
+        reduced_model.objective = model.objective.simplify()
+        reduced_model.objective.expression = self._expression(variables, objective_factors)
+        return reduced_model
+
+    def _expression(self, variables, factors):
+        return ex.Expression(*[float(factor) * var for (var, factor) in zip(variables, factors) if factor != 0])
@@ -0,0 +1,147 @@
+from enum import Enum
+import numpy as np
+
+eps = 0.0000001
+
+class PricingRule:
+    """
+        A base class for the rules choosing entering and leaving variables in the simplex method.
+        Rules work on plain vectors, so they can be shared by the tableaux and revised engines.
+        The default behaviour is the classic Dantzig rule: the most negative reduced cost enters
+        and the last row with the minimal quotient leaves.
+
+        Methods
+        -------
+        reset(columns_n: int):
+            prepares the rule for a new simplex phase with the given number of columns
+        choose_entering_variable(reduced_costs: numpy.Array, column_norms: Callable[[], numpy.Array]) -> int:
+            returns index of the column that should enter the basis,
+            column_norms lazily returns squared norms of all the (current) tableaux columns
+        choose_leaving_variable(quotients: numpy.Array, basis: numpy.Array) -> int:
+            returns basis position (0-based row) that should leave the basis,
+            quotients contain ratios for every basis position (inf if the row doesn't limit the entering variable)
+        update(entering: int, leaving: int, pivot_row: Callable[[], numpy.Array], column_products: Callable[[], numpy.Array]):
+            called right before the pivot, pivot_row lazily returns the current pivot row (without the right hand side),
+            column_products lazily returns dot products of every current tableaux column with the entering one
+    """
+
+    def reset(self, columns_n):
+        pass
+
+    def choose_entering_variable(self, reduced_costs, column_norms):
+        return np.flatnonzero(reduced_costs <= reduced_costs.min() + eps)[0]
+
+    def choose_leaving_variable(self, quotients, basis):
+        return np.flatnonzero(quotients <= quotients.min() + eps)[-1]
+
+    def update(self, entering, leaving, pivot_row, column_products):
+        pass
+
+
+class DantzigRule(PricingRule):
+    """
+        Dantzig's rule: the variable with the most negative reduced cost enters the basis.
+    """
+    pass
+
+
+class BlandRule(PricingRule):
+    """
+        Bland's anti-cycling rule: among improving variables the one with the lowest index enters,
+        among tied leaving candidates the basic variable with the lowest index leaves.
+    """
+
+    def choose_entering_variable(self, reduced_costs, column_norms):
+        return np.flatnonzero(reduced_costs < -eps)[0]
+
+    def choose_leaving_variable(self, quotients, basis):
+        tied = np.flatnonzero(quotients <= quotients.min() + eps)
+        return tied[np.argmin(basis[tied])]
+
+
+class SteepestEdgeRule(PricingRule):
+    """
+        Steepest-edge rule: the entering variable maximizes the improvement per unit of the edge length,
+        i.e. minimizes d_j / sqrt(1 + ||alpha_j||^2), where alpha_j is the tableaux column.
+        The column norms are computed only at the first choice of a phase, after every pivot
+        they are updated by the exact Goldfarb-Reid recurrence.
+
+        Attributes
+        ----------
+        weights : numpy.Array | None
+            1 + ||alpha_j||^2 of every column (None until the first choice of the phase)
+    """
+
+    def reset(self, columns_n):
+        self.weights = None
+
+    def choose_entering_variable(self, reduced_costs, column_norms):
+        if self.weights is None:
+            self.weights = 1.0 + column_norms()
+        improving = reduced_costs < -eps
+        scores = np.zeros(len(reduced_costs))
+        scores[improving] = reduced_costs[improving] / np.sqrt(self.weights[improving])
+        return scores.argmin()
+
+    def update(self, entering, leaving, pivot_row, column_products):
+        if self.weights is None:
+            return
+        row = pivot_row()
+        pivot = row[entering]
+        ratios = row / pivot
+        entering_weight = self.weights[entering]
+        # alpha_j' = alpha_j - ratio_j * alpha_q (with ratio_j in the pivot row), so its norm needs alpha_j * alpha_q
+        self.weights = np.maximum(self.weights - 2.0 * ratios * column_products() + ratios ** 2 * entering_weight, 1.0 + ratios ** 2)
+        self.weights[leaving] = max(entering_weight / pivot ** 2, 1.0)
+        self.weights[entering] = 1.0
+
+
+class DevexRule(PricingRule):
+    """
+        Devex rule (Forrest-Goldfarb): approximates steepest edge with reference weights,
+        that are cheaply updated from the pivot row after every pivot.
+
+        Attributes
+        ----------
+        weights : numpy.Array
+            reference weight of every column
+    """
+
+    def reset(self, columns_n):
+        self.weights = np.ones(columns_n)
+
+    def choose_entering_variable(self, reduced_costs, column_norms):
+        improving = reduced_costs < -eps
+        scores = np.zeros(len(reduced_costs))
+        scores[improving] = reduced_costs[improving] ** 2 / self.weights[improving]
+        return scores.argmax()
+
+    def update(self, entering, leaving, pivot_row, column_products):
+        row = pivot_row()
+        pivot = row[entering]
+        entering_weight = self.weights[entering]
+        self.weights = np.maximum(self.weights, (row / pivot) ** 2 * entering_weight)
+        self.weights[leaving] = max(entering_weight / pivot ** 2, 1.0)
+        self.weights[entering] = 1.0
+
+
+class Pricing(Enum):
+    """
+        An enum representing all the available pricing rules:
+        - DANTZIG = most negative reduced cost
+        - STEEPEST_EDGE = best improvement per unit of the edge length
+        - DEVEX = approximate steepest edge with reference weights
+        - BLAND = lowest index, guarantees no cycling
+    """
+    DANTZIG = "dantzig"
+    STEEPEST_EDGE = "steepest-edge"
+    DEVEX = "devex"
+    BLAND = "bland"
+
+    def rule(self):
+        return {
+            Pricing.DANTZIG: DantzigRule,
+            Pricing.STEEPEST_EDGE: SteepestEdgeRule,
+            Pricing.DEVEX: DevexRule,
+            Pricing.BLAND: BlandRule
+        }[self]()
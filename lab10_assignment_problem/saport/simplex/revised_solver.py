@@ -0,0 +1,397 @@
+from . import solver as s
+from . import solution as sol
+from . import tableaux as t
+from . import pricing as p
+from . import stats as st
+from . import history as hi
+from .factorization import BasisFactorization
+from .sparse import SparseMatrix
+from .expressions import constraint as c
+import numpy as np
+
+eps = 0.0000001
+
+class RevisedSolver(s.Solver):
+    """
+        A class to represent a revised simplex solver.
+        Instead of updating the whole tableaux on every pivot, it keeps a factorization of the basis matrix
+        and computes only the reduced costs and the entering column. The full tableaux is built only
+        for the returned solution, so the analysers can work the same way as for the tableaux solver.
+
+        Attributes
+        ----------
+        refactorization_period : int
+            how many pivots are done before the basis matrix is factorized from scratch
+
+        Methods
+        -------
+        __init__(pricing: Pricing = Pricing.DANTZIG, presolve: bool = False, hook: SolverHook = None, retention: Retention = Retention.INITIAL_AND_FINAL, refactorization_period: int = 64) -> RevisedSolver:
+            constructs a new solver with the given pricing rule, presolve option, hook, tableaux retention and refactorization period
+        solve(model: Model) -> Solution:
+            solves the given model and return the first solution
+    """
+
+    def __init__(self, pricing = p.Pricing.DANTZIG, presolve = False, hook = None, retention = hi.Retention.INITIAL_AND_FINAL, refactorization_period = 64):
+        super().__init__(pricing, presolve, hook, retention)
+        self.refactorization_period = refactorization_period
+
+    def _solve(self, model):
+        normal_model = self._normalize(model)
+        columns_n = len(normal_model.variables)
+
+        if len(self.slack_variables) < len(normal_model.constraints):
+            presolve_model = self._create_presolve_model(normal_model)
+            self._load_arrays(presolve_model)
+            self._start_basis(self._initial_basis(presolve_model))
+
+            if not self._phase_one(columns_n):
+                tableaux = None
+                if self.retention.keeps_final():
+                    with self.stats.timer("tableaux"):
+                        tableaux = self._tableaux(presolve_model, self._phase_one_costs(columns_n), range(self.a.shape[1]))
+                return sol.Solution.unfeasible(model, tableaux, tableaux, normal_model)
+        else:
+            self._load_arrays(normal_model)
+            self._start_basis(self._initial_basis(normal_model))
+
+        columns = range(columns_n)
+        costs = np.zeros(self.a.shape[1])
+        costs[columns] = normal_model.objective.expression.factors(normal_model)
+        candidates = np.zeros(self.a.shape[1], dtype=bool)
+        candidates[columns] = True
+
+        # the tableaux are built only if the solution keeps them
+        (initial_tableaux, tableaux) = (None, None)
+        if self.retention.keeps_initial():
+            with self.stats.timer("tableaux"):
+                initial_tableaux = self._tableaux(normal_model, costs, columns)
+        optimal = self._phase_two(costs, candidates)
+        if self.retention.keeps_final():
+            with self.stats.timer("tableaux"):
+                tableaux = self._tableaux(normal_model, costs, columns)
+        if optimal == False:
+            return sol.Solution.unbounded(model, initial_tableaux, tableaux, normal_model)
+        return self._create_solution(self._assignment().tolist(), model, initial_tableaux, tableaux, normal_model)
+
+    def _load_arrays(self, model):
+        self.a = self._constraints_matrix(model)
+        self.b = np.array([c.bound for c in model.constraints], dtype=float)
+        self.upper_bounds = np.array(model.upper_bounds, dtype=float)
+        self.at_upper = np.zeros(self.a.shape[1], dtype=bool)
+
+    def _constraints_matrix(self, model):
+        return np.array([c.expression.factors(model) for c in model.constraints], dtype=float).reshape(len(model.constraints), len(model.variables))
+
+    def _start_basis(self, basis):
+        self.basis = np.array(basis, dtype=int)
+        self._refactorize()
+
+    def _create_presolve_model(self, normalized_model):
+        presolve_model = normalized_model.copy()
+        self.artificial_variables = self._add_artificial_variables(presolve_model)
+        return presolve_model
+
+    def _add_artificial_variables(self, model):
+        artificial_variables = dict()
+        for (i,constraint) in enumerate(model.constraints.copy()):
+            if i in self.slack_variables.values():
+                continue
+            artificial_var = model.create_variable(f"R{i}")
+            artificial_variables[artificial_var] = i
+            model.constraints[i] = c.Constraint(constraint.expression + artificial_var, constraint.bound, constraint.type)
+        return artificial_variables
+
+    def _phase_one(self, columns_n):
+        """
+            _phase_one(columns_n: int) -> bool:
+                minimizes the artificial variables (columns from columns_n on) and drives them out of the basis,
+                returns False if they can't reach zero, i.e. the model is unfeasible
+        """
+        self._phase = st.Phase.ONE
+        with self.stats.timer("phase_one"):
+            self._optimize_basis(self._phase_one_costs(columns_n), np.ones(self.a.shape[1], dtype=bool))
+            if self._artifical_variables_are_positive(columns_n):
+                return False
+            self._drive_out_artificial_variables(columns_n)
+            return True
+
+    def _phase_two(self, costs, candidates):
+        """
+            _phase_two(costs: numpy.Array, candidates: numpy.Array) -> bool:
+                optimizes the costs over the candidate columns, returns False if the model is unbounded
+        """
+        self._phase = st.Phase.TWO
+        with self.stats.timer("phase_two"):
+            return self._optimize_basis(costs, candidates)
+
+    def _phase_one_costs(self, columns_n):
+        costs = np.zeros(self.a.shape[1])
+        costs[columns_n:] = -1.0
+        return costs
+
+    def _refactorize(self):
+        self.factorization = BasisFactorization(self._basis_matrix(), self.refactorization_period)
+        self.basic_values = self.factorization.ftran(self._bounded_rhs())
+
+    def _bounded_rhs(self):
+        values = np.zeros(self.a.shape[1])
+        values[self.at_upper] = self.upper_bounds[self.at_upper]
+        return self.b - self._product(values)
+
+    def _column(self, col):
+        return self.a[:, col]
+
+    def _basis_matrix(self):
+        return self.a[:, self.basis]
+
+    def _product(self, values):
+        return self.a.dot(values)
+
+    def _row_product(self, y):
+        return y.dot(self.a)
+
+    def _column_norms(self, candidates):
+        return np.where(candidates, (np.linalg.solve(self._basis_matrix(), self.a) ** 2).sum(axis=0), 0.0)
+
+    def _directions(self):
+        # nonbasic variables at their upper bounds can only decrease
+        return np.where(self.at_upper, -1.0, 1.0)
+
+    def _reduced_costs(self, costs):
+        y = self.factorization.btran(costs[self.basis])
+        reduced_costs = self._row_product(y) - costs
+        reduced_costs[self.basis] = 0.0
+        return reduced_costs
+
+    def _optimize_basis(self, costs, candidates):
+        rule = self.pricing.rule()
+        rule.reset(self.a.shape[1])
+        column_norms = lambda: self._column_norms(candidates)
+
+        while True:
+            directions = self._directions()
+            reduced_costs = np.where(candidates, directions * self._reduced_costs(costs), 0.0)
+            if reduced_costs.min() >= -eps:
+                return True
+
+            col = rule.choose_entering_variable(reduced_costs, column_norms)
+            alpha = self.factorization.ftran(self._column(col))
+            quotients = self._quotients(directions[col] * alpha)
+            if self.upper_bounds[col] == np.inf and quotients.min(initial=np.inf) == np.inf:
+                return False
+
+            if self.upper_bounds[col] < quotients.min(initial=np.inf) - eps:
+                # entering variable reaches its other bound before any basic variable leaves
+                self.basic_values -= directions[col] * self.upper_bounds[col] * alpha
+                self.at_upper[col] = not self.at_upper[col]
+                self._pivoted(col, None, False, None, self.basis)
+                continue
+
+            position = rule.choose_leaving_variable(quotients, self.basis)
+            leaving = self.basis[position]
+            # alpha_j * alpha_q = a_j * (B^-T alpha_q), signs follow the directions the same way as in the pivot row
+            rule.update(col, leaving, lambda: directions * self._row(position), lambda: directions * directions[col] * self._row_product(self.factorization.btran(alpha)))
+            self._pivot(position, col, alpha, quotients[position])
+            self._pivoted(col, leaving, quotients[position] <= eps, None, self.basis)
+
+    def _quotients(self, alpha):
+        quotients = np.full(len(alpha), np.inf)
+
+        # basic variable decreases to zero
+        decreasing = alpha > eps
+        quotients[decreasing] = self.basic_values[decreasing] / alpha[decreasing]
+
+        # basic variable increases to its upper bound
+        basic_bounds = self.upper_bounds[self.basis]
+        increasing = (alpha < -eps) & (basic_bounds < np.inf)
+        quotients[increasing] = (basic_bounds[increasing] - self.basic_values[increasing]) / -alpha[increasing]
+        return np.maximum(quotients, 0.0)
+
+    def _row(self, position):
+        unit = np.zeros(len(self.basis))
+        unit[position] = 1.0
+        return self._row_product(self.factorization.btran(unit))
+
+    def _pivot(self, position, col, alpha, theta):
+        direction = -1.0 if self.at_upper[col] else 1.0
+        leaving = self.basis[position]
+        leaves_at_upper = direction * alpha[position] < 0 and self.upper_bounds[leaving] < np.inf
+
+        self.basic_values -= direction * theta * alpha
+        self.basic_values[position] = self.upper_bounds[col] - theta if self.at_upper[col] else theta
+        self.basis[position] = col
+        self.at_upper[col] = False
+        self.at_upper[leaving] = leaves_at_upper
+
+        if self.factorization.needs_refactorization():
+            self._refactorize()
+        else:
+            self.factorization.update(position, alpha)
+
+    def _artifical_variables_are_positive(self, columns_n):
+        return any(self.basic_values[p] > eps for (p, col) in enumerate(self.basis) if col >= columns_n)
+
+    def _drive_out_artificial_variables(self, columns_n):
+        for (position, col) in enumerate(self.basis):
+            if col < columns_n:
+                continue
+            row = self._row(position)[:columns_n]
+            row[self.basis[self.basis < columns_n]] = 0.0
+            candidates = np.flatnonzero(np.abs(row) > eps)
+            # if there is no candidate the constraint is redundant and the artificial variable stays in the basis at zero
+            if len(candidates) > 0:
+                entering = candidates[0]
+                self._pivot(position, entering, self.factorization.ftran(self._column(entering)), 0.0)
+                # the artificial variable leaves at zero, so the pivot is degenerate
+                self._pivoted(entering, col, True, None, self.basis)
+
+    def _assignment(self):
+        assignment = np.zeros(self.a.shape[1])
+        assignment[self.at_upper] = self.upper_bounds[self.at_upper]
+        assignment[self.basis] = self.basic_values
+        return assignment
+
+    def _tableaux(self, model, costs, columns):
+        columns = list(columns)
+        body = np.linalg.solve(self.a[:, self.basis], np.column_stack([self.a[:, columns], self.b]))
+        cost_row = costs[self.basis].dot(body) - np.append(costs[columns], 0.0)
+        table = np.vstack([cost_row, body])
+        basis = [col if col < len(columns) else -1 for col in self.basis]
+
+        # basic columns are unit vectors by definition, don't leave round-off in them
+        for (position, col) in enumerate(basis):
+            if col >= 0:
+                table[:, col] = 0.0
+                table[position + 1, col] = 1.0
+
+        # variables at their upper bounds are represented by the flipped columns (x = u - x')
+        upper_bounds = self.upper_bounds[columns]
+        flipped = self.at_upper[columns]
+        table[:, -1] -= table[:, :-1][:, flipped].dot(upper_bounds[flipped])
+        table[:, :-1][:, flipped] *= -1
+        return t.Tableaux(model, table, basis, upper_bounds, flipped)
+
+
+class SparseRevisedSolver(RevisedSolver):
+    """
+        A revised simplex solver keeping the constraints matrix in the sparse (compressed column) format.
+        The matrix is built directly from the constraint expressions, it's never densified and neither is the tableaux,
+        only the basis matrix is factorized as a dense one. Memory used by the matrix scales with the number of nonzeros.
+        Because of that the solutions have no tableaux (tableaux and initial_tableaux are None),
+        so they can't be used by the analysers.
+
+        Methods
+        -------
+        __init__(pricing: Pricing = Pricing.DANTZIG, presolve: bool = False, hook: SolverHook = None, retention: Retention = Retention.INITIAL_AND_FINAL, refactorization_period: int = 64) -> SparseRevisedSolver:
+            constructs a new solver with the given pricing rule, presolve option, hook, tableaux retention and refactorization period
+        solve(model: Model) -> Solution:
+            solves the given model and return the first solution
+        solve_arrays(model: ArrayModel) -> Solution:
+            solves the array model straight from its arrays, without building any expressions,
+            the hook is notified about the normalization with None as the normal model
+    """
+
+    def solve_arrays(self, model):
+        start = self._start_solve()
+        return self._finish_solve(self._solve_arrays(model), start)
+
+    def _solve_arrays(self, model):
+        with self.stats.timer("normalize"):
+            (basis, costs, columns_n) = self._normalize_arrays(model)
+        if self.hook != None:
+            self.hook.on_normalize(model, None)
+        self._start_basis(basis)
+        if self.a.shape[1] > columns_n and not self._phase_one(columns_n):
+            return sol.Solution.unfeasible(model, None, None, None)
+
+        candidates = np.zeros(self.a.shape[1], dtype=bool)
+        candidates[:columns_n] = True
+        if self._phase_two(costs, candidates) == False:
+            return sol.Solution.unbounded(model, None, None, None)
+
+        assignment = self._assignment()[:len(model.variables)] + self.lower_bounds
+        return sol.Solution.with_assignment(model, assignment.tolist(), None, None, None)
+
+    def _normalize_arrays(self, model):
+        """
+            _normalize_arrays(model: ArrayModel) -> (numpy.Array, numpy.Array, int):
+                loads the normalized arrays of the model the same way _normalize_model and _create_presolve_model
+                transform a Model, returns the initial basis, the costs and the number of non-artificial columns
+        """
+        (rows, cols, values) = (model.rows, model.columns, model.values)
+        b = np.array(model.bounds, dtype=float)
+        types = np.array(model.types, dtype=int)
+        lower_bounds = np.array(model.lower_bounds, dtype=float)
+        upper_bounds = np.array(model.upper_bounds, dtype=float)
+        variables_n = len(lower_bounds)
+
+        # crossed bounds make the model unfeasible, the first phase will find that out
+        crossed = np.flatnonzero(upper_bounds < lower_bounds)
+        rows = np.concatenate([rows, len(b) + np.arange(len(crossed))])
+        cols = np.concatenate([cols, crossed])
+        values = np.concatenate([values, np.ones(len(crossed))])
+        b = np.concatenate([b, upper_bounds[crossed]])
+        types = np.concatenate([types, np.full(len(crossed), c.ConstraintType.LE.value)])
+        upper_bounds[crossed] = np.inf
+
+        # standard form has only "<=" and "=" rows
+        signs = np.where(types == c.ConstraintType.GE.value, -1.0, 1.0)
+        b = signs * b
+        # x >= l is replaced with x' = x - l >= 0
+        b -= np.bincount(rows, weights=signs[rows] * values * lower_bounds[cols], minlength=len(b))
+        upper_bounds -= lower_bounds
+        # rows with negative bounds are inverted
+        negative = b < 0
+        signs[negative] *= -1.0
+        b[negative] *= -1.0
+        types = np.where(types == c.ConstraintType.EQ.value, types, np.where(negative, c.ConstraintType.GE.value, c.ConstraintType.LE.value))
+        values = signs[rows] * values
+
+        # slack variables of the "<=" rows, surplus variables of the ">=" rows and then artificial variables of the rows without a slack
+        less = np.flatnonzero(types == c.ConstraintType.LE.value)
+        greater = np.flatnonzero(types == c.ConstraintType.GE.value)
+        others = np.flatnonzero(types != c.ConstraintType.LE.value)
+        slack_columns = variables_n + np.arange(len(less))
+        columns_n = variables_n + len(less) + len(greater)
+        artificial_columns = columns_n + np.arange(len(others))
+        columns = columns_n + len(others)
+
+        rows = np.concatenate([rows, less, greater, others])
+        cols = np.concatenate([cols, slack_columns, variables_n + len(less) + np.arange(len(greater)), artificial_columns])
+        values = np.concatenate([values, np.ones(len(less)), -np.ones(len(greater)), np.ones(len(others))])
+        self.a = SparseMatrix.from_triplets(rows, cols, values, (len(b), columns))
+        self.b = b
+        self.upper_bounds = np.concatenate([upper_bounds, np.full(columns - variables_n, np.inf)])
+        self.at_upper = np.zeros(columns, dtype=bool)
+        self.lower_bounds = lower_bounds
+
+        basis = np.zeros(len(b), dtype=int)
+        basis[less] = slack_columns
+        basis[others] = artificial_columns
+        # the normal model always maximizes
+        costs = np.zeros(columns)
+        costs[:variables_n] = model.objective_type.value * model.objective_factors
+        return (basis, costs, columns_n)
+
+    def _constraints_matrix(self, model):
+        return SparseMatrix.from_constraints(model.constraints, len(model.variables))
+
+    def _column(self, col):
+        return self.a.column(col)
+
+    def _basis_matrix(self):
+        return self.a.columns(self.basis)
+
+    def _product(self, values):
+        return self.a.dot(values)
+
+    def _row_product(self, y):
+        return self.a.rdot(y)
+
+    def _column_norms(self, candidates):
+        # summed over the rows of B^-1 A, so it takes one btran per row instead of one ftran per column
+        norms = sum(self._row(position) ** 2 for position in range(len(self.basis)))
+        return np.where(candidates, norms, 0.0)
+
+    def _tableaux(self, model, costs, columns):
+        return None
@@ -0,0 +1,241 @@
+from . import model as m
+from . import solverfactory as sf
+from . import solution as s
+from .expressions import constraint as c
+from .expressions import expression as ex
+from .expressions import objective as o
+import numpy as np
+
+
+class SolverSession:
+    """
+        A class to represent a solving session over one model, that is edited between the solves.
+        The session keeps the normalized model and the last optimal tableaux, every edit is applied directly
+        to them and the next solve re-optimizes from the last basis: with the primal simplex if the tableaux
+        is still feasible, with the dual simplex if it's still optimal. If neither is possible
+        (e.g. after removing an equality constraint) the model is solved from scratch.
+
+        Attributes
+        ----------
+        model : Model
+            the edited model, the session changes it in place
+        solver : Solver
+            solver used to solve the model from scratch and to re-optimize it
+        solution : Solution | None
+            the last solution, None before the first solve
+        iterations : int
+            number of pivots done during the whole session
+        cold_solves : int
+            how many times the model had to be solved from scratch
+
+        Methods
+        -------
+        __init__(model: Model, engine: Engine = Engine.TABLEAUX, pricing: Pricing = Pricing.DANTZIG, hook: SolverHook = None) -> SolverSession:
+            constructs a new session for the given model, the hook observes all the solves and re-optimizations
+        solve() -> Solution:
+            returns solution of the current model, re-optimizing the last tableaux if the model has been edited
+        add_constraint(constraint: Constraint):
+            adds a new constraint to the model
+        remove_constraint(constraint: Constraint):
+            removes the constraint (the same object that has been added to the model) from the model
+        set_lower_bound(variable: Variable, bound: float):
+            changes the lower bound of the variable
+        set_upper_bound(variable: Variable, bound: float):
+            changes the upper bound of the variable
+        set_objective_coefficient(variable: Variable, factor: float):
+            changes the factor of the variable in the objective
+    """
+
+    def __init__(self, model, engine = sf.Engine.TABLEAUX, pricing = sf.Pricing.DANTZIG, hook = None):
+        self.model = model
+        self.solver = sf.SolverFactory.solver(engine, pricing, hook = hook)
+        self.solution = None
+        self.iterations = 0
+        self.cold_solves = 0
+        self._needs_cold_solve = True
+        self._edited = False
+
+    def solve(self):
+        if self._needs_cold_solve:
+            self._cold_solve()
+        elif self._edited:
+            self._reoptimize()
+        self._edited = False
+        return self.solution
+
+    def add_constraint(self, constraint):
+        self.model.add_constraint(constraint)
+        if self._needs_cold_solve:
+            return
+
+        self.solver.lower_bounds = list(self.model.lower_bounds)
+        self._own_columns.append(self.solver._add_cut(self.tableaux, self.normal_model, constraint))
+        self._edited = True
+
+    def remove_constraint(self, constraint):
+        index = next(i for (i, other) in enumerate(self.model.constraints) if other is constraint)
+        self.model.constraints.pop(index)
+        if self._needs_cold_solve:
+            return
+
+        columns = self._own_columns.pop(index)
+        if columns == None:
+            # equality constraints have no slack variable, that could take over the row
+            self._needs_cold_solve = True
+            return
+
+        for col in sorted(columns, reverse=True):
+            if not self.tableaux.remove_variable(col):
+                self._needs_cold_solve = True
+                return
+            self._remove_normal_variable(col)
+            self._own_columns = [None if cols == None else [i - 1 if i > col else i for i in cols] for cols in self._own_columns]
+        self._edited = True
+
+    def set_lower_bound(self, variable, bound):
+        delta = bound - self.model.lower_bounds[variable.index]
+        self.model.set_lower_bound(variable, bound)
+        if self._needs_cold_solve:
+            return
+
+        col = variable.index
+        # flipped column holds u - x, that doesn't depend on the lower bound
+        if not self.tableaux.flipped[col]:
+            self.tableaux.shift_column(col, delta)
+        self._set_shifted_upper_bound(col, self.tableaux.upper_bounds[col] - delta)
+
+    def set_upper_bound(self, variable, bound):
+        self.model.set_upper_bound(variable, bound)
+        if self._needs_cold_solve:
+            return
+
+        col = variable.index
+        upper_bound = bound - self.model.lower_bounds[col]
+        if self.tableaux.flipped[col]:
+            if upper_bound == np.inf:
+                self._unflip(col)
+            else:
+                self.tableaux.shift_column(col, self.tableaux.upper_bounds[col] - upper_bound)
+        self._set_shifted_upper_bound(col, upper_bound)
+
+    def set_objective_coefficient(self, variable, factor):
+        factors = self.model.objective.expression.factors(self.model)
+        delta = factor - factors[variable.index]
+        factors[variable.index] = factor
+        self.model.objective = o.Objective(self._expression(self.model, factors), self.model.objective.type, self.model.objective.factor)
+        if self._needs_cold_solve:
+            return
+
+        # the normal model always maximizes
+        if self.model.objective.type == o.ObjectiveType.MIN:
+            delta = -delta
+        normal_factors = self.normal_model.objective.expression.factors(self.normal_model)
+        normal_factors[variable.index] += delta
+        self.normal_model.objective = o.Objective(self._expression(self.normal_model, normal_factors), self.normal_model.objective.type, self.normal_model.objective.factor)
+
+        cost_row = np.zeros(self.tableaux.table.shape[1])
+        cost_row[variable.index] = -delta
+        self.tableaux.table[0] += self.tableaux.express_in_basis(cost_row)
+        self._edited = True
+
+    def _cold_solve(self):
+        solution = self.solver.solve(self.model.copy())
+        self.iterations += solution.iterations
+        self.cold_solves += 1
+        self._start_from(solution)
+
+        # the rows of the slack and surplus variables can be dropped with their constraints, the equality ones can't
+        self._own_columns = [None for _ in self.model.constraints]
+        for (var, row) in list(self.solver.slack_variables.items()) + list(self.solver.surplus_variables.items()):
+            if row < len(self._own_columns):
+                self._own_columns[row] = [var.index]
+
+    def _reoptimize(self):
+        solver = self.solver
+        start = solver._start_solve()
+        # the solution gets its own normal model and tableaux arrays, the session keeps editing its ones
+        normal_model = self.normal_model.copy()
+        initial_tableaux = self._solution_tableaux(solver._initial_copy(self.tableaux), normal_model)
+
+        if self.tableaux.choose_dual_leaving_variable() == None:
+            if solver._optimize(self.tableaux) == False:
+                solution = s.Solution.unbounded(self.model.copy(), initial_tableaux, self._solution_tableaux(self.tableaux.copy(), normal_model), normal_model)
+                return self._finish(solution, start)
+        elif self.tableaux.is_optimal():
+            if solver._dual_optimize(self.tableaux) == False:
+                solution = s.Solution.unfeasible(self.model.copy(), initial_tableaux, self._solution_tableaux(self.tableaux.copy(), normal_model), normal_model)
+                return self._finish(solution, start)
+        else:
+            return self._cold_solve()
+
+        solver.lower_bounds = list(self.model.lower_bounds)
+        assignment = self.tableaux.extract_assignment()
+        solution = solver._create_solution(assignment, self.model.copy(), initial_tableaux, self._solution_tableaux(self.tableaux.copy(), normal_model), normal_model)
+        self._finish(solution, start)
+
+    def _solution_tableaux(self, tableaux, normal_model):
+        """
+            _solution_tableaux(tableaux: Tableaux | None, normal_model: Model) -> Tableaux | None:
+                attaches the copied tableaux to the normal model of the solution
+        """
+        if tableaux != None:
+            tableaux.model = normal_model
+        return tableaux
+
+    def _finish(self, solution, start):
+        self.solver._finish_solve(solution, start)
+        self.iterations += solution.iterations
+        self.solution = solution
+        # the session tableaux has been re-optimized in place, there is nothing to continue from only without an optimum
+        self._needs_cold_solve = solution.assignment == None
+
+    def _start_from(self, solution):
+        self.solution = solution
+        # unbounded and unfeasible models (and the sparse engine) don't leave an optimal tableaux to continue from
+        self._needs_cold_solve = solution.assignment == None or solution.tableaux == None
+        if not self._needs_cold_solve:
+            self.normal_model = solution.normal_model.copy()
+            self.tableaux = solution.tableaux.copy()
+            self.tableaux.model = self.normal_model
+
+    def _set_shifted_upper_bound(self, col, upper_bound):
+        if upper_bound < 0:
+            # crossed bounds are left for the first phase
+            self._needs_cold_solve = True
+            return
+        self.tableaux.upper_bounds[col] = upper_bound
+        self.normal_model.upper_bounds[col] = upper_bound
+        self._edited = True
+
+    def _unflip(self, col):
+        if self.tableaux.is_basic(col):
+            self.tableaux.flip_basic(self.tableaux.basis_row(col))
+        else:
+            self.tableaux.flip(col)
+
+    def _remove_normal_variable(self, col):
+        old_model = self.normal_model
+        new_model = m.Model(old_model.name)
+        for var in old_model.variables:
+            if var.index != col:
+                new_model.create_variable(var.name)
+        new_model.lower_bounds = [b for (i, b) in enumerate(old_model.lower_bounds) if i != col]
+        new_model.upper_bounds = [b for (i, b) in enumerate(old_model.upper_bounds) if i != col]
+
+        for constraint in old_model.constraints:
+            factors = constraint.expression.factors(old_model)
+            # the removed variable is the slack of exactly one constraint
+            if factors[col] != 0:
+                continue
+            factors.pop(col)
+            new_model.add_constraint(c.Constraint(self._expression(new_model, factors), constraint.bound, constraint.type))
+
+        factors = old_model.objective.expression.factors(old_model)
+        factors.pop(col)
+        new_model.objective = o.Objective(self._expression(new_model, factors), old_model.objective.type, old_model.objective.factor)
+
+        self.normal_model = new_model
+        self.tableaux.model = new_model
+
+    def _expression(self, model, factors):
+        return ex.Expression(*[factor * var for (var, factor) in zip(model.variables, factors) if factor != 0])
@@ -20,6 +20,19 @@ class Solution:
             whether the problem is feasible
         is_bounded: bool
             whether the problem is bounded
+        iterations: int
+            number of simplex pivots needed to find the solution
+        presolve_stats: PresolveStats | None
+            statistics of the presolve (None if the model hasn't been presolved)
+        duals: list[float] | None
+            shadow prices of the model constraints recovered by the dual postsolve
+            (None if the model hasn't been presolved or its reduced solution has no tableaux)
+        saved_iterations: int | None
+            how many pivots re-optimization saved compared with solving the model from scratch (None if not compared)
+        stats: SolverStats | None
+            pivot counters and timings of the solver that found the solution (None if it hasn't been found by a solver)
+        history: TableauxHistory | None
+            tableaux after every pivot (only if the solver kept the whole history)
 
 
         Methods
@@ -43,6 +56,12 @@ class Solution:
         self.assignment = assignment
         self.tableaux = tableaux
         self.initial_tableaux = initial_tableaux
+        self.iterations = 0
+        self.saved_iterations = None
+        self.presolve_stats = None
+        self.duals = None
+        self.stats = None
+        self.history = None
 
     def value(self, var):
         return None if self.assignment == None else self.assignment[var.index]
@@ -1,5 +1,5 @@
-from copy import deepcopy
 from os import name
+import time
 
 from . import model as m 
 from .expressions import objective as o 
@@ -7,65 +7,308 @@ from .expressions import constraint as c
 from .expressions import variable as v
 from . import solution as s 
 from . import tableaux as t
+from . import pricing as p
+from . import presolve as ps
+from . import stats as st
+from . import history as hi
+from .analysis_tools import rhs_sensitivity as rs
+from .sparse import SparseMatrix
 import numpy as np 
 
+eps = 0.0000001
+
 
 class Solver:
     """
         A class to represent a simplex solver.
 
+        Attributes
+        ----------
+        pricing : Pricing
+            pricing rule used to choose the entering and leaving variables
+        presolve : bool
+            whether the model is reduced by the presolve before building the tableaux
+        hook : SolverHook | None
+            hook notified about the normalization, presolve, every pivot and the termination (None = no notifications)
+        retention : Retention
+            how much of the tableaux the solutions keep (the initial tableaux isn't even copied if it's not kept)
+        iterations : int
+            number of pivots done during the last solve (both phases)
+        stats : SolverStats
+            statistics of the last solve, shared with its solution
+        history : TableauxHistory | None
+            tableaux after every pivot of the last solve (only with the HISTORY retention), shared with its solution
+
         Methods
         -------
+        __init__(pricing: Pricing = Pricing.DANTZIG, presolve: bool = False, hook: SolverHook = None, retention: Retention = Retention.INITIAL_AND_FINAL) -> Solver:
+            constructs a new solver using the given pricing rule, presolve option, hook and tableaux retention
         solve(model: Model) -> Solution:
             solves the given model and return the first solution
+        reoptimize(solution: Solution, constraints: list[Constraint], compare: bool = False) -> Solution:
+            solves the model of the given solution with additional constraints,
+            starting with the dual simplex from the optimal tableaux instead of solving the model from scratch,
+            if compare is set, the model is also solved from scratch and the difference of pivots is stored in solution.saved_iterations
     """
 
+    def __init__(self, pricing = p.Pricing.DANTZIG, presolve = False, hook = None, retention = hi.Retention.INITIAL_AND_FINAL):
+        self.pricing = pricing
+        self.presolve = presolve
+        self.hook = hook
+        self.retention = retention
+        self._start_solve()
+
     def solve(self, model):
-        normal_model = self._normalize_model(model)
+        start = self._start_solve()
+        solution = self._solve_presolved(model) if self.presolve else self._solve(model)
+        return self._finish_solve(solution, start)
+
+    def _start_solve(self):
+        """
+            _start_solve() -> float:
+                resets the pivot counter, the statistics and the history before a new solve, returns the start time
+        """
+        self.iterations = 0
+        self.stats = st.SolverStats()
+        self.history = hi.TableauxHistory() if self.retention == hi.Retention.HISTORY else None
+        self._phase = st.Phase.TWO
+        return time.perf_counter()
+
+    def _finish_solve(self, solution, start):
+        """
+            _finish_solve(solution: Solution, start: float) -> Solution:
+                attaches the pivot counter, the statistics and the history to the solution,
+                drops the tableaux it shouldn't keep and notifies the hook about the termination
+        """
+        if not self.retention.keeps_initial():
+            solution.initial_tableaux = None
+        if not self.retention.keeps_final():
+            (solution.tableaux, solution.normal_model) = (None, None)
+        self.stats.total_time = time.perf_counter() - start
+        solution.iterations = self.iterations
+        solution.stats = self.stats
+        solution.history = self.history
+        if self.hook != None:
+            self.hook.on_terminate(solution)
+        return solution
+
+    def _pivoted(self, entering, leaving, degenerate, table, basis):
+        """
+            _pivoted(entering: int, leaving: int | None, degenerate: bool, table: numpy.Array | None, basis: Iterable[int]):
+                counts the pivot (or a bound flip if leaving is None) of the current phase, notifies the hook
+                and records the table and basis after the pivot in the history
+        """
+        self.iterations += 1
+        self.stats.count_pivot(self._phase, leaving == None, degenerate)
+        if self.hook != None:
+            self.hook.on_pivot(self._phase, entering, leaving, degenerate)
+        if self.history != None:
+            self.history.record(self._phase, table, basis)
+
+    def _initial_copy(self, tableaux):
+        """
+            _initial_copy(tableaux: Tableaux) -> Tableaux | None:
+                returns a copy of the tableaux arrays to keep as the initial one (sharing the normal model), None if the solutions don't keep it
+        """
+        if not self.retention.keeps_initial():
+            return None
+        with self.stats.timer("copy"):
+            return tableaux.copy()
+
+    def _solve_presolved(self, model):
+        """
+            _solve_presolved(model: Model) -> Solution:
+                solves the model reduced by the presolve, the tableaux and normal model of the solution belong to the reduced model,
+                the shadow prices of the reduced model are mapped back to the model constraints
+        """
+        presolver = ps.Presolver()
+        with self.stats.timer("presolve"):
+            reduced_model = presolver.presolve(model)
+        if self.hook != None:
+            self.hook.on_presolve(model, reduced_model, presolver.stats)
+
+        if reduced_model == None:
+            solution = s.Solution.unfeasible(model, None, None, None)
+        elif len(reduced_model.variables) == 0:
+            solution = s.Solution.with_assignment(model, presolver.postsolve([]), None, None, None)
+            solution.duals = presolver.postsolve_duals([])
+        else:
+            reduced_solution = self._solve(reduced_model)
+            assignment = None if reduced_solution.assignment == None else presolver.postsolve(reduced_solution.assignment)
+            solution = s.Solution(model, assignment, reduced_solution.initial_tableaux, reduced_solution.tableaux, reduced_solution.normal_model, reduced_solution.is_feasible, reduced_solution.is_bounded)
+            if assignment != None and reduced_solution.tableaux != None:
+                solution.duals = presolver.postsolve_duals(rs.RHSSensitivityAnalyser().shadow_prices(reduced_solution))
+
+        solution.presolve_stats = presolver.stats
+        return solution
+
+    def reoptimize(self, solution, constraints, compare = False):
+        model = solution.model.copy()
+        for constraint in constraints:
+            model.add_constraint(constraint)
+
+        if solution.assignment == None or solution.tableaux == None or solution.presolve_stats != None:
+            # there is no optimal tableaux of the whole model to start from
+            return self.solve(model)
+
+        start = self._start_solve()
+        new_solution = self._finish_solve(self._reoptimize(solution, model, constraints), start)
+
+        if compare:
+            cold_solution = type(self)(self.pricing, self.presolve).solve(model.copy())
+            new_solution.saved_iterations = cold_solution.iterations - new_solution.iterations
+        return new_solution
+
+    def _reoptimize(self, solution, model, constraints):
+        normal_model = solution.normal_model.copy()
+        tableaux = t.Tableaux(normal_model, solution.tableaux.table, solution.tableaux.basis, solution.tableaux.upper_bounds, solution.tableaux.flipped)
+        self.lower_bounds = list(model.lower_bounds)
+
+        for constraint in constraints:
+            self._add_cut(tableaux, normal_model, constraint)
+
+        initial_tableaux = self._initial_copy(tableaux)
+        if self._dual_optimize(tableaux) == False:
+            return s.Solution.unfeasible(model, initial_tableaux, tableaux, normal_model)
+
+        assignment = tableaux.extract_assignment()
+        return self._create_solution(assignment, model, initial_tableaux, tableaux, normal_model)
+
+    def _add_cut(self, tableaux, normal_model, constraint):
+        """
+            _add_cut(tableaux: Tableaux, normal_model: Model, constraint: Constraint) -> list[int]:
+                adds the constraint as new "<=" rows of the tableaux and the normal model, returns indexes of the new slack variables
+        """
+        slack_columns = []
+        for cut in self._cut_rows(constraint):
+            shift = sum(a.factor * self.lower_bounds[a.var.index] for a in cut.expression.atoms)
+            slack_columns.append(tableaux.add_constraint(cut.expression.factors(normal_model), cut.bound - shift))
+            slack_var = normal_model.create_variable(self._free_slack_name(normal_model))
+            normal_model.add_constraint(c.Constraint(cut.expression + slack_var, cut.bound - shift, c.ConstraintType.EQ))
+        return slack_columns
+
+    def _free_slack_name(self, model):
+        names = set(var.name for var in model.variables)
+        index = len(model.constraints)
+        while f"s{index}" in names:
+            index += 1
+        return f"s{index}"
+
+    def _cut_rows(self, constraint):
+        constraint = constraint.simplify()
+        if constraint.type == c.ConstraintType.EQ:
+            constraint.type = c.ConstraintType.LE
+            return [constraint, constraint.inverted()]
+        if constraint.type == c.ConstraintType.GE:
+            return [constraint.inverted()]
+        return [constraint]
+
+    def _dual_optimize(self, tableaux):
+        self._phase = st.Phase.DUAL
+        with self.stats.timer("dual"):
+            return self._dual_pivots(tableaux)
+
+    def _dual_pivots(self, tableaux):
+        while True:
+            pivot_row = tableaux.choose_dual_leaving_variable()
+            if pivot_row == None:
+                return True
+
+            if tableaux.exceeds_upper_bound(pivot_row):
+                # basic variable leaves the basis at its upper bound
+                tableaux.flip_basic(pivot_row)
+
+            pivot_col = tableaux.choose_dual_entering_variable(pivot_row)
+            if pivot_col == None:
+                return False
+
+            # dual step is zero if the entering variable has zero reduced cost
+            degenerate = abs(tableaux.table[0, pivot_col]) <= eps
+            leaving = tableaux.basis[pivot_row - 1]
+            tableaux.pivot(pivot_row, pivot_col)
+            self._pivoted(pivot_col, leaving, degenerate, tableaux.table, tableaux.basis)
+
+    def _solve(self, model):
+        normal_model = self._normalize(model)
         if len(self.slack_variables) < len(normal_model.constraints):
             tableaux, success = self._presolve(normal_model)
             if not success:
                 return s.Solution.unfeasible(model, tableaux, tableaux, normal_model)
         else:
-            tableaux = self._basic_initial_tableaux(normal_model)
-
-        initial_tableaux = deepcopy(tableaux)
-        if self._optimize(tableaux) == False:
+            with self.stats.timer("tableaux"):
+                tableaux = self._basic_initial_tableaux(normal_model)
+
+        initial_tableaux = self._initial_copy(tableaux)
+        self._phase = st.Phase.TWO
+        with self.stats.timer("phase_two"):
+            optimal = self._optimize(tableaux)
+        if optimal == False:
             return s.Solution.unbounded(model, initial_tableaux, tableaux, normal_model)
 
         assignment = tableaux.extract_assignment()
         return self._create_solution(assignment, model, initial_tableaux, tableaux, normal_model)
 
     def _optimize(self, tableaux):
+        rule = self.pricing.rule()
+        rule.reset(tableaux.table.shape[1] - 1)
         while not tableaux.is_optimal():
-            pivot_col = tableaux.choose_entering_variable()
+            pivot_col = tableaux.choose_entering_variable(rule)
             if tableaux.is_unbounded(pivot_col):
                 return False
-            pivot_row = tableaux.choose_leaving_variable(pivot_col)
+            pivot_row = tableaux.choose_leaving_variable(pivot_col, rule)
+
+            if pivot_row == None:
+                # entering variable reaches its upper bound before any basic variable leaves
+                tableaux.flip(pivot_col)
+                self._pivoted(pivot_col, None, False, tableaux.table, tableaux.basis)
+                continue
+
+            if tableaux.table[pivot_row, pivot_col] < 0:
+                # basic variable reaches its upper bound and leaves the basis there
+                tableaux.flip_basic(pivot_row)
 
+            leaving = tableaux.basis[pivot_row - 1]
+            degenerate = abs(tableaux.table[pivot_row, -1]) <= eps
+            rule.update(pivot_col, leaving, lambda: tableaux.table[pivot_row, :-1], lambda: tableaux.table[1:, pivot_col].dot(tableaux.table[1:, :-1]))
             tableaux.pivot(pivot_row, pivot_col)
+            self._pivoted(pivot_col, leaving, degenerate, tableaux.table, tableaux.basis)
         return True
 
     def _presolve(self, model):
         """
-            _presolve(model: Model) -> Tableaux:
-                returns a initial tableaux for the second phase of simplex
+            _presolve(model: Model) -> (Tableaux, bool):
+                runs the first phase of simplex on a tableaux built once (with the crash basis and the artificial variables),
+                then turns the same tableaux into the initial tableaux for the second phase,
+                returns False (and the first phase tableaux) if the model is unfeasible
         """
-        presolve_model = self._create_presolve_model(model)
-        tableaux = self._presolve_initial_tableaux(presolve_model)
-        
-        self._optimize(tableaux)
-
-        if self._artifical_variables_are_positive(tableaux):
-            return (tableaux, False)
-
-        basis = tableaux.extract_basis()
-
-        tableaux = self._remove_artificial_variables(tableaux)
-        tableaux = self._restore_original_objective_row(tableaux, model)
-        tableaux = self._fix_objective_row_to_the_basis(tableaux, basis)
+        with self.stats.timer("tableaux"):
+            matrix = SparseMatrix.from_constraints(model.constraints, len(model.variables)).to_dense()
+            self.crash_variables = self._crash_variables(model, matrix)
+            phase_one_model = self._create_phase_one_model(model)
+            tableaux = self._presolve_initial_tableaux(phase_one_model, matrix)
+
+        self._phase = st.Phase.ONE
+        with self.stats.timer("phase_one"):
+            self._optimize(tableaux)
+            if self._artifical_variables_are_positive(tableaux):
+                return (tableaux, False)
+            self._drive_out_artificial_variables(tableaux)
+
+        with self.stats.timer("tableaux"):
+            self._start_phase_two(tableaux, model)
         return (tableaux, True)
 
+    def _normalize(self, model):
+        """
+            _normalize(model: Model) -> Model:
+                returns the normalized model, timing the normalization and notifying the hook
+        """
+        with self.stats.timer("normalize"):
+            normal_model = self._normalize_model(model)
+        if self.hook != None:
+            self.hook.on_normalize(model, normal_model)
+        return normal_model
+
     def _normalize_model(self, original_model):
         """
             _normalize_model(model: Model) -> Model:
@@ -73,20 +316,68 @@ class Solver:
         """
 
         model = original_model.translate_to_standard_form()
+        self._shift_lower_bounds(model)
         self._change_constraints_bounds_to_nonnegative(model)
         self.slack_variables = self._add_slack_variables(model)
         self.surplus_variables = self._add_surplus_variables(model)   
+        self.crash_variables = dict()
+        self.artificial_variables = dict()
         return model
 
-    def _create_presolve_model(self, normalized_model):
-        presolve_model = deepcopy(normalized_model)
-        self.artificial_variables = self._add_artificial_variables(presolve_model)
-        return presolve_model    
+    def _create_phase_one_model(self, normalized_model):
+        """
+            _create_phase_one_model(model: Model) -> Model:
+                returns a copy of the model with an artificial variable for every row without a slack or crash variable,
+                the constraints aren't rebuilt, the unit columns of the artificial variables are put straight into the table
+        """
+        phase_one_model = normalized_model.copy()
+        covered = set(self.slack_variables.values()) | set(self.crash_variables.values())
+        self.artificial_variables = dict()
+        for i in range(len(normalized_model.constraints)):
+            if i not in covered:
+                self.artificial_variables[phase_one_model.create_variable(f"R{i}")] = i
+        return phase_one_model
+
+    def _crash_variables(self, model, matrix):
+        """
+            _crash_variables(model: Model, matrix: numpy.Array) -> dict[Variable, int]:
+                picks a basic variable for the rows without a slack variable, so they don't need an artificial one:
+                a column with the only nonzero factor in the row, whose value bound / factor lies between 0 and its upper bound
+                (e.g. a surplus variable of a row with zero bound), at most one for every row
+        """
+        bounds = np.array([c.bound for c in model.constraints], dtype=float)
+        upper_bounds = np.array(model.upper_bounds, dtype=float)
+        nonzeros = matrix != 0.0
+        singletons = np.flatnonzero(nonzeros.sum(axis=0) == 1)
+        rows = nonzeros[:, singletons].argmax(axis=0)
+        values = bounds[rows] / matrix[rows, singletons]
+
+        covered = np.zeros(len(bounds), dtype=bool)
+        covered[list(self.slack_variables.values())] = True
+        feasible = (values >= 0.0) & (values <= upper_bounds[singletons]) & ~covered[rows]
+        (crash_rows, first) = np.unique(rows[feasible], return_index=True)
+        crash_columns = singletons[feasible][first]
+        return {model.variables[col]: row for (col, row) in zip(crash_columns.tolist(), crash_rows.tolist())}
+
+    def _shift_lower_bounds(self, model):
+        for var in model.variables:
+            if model.upper_bounds[var.index] < model.lower_bounds[var.index]:
+                # crossed bounds make the model unfeasible, the first phase will find that out
+                model.add_constraint(var <= model.upper_bounds[var.index])
+                model.upper_bounds[var.index] = float('inf')
+
+        # x >= l is replaced with x' = x - l >= 0
+        self.lower_bounds = list(model.lower_bounds)
+        for (i, constraint) in enumerate(model.constraints):
+            shift = sum(a.factor * self.lower_bounds[a.var.index] for a in constraint.expression.atoms)
+            model.constraints[i] = c.Constraint(constraint.expression, constraint.bound - shift, constraint.type)
+        model.upper_bounds = [u - l for (u, l) in zip(model.upper_bounds, model.lower_bounds)]
+        model.lower_bounds = [0.0 for _ in model.variables]
 
     def _change_constraints_bounds_to_nonnegative(self, model):
-        for constraint in model.constraints:
+        for (i, constraint) in enumerate(model.constraints):
             if constraint.bound < 0:
-                constraint.invert()
+                model.constraints[i] = constraint.inverted()
     
     def _add_slack_variables(self, model):
         slack_variables = dict()
@@ -94,8 +385,7 @@ class Solver:
             if constraint.type == c.ConstraintType.LE:
                 slack_var = model.create_variable(f"s{i}")
                 slack_variables[slack_var] = i
-                constraint.expression = constraint.expression + slack_var
-                constraint.type = c.ConstraintType.EQ
+                model.constraints[i] = c.Constraint(constraint.expression + slack_var, constraint.bound, c.ConstraintType.EQ)
         return slack_variables
 
     def _add_surplus_variables(self, model):
@@ -104,76 +394,76 @@ class Solver:
             if constraint.type == c.ConstraintType.GE:
                 surplus_var = model.create_variable(f"s{i}")
                 surplus_variables[surplus_var] = i
-                constraint.expression = constraint.expression - surplus_var
-                constraint.type = c.ConstraintType.EQ
+                model.constraints[i] = c.Constraint(constraint.expression - surplus_var, constraint.bound, c.ConstraintType.EQ)
         return surplus_variables 
 
-    def _add_artificial_variables(self, model):
-        artificial_variables = dict()
-        for (i,constraint) in enumerate(model.constraints.copy()):
-            if i in self.slack_variables.values():
-                continue
-            artificial_var = model.create_variable(f"R{i}")
-            artificial_variables[artificial_var] = i
-            constraint.expression = constraint.expression + artificial_var
-        return artificial_variables
-
-    def _presolve_initial_tableaux(self, model):
-        objective_row = np.array([0.0 for _ in model.variables] + [0.0])
-
-        for var in self.artificial_variables.keys():
-            objective_row[var.index] = 1.0
-
-        table = np.array([objective_row] + [c.expression.factors(model) + [c.bound] for c in model.constraints])
-
-        for constraint_index in self.artificial_variables.values():
-            constraint = model.constraints[constraint_index]
-            factors_row = np.array(constraint.expression.factors(model) + [constraint.bound])
-            objective_row = objective_row - factors_row
-
-        table = np.array([objective_row] + [c.expression.factors(model) + [c.bound] for c in model.constraints])
-        return t.Tableaux(model, table)
+    def _initial_basis(self, model):
+        basis = [-1 for _ in model.constraints]
+        for (var, row) in self.slack_variables.items():
+            basis[row] = var.index
+        for (var, row) in self.crash_variables.items():
+            basis[row] = var.index
+        for (var, row) in self.artificial_variables.items():
+            basis[row] = var.index
+        return basis
+
+    def _presolve_initial_tableaux(self, model, matrix):
+        rows_n, columns_n = matrix.shape
+        artificial_rows = np.array(list(self.artificial_variables.values()), dtype=int)
+        table = np.zeros((rows_n + 1, len(model.variables) + 1))
+        table[1:, :columns_n] = matrix
+        table[1:, -1] = [c.bound for c in model.constraints]
+        table[artificial_rows + 1, columns_n + np.arange(len(artificial_rows))] = 1.0
+
+        # crash variables become the unit columns of their rows
+        crash_rows = np.array(list(self.crash_variables.values()), dtype=int) + 1
+        crash_columns = [var.index for var in self.crash_variables.keys()]
+        table[crash_rows] /= table[crash_rows, crash_columns][:, np.newaxis]
+
+        # the artificial variables (cost 1) are basic, so their rows are subtracted from the objective row
+        table[0, columns_n:-1] = 1.0
+        table[0] -= table[artificial_rows + 1].sum(axis=0)
+        return t.Tableaux(model, table, self._initial_basis(model), model.upper_bounds, copy = False)
 
     def _basic_initial_tableaux(self, model):
         objective_row = np.array((-1 * model.objective.expression).factors(model) + [0.0])
         table = np.array([objective_row] + [c.expression.factors(model) + [c.bound] for c in model.constraints])
-        return t.Tableaux(model, table)
+        return t.Tableaux(model, table, self._initial_basis(model), model.upper_bounds)
 
     def _artifical_variables_are_positive(self, tableaux):
         assignment = tableaux.extract_assignment()
         for artificial_var in self.artificial_variables:
-            if assignment[artificial_var.index] > 0:
+            if assignment[artificial_var.index] > eps:
                 return True 
         return False
 
-    def _remove_artificial_variables(self, tableaux):
-        columns_to_remove = [var.index for var in self.artificial_variables.keys()]
-        table = np.delete(tableaux.table, columns_to_remove, 1)
-        return t.Tableaux(tableaux.model, table)
-
-    def _restore_original_objective_row(self, tableaux, model):
-        objective_row = np.array((-1 * model.objective.expression).factors(model) + [0.0])
-        new_table = np.array(tableaux.table)
-        new_table[0] = objective_row
-        return t.Tableaux(model, new_table)
-
-    def _fix_objective_row_to_the_basis(self, tableaux, basis):
-        objective_row = tableaux.table[0].copy()
-
-        for (constr_index, col) in enumerate(basis):
-            if col >= len(objective_row) - 1:
-                continue
-            
-            row = constr_index + 1
-            objective_factor = objective_row[col]
-            if objective_factor == 0:
+    def _drive_out_artificial_variables(self, tableaux):
+        artificial_columns = [var.index for var in self.artificial_variables.keys()]
+        normal_columns = np.delete(np.arange(tableaux.table.shape[1] - 1), artificial_columns)
+        for (i, col) in enumerate(tableaux.basis):
+            if col not in artificial_columns:
                 continue
-            objective_row = objective_row - objective_factor * tableaux.table[row]
-
-        new_table = np.array(tableaux.table)
-        new_table[0] = objective_row
-        return t.Tableaux(tableaux.model, new_table)
+            row = i + 1
+            factors = tableaux.table[row, normal_columns]
+            candidates = normal_columns[(np.abs(factors) > eps) & ~tableaux.is_basic(normal_columns)]
+            # if there is no candidate the constraint is redundant and the artificial variable stays in the basis at zero
+            if len(candidates) > 0:
+                tableaux.pivot(row, candidates[0])
+                # the artificial variable leaves at zero, so the pivot is degenerate
+                self._pivoted(candidates[0], col, True, tableaux.table, tableaux.basis)
+
+    def _start_phase_two(self, tableaux, model):
+        """
+            _start_phase_two(tableaux: Tableaux, model: Model):
+                turns the first phase tableaux into the initial tableaux of the second phase in place,
+                the artificial columns (the last ones) are dropped and the objective row is expressed in the current basis,
+                artificial variables left in the basis (at zero level) leave their rows without a basic variable
+        """
+        tableaux.truncate(len(model.variables))
+        tableaux.model = model
+        objective_row = np.array((-1 * model.objective.expression).factors(model) + [0.0])
+        tableaux.table[0] = tableaux.express_in_basis(objective_row)
 
     def _create_solution(self, assignment, model, initial_tableaux, tableaux, normal_model):
-        assignment = [assignment[var.index] for var in model.variables]
+        assignment = [assignment[var.index] + self.lower_bounds[var.index] for var in model.variables]
         return s.Solution.with_assignment(model, assignment, initial_tableaux, tableaux, normal_model)
@@ -0,0 +1,48 @@
+from enum import Enum
+from collections import defaultdict
+from .solver import Solver
+from .revised_solver import RevisedSolver, SparseRevisedSolver
+from .pricing import Pricing
+from .history import Retention
+
+class Engine(Enum):
+    """
+        An enum representing all the available simplex engines:
+        - TABLEAUX = two-phase simplex updating the full tableaux on every pivot
+        - REVISED = two-phase revised simplex keeping only a factorized basis
+        - SPARSE = revised simplex with the sparse constraints matrix, its solutions have no tableaux
+    """
+    TABLEAUX = "tableaux"
+    REVISED = "revised"
+    SPARSE = "sparse"
+
+
+class Strategy(Enum):
+    """
+        An enum representing which problem is solved to find the optimum of a model:
+        - PRIMAL = the model itself
+        - DUAL = the dual model, the assignment is read from the shadow prices of its final tableaux
+          (so it can't be used with the sparse engine or the presolve)
+        - AUTO = the dual if its tableaux is much smaller than the tableaux of the model (and the engine allows it), the primal otherwise
+    """
+    PRIMAL = "primal"
+    DUAL = "dual"
+    AUTO = "auto"
+
+
+class SolverFactory:
+    """
+        A factory class creating simplex solver objects.
+
+        Static Methods:
+        ---------------
+        solver(engine: Engine, pricing: Pricing, presolve: bool, hook: SolverHook = None, retention: Retention = Retention.INITIAL_AND_FINAL) -> Solver:
+            creates a new solver object based on the specified engine, using the given pricing rule, presolve option, hook and tableaux retention
+    """
+    @staticmethod
+    def solver(engine = Engine.TABLEAUX, pricing = Pricing.DANTZIG, presolve = False, hook = None, retention = Retention.INITIAL_AND_FINAL):
+        return defaultdict(Solver, {
+            Engine.TABLEAUX: Solver,
+            Engine.REVISED: RevisedSolver,
+            Engine.SPARSE: SparseRevisedSolver
+        })[engine](pricing, presolve, hook, retention)
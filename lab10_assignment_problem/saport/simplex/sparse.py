@@ -0,0 +1,134 @@
+import numpy as np
+
+class SparseMatrix:
+    """
+        A class to represent a sparse matrix stored column by column (compressed sparse column format).
+        Only the nonzero factors are kept, so the memory scales with the number of nonzeros instead of rows * columns.
+
+        Attributes
+        ----------
+        shape : tuple[int, int]
+            number of rows and columns
+        data : numpy.Array
+            nonzero values, column after column
+        indices : numpy.Array
+            row index of every value in data
+        indptr : numpy.Array
+            values of the column j are stored in data[indptr[j]:indptr[j + 1]]
+
+        Methods
+        -------
+        __init__(data: numpy.Array, indices: numpy.Array, indptr: numpy.Array, shape: tuple[int, int]) -> SparseMatrix:
+            constructs a new matrix from the compressed arrays
+        from_constraints(constraints: list[Constraint], columns_n: int) -> SparseMatrix:
+            builds the constraints matrix directly from the atoms of the constraint expressions
+        from_dense(matrix: numpy.Array) -> SparseMatrix:
+            builds a sparse matrix from a dense one
+        from_triplets(rows: numpy.Array, cols: numpy.Array, values: numpy.Array, shape: tuple[int, int]) -> SparseMatrix:
+            builds a sparse matrix from the (row, column, value) triplets, values of the repeated positions are summed up
+        from_matrix(matrix: SparseMatrix | numpy.Array | scipy.sparse matrix) -> SparseMatrix:
+            returns the given matrix in the sparse format, whatever format it has been given in
+        nnz() -> int:
+            returns number of stored nonzeros
+        column(col: int) -> numpy.Array:
+            returns the column as a dense vector
+        columns(cols: list[int]) -> numpy.Array:
+            returns the given columns as a dense matrix (e.g. the basis matrix)
+        dot(x: numpy.Array) -> numpy.Array:
+            returns A * x
+        rdot(y: numpy.Array) -> numpy.Array:
+            returns y * A
+        to_dense() -> numpy.Array:
+            returns the dense version of the matrix
+        triplets() -> (numpy.Array, numpy.Array, numpy.Array):
+            returns rows, columns and values of the stored nonzeros
+        transpose() -> SparseMatrix:
+            returns the transposed matrix
+    """
+
+    def __init__(self, data, indices, indptr, shape):
+        self.data = np.asarray(data, dtype=float)
+        self.indices = np.asarray(indices, dtype=int)
+        self.indptr = np.asarray(indptr, dtype=int)
+        self.shape = shape
+        # column of every stored value, used by the vectorized products
+        self._columns = np.repeat(np.arange(shape[1]), np.diff(self.indptr))
+
+    @staticmethod
+    def from_constraints(constraints, columns_n):
+        rows, cols, values = [np.zeros(0, dtype=int)], [np.zeros(0, dtype=int)], [np.zeros(0)]
+        for (i, constraint) in enumerate(constraints):
+            (indexes, factors) = constraint.expression.nonzeros()
+            rows.append(np.full(len(indexes), i))
+            cols.append(indexes)
+            values.append(factors)
+        return SparseMatrix.from_triplets(np.concatenate(rows), np.concatenate(cols), np.concatenate(values), (len(constraints), columns_n))
+
+    @staticmethod
+    def from_dense(matrix):
+        matrix = np.asarray(matrix, dtype=float)
+        # nonzeros of the transposed matrix come already ordered by columns, there is nothing to sort or merge
+        cols, rows = np.nonzero(matrix.T)
+        indptr = np.zeros(matrix.shape[1] + 1, dtype=int)
+        np.cumsum(np.bincount(cols, minlength=matrix.shape[1]), out=indptr[1:])
+        return SparseMatrix(matrix[rows, cols], rows, indptr, matrix.shape)
+
+    @staticmethod
+    def from_matrix(matrix):
+        if isinstance(matrix, SparseMatrix):
+            return matrix
+        if hasattr(matrix, "tocoo"):
+            # scipy.sparse matrices, scipy itself isn't needed to read them
+            coo = matrix.tocoo()
+            return SparseMatrix.from_triplets(coo.row, coo.col, coo.data, coo.shape)
+        return SparseMatrix.from_dense(np.atleast_2d(matrix))
+
+    @staticmethod
+    def from_triplets(rows, cols, values, shape):
+        rows = np.asarray(rows, dtype=int)
+        cols = np.asarray(cols, dtype=int)
+        values = np.asarray(values, dtype=float)
+        order = np.lexsort((rows, cols))
+        rows, cols, values = rows[order], cols[order], values[order]
+
+        # repeated positions (e.g. x + x) are merged into one value
+        if len(rows) > 0:
+            starts = np.flatnonzero(np.append(True, (rows[1:] != rows[:-1]) | (cols[1:] != cols[:-1])))
+            rows, cols, values = rows[starts], cols[starts], np.add.reduceat(values, starts)
+        nonzero = values != 0
+        rows, cols, values = rows[nonzero], cols[nonzero], values[nonzero]
+
+        indptr = np.zeros(shape[1] + 1, dtype=int)
+        np.cumsum(np.bincount(cols, minlength=shape[1]), out=indptr[1:])
+        return SparseMatrix(values, rows, indptr, shape)
+
+    def nnz(self):
+        return len(self.data)
+
+    def column(self, col):
+        start, end = self.indptr[col], self.indptr[col + 1]
+        result = np.zeros(self.shape[0])
+        result[self.indices[start:end]] = self.data[start:end]
+        return result
+
+    def columns(self, cols):
+        result = np.zeros((self.shape[0], len(cols)))
+        for (i, col) in enumerate(cols):
+            start, end = self.indptr[col], self.indptr[col + 1]
+            result[self.indices[start:end], i] = self.data[start:end]
+        return result
+
+    def dot(self, x):
+        return np.bincount(self.indices, weights=self.data * np.asarray(x, dtype=float)[self._columns], minlength=self.shape[0])
+
+    def rdot(self, y):
+        return np.bincount(self._columns, weights=self.data * np.asarray(y, dtype=float)[self.indices], minlength=self.shape[1])
+
+    def to_dense(self):
+        return self.columns(range(self.shape[1]))
+
+    def triplets(self):
+        return (self.indices, self._columns, self.data)
+
+    def transpose(self):
+        return SparseMatrix.from_triplets(self._columns, self.indices, self.data, (self.shape[1], self.shape[0]))
@@ -0,0 +1,139 @@
+from contextlib import contextmanager
+from enum import Enum
+import time
+
+
+class Phase(Enum):
+    """
+        An enum to represent a phase of the simplex method:
+        - ONE = first phase, looking for a feasible basis (minimizing the artificial variables)
+        - TWO = second phase, optimizing the objective
+        - DUAL = dual simplex, used by the re-optimization
+    """
+    ONE = "phase one"
+    TWO = "phase two"
+    DUAL = "dual"
+
+
+class SolverStats:
+    """
+        A class to represent statistics of one simplex solve, every solution carries the statistics of its solver.
+        Counting is a few additions per pivot and the timings are taken once per solve stage,
+        so the statistics are always collected.
+
+        Attributes
+        ----------
+        phase_one_pivots : int
+            number of pivots (including bound flips) done in the first phase
+        phase_two_pivots : int
+            number of pivots (including bound flips) done in the second phase
+        dual_pivots : int
+            number of pivots done by the dual simplex
+        degenerate_pivots : int
+            number of pivots that haven't moved the solution (zero step length)
+        bound_flips : int
+            number of iterations in which a variable only moved to its other bound, without changing the basis
+        normalize_time : float
+            seconds spent on translating the model to the normal form
+        presolve_time : float
+            seconds spent on reducing the model by the presolve
+        tableaux_time : float
+            seconds spent on building the tableaux
+        copy_time : float
+            seconds spent on copying the tableaux (e.g. the initial tableaux of the solution)
+        phase_one_time : float
+            seconds spent on the pivots of the first phase
+        phase_two_time : float
+            seconds spent on the pivots of the second phase
+        dual_time : float
+            seconds spent on the pivots of the dual simplex
+        total_time : float
+            seconds spent on the whole solve
+
+        Methods
+        -------
+        pivots() -> int:
+            returns number of all the pivots
+        count_pivot(phase: Phase, flip: bool, degenerate: bool):
+            counts a pivot (or a bound flip) done in the phase
+        timer(stage: str) -> ContextManager:
+            adds time spent in the with block to the stage_time attribute, e.g. timer("normalize") to normalize_time
+    """
+
+    def __init__(self):
+        self.phase_one_pivots = 0
+        self.phase_two_pivots = 0
+        self.dual_pivots = 0
+        self.degenerate_pivots = 0
+        self.bound_flips = 0
+        self.normalize_time = 0.0
+        self.presolve_time = 0.0
+        self.tableaux_time = 0.0
+        self.copy_time = 0.0
+        self.phase_one_time = 0.0
+        self.phase_two_time = 0.0
+        self.dual_time = 0.0
+        self.total_time = 0.0
+
+    def pivots(self):
+        return self.phase_one_pivots + self.phase_two_pivots + self.dual_pivots
+
+    def count_pivot(self, phase, flip, degenerate):
+        if phase == Phase.ONE:
+            self.phase_one_pivots += 1
+        elif phase == Phase.TWO:
+            self.phase_two_pivots += 1
+        else:
+            self.dual_pivots += 1
+        if flip:
+            self.bound_flips += 1
+        elif degenerate:
+            self.degenerate_pivots += 1
+
+    @contextmanager
+    def timer(self, stage):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            attribute = f"{stage}_time"
+            setattr(self, attribute, getattr(self, attribute) + time.perf_counter() - start)
+
+    def __str__(self):
+        text = f"- pivots: {self.pivots()} (phase one: {self.phase_one_pivots}, phase two: {self.phase_two_pivots}, dual: {self.dual_pivots})\n"
+        text += f"- degenerate pivots: {self.degenerate_pivots}, bound flips: {self.bound_flips}\n"
+        text += f"- time: {self.total_time:.6f}s (normalize: {self.normalize_time:.6f}s, presolve: {self.presolve_time:.6f}s, "
+        text += f"tableaux: {self.tableaux_time:.6f}s, copy: {self.copy_time:.6f}s, phase one: {self.phase_one_time:.6f}s, "
+        text += f"phase two: {self.phase_two_time:.6f}s, dual: {self.dual_time:.6f}s)"
+        return text
+
+
+class SolverHook:
+    """
+        A base class for the hooks observing the simplex solver, the default methods do nothing,
+        so a hook overrides only the events it's interested in. Solvers without a hook don't call anything.
+
+        Methods
+        -------
+        on_normalize(model: Model, normal_model: Model):
+            called when the model has been translated to the normal form (with the slack and surplus variables)
+        on_presolve(model: Model, reduced_model: Model | None, stats: PresolveStats):
+            called when the model has been reduced by the presolve (reduced_model is None if it's unfeasible)
+        on_pivot(phase: Phase, entering: int, leaving: int | None, degenerate: bool):
+            called after every pivot with the columns of the entering and leaving variables,
+            leaving is None if the entering variable has only moved to its other bound
+        on_terminate(solution: Solution):
+            called with the solution found by the solver, its stats are already complete
+    """
+
+    def on_normalize(self, model, normal_model):
+        pass
+
+    def on_presolve(self, model, reduced_model, stats):
+        pass
+
+    def on_pivot(self, phase, entering, leaving, degenerate):
+        pass
+
+    def on_terminate(self, solution):
+        pass
@@ -1,5 +1,6 @@
 import numpy as np
 from . import solution as s
+from . import pricing as p
 
 eps = 0.0000001
 
@@ -13,35 +14,111 @@ class Tableaux:
         model : Model
             model corresponding to the tableaux
         table : numpy.Array
-            2d-array with the tableaux
+            2d-array with the tableaux, pivots update it in place
+        basis : numpy.Array
+            indexes of the basic variables, basis[i] belongs to the table row i + 1 (-1 if the row has no basic variable)
+        upper_bounds : numpy.Array
+            upper bound of every variable (inf if the variable is not bounded)
+        flipped : numpy.Array
+            whether the column holds the complement u - x instead of the variable x,
+            nonbasic flipped variables are the ones sitting at their upper bounds
 
         Methods
         -------
-        __init__(model: Model, table: array) -> Tableaux:
+        __init__(model: Model, table: array, basis: list[int] | None = None, upper_bounds: list[float] | None = None, flipped: list[bool] | None = None, copy: bool = True) -> Tableaux:
             constructs a new tableaux for the specified model and initial table
+            if the basis is not given, it is detected once by looking for the unit columns in the table,
+            without copy a float table is used as it is (the caller hands over a freshly built table)
+        copy() -> Tableaux:
+            returns a copy of the table, basis, upper bounds and flipped columns, sharing the model with this tableaux
         cost_factors() -> numpy.Array:
             returns a vector containing factors in the cost row
         cost() -> float:
             returns the cost of solution represented in tableaux
         is_optimal() -> bool:
             checks whether the current solution is optimal
-        choose_entering_variable() -> int:
-            finds index of the variable, that should enter the basis next
+        choose_entering_variable(rule: PricingRule = DantzigRule()) -> int:
+            finds index of the variable, that should enter the basis next according to the pricing rule
         is_unbounded(col: int) -> bool:
             checks whether the problem is unbounded
-        choose_leaving_variable(col: int) -> int:
-            finds index of the variable, that should leave the basis next
+        choose_leaving_variable(col: int, rule: PricingRule = DantzigRule()) -> int | None:
+            finds index of the variable, that should leave the basis next according to the pricing rule
+            returns None if the entering variable reaches its own upper bound first (it should be flipped instead)
+        flip(col: int):
+            moves the nonbasic variable to its other bound (substitutes x = u - x')
+        flip_basic(row: int):
+            substitutes x = u - x' for the variable basic in the given row, used when it leaves the basis at its upper bound
+        substitute_flips(row: numpy.Array) -> numpy.Array:
+            rewrites a row expressed in the original variables (with the right hand side) into the flipped columns
+        express_in_basis(row: numpy.Array) -> numpy.Array:
+            rewrites a row expressed in the original variables (with the right hand side) into the current basis,
+            i.e. substitutes the flipped columns and eliminates the basic variables
+        shift_column(col: int, delta: float):
+            substitutes x = x' + delta for the variable in the given column
+        truncate(columns_n: int):
+            keeps only the first columns_n variables (e.g. drops the artificial ones), the table becomes its own view without copying,
+            removed basic variables leave their rows without a basic variable
+        remove_variable(col: int) -> bool:
+            removes the variable (a slack variable of a removed constraint) together with one row of the tableaux,
+            if the variable is nonbasic it's pivoted into the basis first, returns False if that's not possible
+        add_constraint(factors: list[float], bound: float) -> int:
+            adds a row factors * x <= bound (expressed in the original variables) with a new basic slack column,
+            returns index of the slack column, the tableaux stays dual feasible but may become primal unfeasible
+        choose_dual_leaving_variable() -> int | None:
+            finds the row with the most violated basic variable (below zero or above its upper bound),
+            returns None if the tableaux is primal feasible
+        exceeds_upper_bound(row: int) -> bool:
+            checks whether the variable basic in the given row is above its upper bound
+        choose_dual_entering_variable(row: int) -> int | None:
+            finds index of the variable entering the basis in the dual simplex (ratio test on the cost row),
+            returns None if no variable can enter, i.e. the problem is unfeasible
+        column_norms() -> numpy.Array:
+            returns squared norms of the columns (without the cost row), used by the steepest-edge pricing
         pivot(col: int, row: int):
-            updates tableaux using pivot operation with given entering and leaving variables
+            updates tableaux in place using pivot operation with given entering and leaving variables
         extract_assignment() -> list[float]:
             returns assignment corresponding to the tableaux
         extract_basis() -> list[int]
             returns list of indexes corresponding to the variables belonging to the basis
+        is_basic(col: int) -> bool:
+            checks whether the variable with the given index belongs to the basis
+        basis_row(col: int) -> int | None:
+            returns the table row of the given basic variable, None if the variable is not basic
     """
 
-    def __init__(self, model, table):
+    def __init__(self, model, table, basis = None, upper_bounds = None, flipped = None, copy = True):
         self.model = model
-        self.table = table
+        self.table = np.array(table, dtype=float) if copy else np.asarray(table, dtype=float)
+        self._pivot_buffer = None
+        self._set_basis(self._detect_basis() if basis is None else basis)
+
+        columns_n = self.table.shape[1] - 1
+        self.upper_bounds = np.full(columns_n, np.inf) if upper_bounds is None else np.array(upper_bounds, dtype=float)
+        self.flipped = np.zeros(columns_n, dtype=bool) if flipped is None else np.array(flipped, dtype=bool)
+
+    def _set_basis(self, basis):
+        self.basis = np.array(basis, dtype=int)
+        self._rows = np.full(self.table.shape[1] - 1, -1, dtype=int)
+        for (i, col) in enumerate(self.basis):
+            if col >= 0:
+                self._rows[col] = i + 1
+
+    def _detect_basis(self):
+        rows_n, _ = self.table.shape
+        basis = [-1 for _ in range(rows_n - 1)]
+        columns = self.table[:, :-1]
+        nonzeros = np.abs(columns) > eps
+        candidates = np.flatnonzero((nonzeros.sum(axis=0) == 1) & ~nonzeros[0])
+        for c in candidates:
+            row = np.flatnonzero(nonzeros[:, c])[0]
+            if abs(columns[row, c] - 1.0) <= eps:
+                # [row-1] because we ignore the cost variable in the basis
+                basis[row - 1] = c
+        return basis
+
+    def copy(self):
+        # the constructor copies all the arrays, the model is never changed through the tableaux
+        return Tableaux(self.model, self.table, self.basis, self.upper_bounds, self.flipped)
 
     def cost_factors(self):
         return self.table[0,:-1] 
@@ -52,62 +129,176 @@ class Tableaux:
     def is_optimal(self):
         return self.cost_factors().min() >= -eps
 
-    def choose_entering_variable(self):
-        return self.cost_factors().argmin()
+    def choose_entering_variable(self, rule = p.DantzigRule()):
+        return rule.choose_entering_variable(self.cost_factors(), self.column_norms)
 
     def is_unbounded(self, col):
-        return self.table[1:, col].max() <= 0 
+        return self.upper_bounds[col] == np.inf and self._quotients(col).min(initial=np.inf) == np.inf
+
+    def choose_leaving_variable(self, col, rule = p.DantzigRule()):
+        quotients = self._quotients(col)
+        if self.upper_bounds[col] < quotients.min(initial=np.inf) - eps:
+            return None
+
+        # [+1] because the first row is the cost row
+        return rule.choose_leaving_variable(quotients, self.basis) + 1
+
+    def _quotients(self, col):
+        column = self.table[1:, col]
+        rhs = self.table[1:, -1]
+        quotients = np.full(len(column), np.inf)
+
+        # basic variable decreases to zero
+        decreasing = column > eps
+        quotients[decreasing] = rhs[decreasing] / column[decreasing]
+
+        # basic variable increases to its upper bound
+        basic_bounds = np.where(self.basis >= 0, self.upper_bounds[self.basis], np.inf)
+        increasing = (column < -eps) & (basic_bounds < np.inf)
+        quotients[increasing] = (basic_bounds[increasing] - rhs[increasing]) / -column[increasing]
+        return quotients
+
+    def flip(self, col):
+        self.table[:, -1] -= self.table[:, col] * self.upper_bounds[col]
+        self.table[:, col] *= -1
+        self.flipped[col] = not self.flipped[col]
+
+    def flip_basic(self, row):
+        col = self.basis[row - 1]
+        self.table[row] *= -1
+        self.table[row, col] = 1.0
+        self.table[row, -1] += self.upper_bounds[col]
+        self.flipped[col] = not self.flipped[col]
+
+    def substitute_flips(self, row):
+        row = np.array(row, dtype=float)
+        row[-1] -= row[:-1][self.flipped].dot(self.upper_bounds[self.flipped])
+        row[:-1][self.flipped] *= -1
+        return row
+
+    def express_in_basis(self, row):
+        row = self.substitute_flips(row)
+        rows = np.flatnonzero(self.basis >= 0)
+        return row - row[self.basis[rows]].dot(self.table[rows + 1])
+
+    def shift_column(self, col, delta):
+        self.table[:, -1] -= self.table[:, col] * delta
 
-    def choose_leaving_variable(self, col):
-        column = np.copy(self.table[1:, col])
-        column = np.where(column > 0, column, -1)
-        indicators = self.table[1:, -1] / column
-        quotients = np.where(column > 0, indicators, np.inf)
-        index = len(quotients) - np.argmin(quotients[::-1])
+    def truncate(self, columns_n):
+        # the right hand side is moved next to the kept columns, so the view ends with it
+        self.table[:, columns_n] = self.table[:, -1]
+        self.table = self.table[:, :columns_n + 1]
+        self._pivot_buffer = None
+        self.upper_bounds = self.upper_bounds[:columns_n]
+        self.flipped = self.flipped[:columns_n]
+        self._set_basis(np.where(self.basis < columns_n, self.basis, -1))
 
-        return index
+    def remove_variable(self, col):
+        if not self.is_basic(col):
+            entering_row = self._entering_row(col)
+            if entering_row == None:
+                return False
+            self.pivot(entering_row, col)
+
+        row = self.basis_row(col)
+        self.table = np.delete(np.delete(self.table, row, 0), col, 1)
+        self._pivot_buffer = None
+        self.upper_bounds = np.delete(self.upper_bounds, col)
+        self.flipped = np.delete(self.flipped, col)
+        basis = np.delete(self.basis, row - 1)
+        self._set_basis(np.where(basis > col, basis - 1, basis))
+        return True
+
+    def _entering_row(self, col):
+        # the usual ratio test keeps the other rows feasible, if the variable can't increase, it's decreased instead
+        column = self.table[1:, col]
+        rhs = self.table[1:, -1]
+        candidates = column > eps if (column > eps).any() else column < -eps
+        if not candidates.any():
+            return None
+        quotients = np.full(len(column), np.inf)
+        quotients[candidates] = rhs[candidates] / np.abs(column[candidates])
+        return quotients.argmin() + 1
+
+    def add_constraint(self, factors, bound):
+        row = self.express_in_basis(np.append(factors, bound))
+
+        rows_n, columns_n = self.table.shape
+        slack = columns_n - 1
+        table = np.zeros((rows_n + 1, columns_n + 1))
+        table[:-1, :slack] = self.table[:, :-1]
+        table[:-1, -1] = self.table[:, -1]
+        table[-1, :slack] = row[:-1]
+        table[-1, slack] = 1.0
+        table[-1, -1] = row[-1]
+
+        self.table = table
+        self._pivot_buffer = None
+        self.upper_bounds = np.append(self.upper_bounds, np.inf)
+        self.flipped = np.append(self.flipped, False)
+        self._set_basis(np.append(self.basis, slack))
+        return slack
+
+    def choose_dual_leaving_variable(self):
+        rhs = self.table[1:, -1]
+        basic_bounds = np.where(self.basis >= 0, self.upper_bounds[self.basis], np.inf)
+        violations = np.where(self.basis >= 0, np.minimum(rhs, basic_bounds - rhs), 0.0)
+        if violations.min(initial=0.0) >= -eps:
+            return None
+        # [+1] because the first row is the cost row
+        return violations.argmin() + 1
+
+    def exceeds_upper_bound(self, row):
+        col = self.basis[row - 1]
+        return self.table[row, -1] > self.upper_bounds[col] + eps
+
+    def choose_dual_entering_variable(self, row):
+        factors = self.table[row, :-1]
+        candidates = factors < -eps
+        if not candidates.any():
+            return None
+        ratios = np.full(len(factors), np.inf)
+        ratios[candidates] = self.cost_factors()[candidates] / -factors[candidates]
+        return np.flatnonzero(ratios <= ratios.min() + eps)[0]
+
+    def column_norms(self):
+        return (self.table[1:, :-1] ** 2).sum(axis=0)
 
     def pivot(self, row, col):
-        rows_n, cols_n = self.table.shape
-        pivot_factor = self.table[row, col]
+        table = self.table
+        table[row] /= table[row, col]
 
-        new_table = self.table.copy()
-        new_table[row] = self.table[row] / pivot_factor
+        pivot_column = table[:, col].copy()
+        pivot_column[row] = 0.0
 
-        new_table[:, col] = 0.0
-        new_table[row, col] = 1.0
-        
-        for r in range(rows_n):
-            if r == row:
-                continue
-            for c in range(cols_n):
-                if c == col:
-                    continue 
-                new_table[r,c] = (-self.table[r, col]) * new_table[row, c] + self.table[r,c]
+        # rank-1 update: every row r loses table[r, col] times the normalized pivot row
+        if self._pivot_buffer is None or self._pivot_buffer.shape != table.shape:
+            self._pivot_buffer = np.empty_like(table)
+        np.multiply.outer(pivot_column, table[row], out=self._pivot_buffer)
+        np.subtract(table, self._pivot_buffer, out=table)
 
-        self.table = new_table
+        leaving = self.basis[row - 1]
+        if leaving >= 0:
+            self._rows[leaving] = -1
+        self.basis[row - 1] = col
+        self._rows[col] = row
 
     def extract_assignment(self):
-        rows_n, cols_n = self.table.shape
-        assignment = [0.0 for _ in range(cols_n - 1)]
-        basis = self.extract_basis()
-        for r in range(1, rows_n):
-            var_index = basis[r - 1]
-            assignment[var_index] = self.table[r, -1]
-        
-        return assignment
-    
+        assignment = np.zeros(self.table.shape[1] - 1)
+        rows = np.flatnonzero(self.basis >= 0)
+        assignment[self.basis[rows]] = self.table[rows + 1, -1]
+        assignment[self.flipped] = self.upper_bounds[self.flipped] - assignment[self.flipped]
+        return assignment.tolist()
+
     def extract_basis(self):
-        rows_n, cols_n = self.table.shape
-        basis = [-1 for _ in range(rows_n -1)]
-        for c in range(cols_n - 1):
-            column = self.table[:,c]
-            belongs_to_basis = column.min() == 0.0 and column.max() == 1.0 and column.sum() == 1.0
-            if belongs_to_basis:
-                row = np.where(column == 1.0)[0][0]
-                # [row-1] because we ignore the cost variable in the basis
-                basis[row-1] = c
-        return basis
+        return list(self.basis)
+
+    def is_basic(self, col):
+        return self._rows[col] >= 0
+
+    def basis_row(self, col):
+        row = self._rows[col]
+        return None if row < 0 else row
 
     def __str__(self):
         def cell(x, w):
@@ -118,7 +309,7 @@ class Tableaux:
         header = ["basis", cost_name] + [var.name for var in self.model.variables] + ["b"]
         longest_col = max([len(h) for h in header])
 
-        rows = [[cost_name]] + [[self.model.variables[i].name] for i in basis]
+        rows = [[cost_name]] + [[self.model.variables[i].name if i >= 0 else "-"] for i in basis]
 
         for (i,r) in enumerate(rows):
             cost_factor = 0.0 if i > 0 else 1.0
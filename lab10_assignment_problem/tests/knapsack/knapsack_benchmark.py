@@ -1,17 +1,19 @@
-from saport.knapsack.model import Problem
+from saport.knapsack.model import Problem, Solution
 from saport.knapsack.solverfactory import SolverType, SolverFactory
+from saport.parallel import TaskStatus, knapsack_task, solve_many
 from typing import List,Callable
 import os
 # manipulate following parameters to customize the benchmarks
 
 class KnapsackBenchmark:
 
-    def __init__(self, problems: List[str], timelimit: int = 60, solver_types: List[SolverType] = list(SolverType), print_function: Callable = print, problems_dir: str = "tests/knapsack/knapsack_problems"):
+    def __init__(self, problems: List[str], timelimit: int = 60, solver_types: List[SolverType] = list(SolverType), print_function: Callable = print, problems_dir: str = "tests/knapsack/knapsack_problems", workers: int = 1):
         self.timelimit = timelimit
         self.problems = problems
         self.solver_types = solver_types
         self.print_function = print_function
         self.problems_dir = problems_dir
+        self.workers = workers
 
     def print_table(self, table_to_print):
         def cell(x, w):
@@ -24,15 +26,30 @@ class KnapsackBenchmark:
             self.print_function(" | ".join(row))
         self.print_function('-' * (longest_value + 1) * (len(table_to_print[0]) + 1))
     
+    def solve_all(self):
+        if self.workers == 1:
+            for p in self.problems:
+                self.print_function(f"* going for {p}", end = '\r')
+                problem = Problem.from_path(os.path.join(self.problems_dir, p))
+                solvers = [SolverFactory.solver(st, problem, self.timelimit) for st in self.solver_types]
+                yield [(s.solve(), s.total_time) for s in solvers]
+            return
+
+        # solvers stop on their own after the timelimit, the worker is terminated only if one of them doesn't
+        tasks = [knapsack_task(os.path.join(self.problems_dir, p), st, self.timelimit, 2 * self.timelimit) for p in self.problems for st in self.solver_types]
+        solutions = [None for _ in tasks]
+        for result in solve_many(tasks, self.workers):
+            self.print_function(f"* solved {result.name}", end = '\r')
+            solutions[result.index] = result.value if result.status == TaskStatus.DONE else (Solution.empty(), result.time)
+        n_solvers = len(self.solver_types)
+        for i in range(len(self.problems)):
+            yield solutions[i * n_solvers:(i + 1) * n_solvers]
+
     def run(self):
         results_table = [[] for _ in self.problems]
         ranking = [[0 for _ in self.solver_types] for _ in self.solver_types]
 
-        for (i,p) in enumerate(self.problems):
-            self.print_function(f"* going for {p}", end = '\r')
-            problem = Problem.from_path(os.path.join(self.problems_dir, p))
-            solvers = [SolverFactory.solver(st, problem, self.timelimit) for st in self.solver_types]
-            solutions = [(s.solve(), s.total_time) for s in solvers]
+        for (i,solutions) in enumerate(self.solve_all()):
             results = [f'{"*" if s.optimal else ""}{s.value}({t:.4f}s)' for (s,t) in solutions]
             results_table[i] = results
             
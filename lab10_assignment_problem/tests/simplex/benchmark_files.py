@@ -0,0 +1,38 @@
+from saport.simplex.formats.lp import read_lp
+from saport.simplex.formats.mps import read_mps
+from saport.simplex.solverfactory import Engine
+from typing import Callable, List
+import sys
+import time
+
+# manipulate following parameters to customize the benchmark
+ENGINES = [Engine.SPARSE, Engine.REVISED, Engine.TABLEAUX]
+
+
+def read(path: str):
+    """
+        reads the model by the file extension (.mps, .lp, optionally followed by .gz)
+    """
+    stripped = path[:-3] if path.endswith(".gz") else path
+    return read_lp(path) if stripped.endswith(".lp") else read_mps(path)
+
+
+def run(paths: List[str], print_function: Callable = print):
+    print_function(f"{'file':>30} | {'read [s]':>9} | {'engine':>9} | {'solve [s]':>10} | {'objective':>14}")
+    for path in paths:
+        start = time.perf_counter()
+        model = read(path)
+        read_time = time.perf_counter() - start
+        for engine in ENGINES:
+            start = time.perf_counter()
+            solution = model.solve(engine)
+            solve_time = time.perf_counter() - start
+            result = f"{solution.objective_value():.6g}" if solution.is_feasible and solution.is_bounded else ("unbounded" if solution.is_feasible else "unfeasible")
+            print_function(f"{path[-30:]:>30} | {read_time:>9.3f} | {engine.value:>9} | {solve_time:>10.3f} | {result:>14}")
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        print("usage: python tests/simplex/benchmark_files.py FILE.mps [FILE.lp ...]")
+    else:
+        run(sys.argv[1:])
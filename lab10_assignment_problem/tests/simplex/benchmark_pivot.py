@@ -0,0 +1,73 @@
+from saport.simplex.tableaux import Tableaux
+from typing import Callable, List, Tuple
+import numpy as np
+import time
+
+# manipulate following parameters to customize the benchmark
+SHAPES = [(100, 200), (500, 1000)]
+PIVOTS = 5
+SEED = 0
+
+
+def loop_pivot(table: np.array, row: int, col: int) -> np.array:
+    """
+        reference implementation: copies the table and eliminates cell by cell
+    """
+    rows_n, cols_n = table.shape
+    pivot_factor = table[row, col]
+
+    new_table = table.copy()
+    new_table[row] = table[row] / pivot_factor
+
+    new_table[:, col] = 0.0
+    new_table[row, col] = 1.0
+
+    for r in range(rows_n):
+        if r == row:
+            continue
+        for c in range(cols_n):
+            if c == col:
+                continue
+            new_table[r, c] = (-table[r, col]) * new_table[row, c] + table[r, c]
+
+    return new_table
+
+
+def random_table(shape: Tuple[int, int], rng: np.random.Generator) -> np.array:
+    rows_n, cols_n = shape
+    # cost row + constraint rows, last column is the right hand side
+    return rng.uniform(1.0, 10.0, size=(rows_n + 1, cols_n + 1))
+
+
+def pivot_positions(shape: Tuple[int, int], rng: np.random.Generator) -> List[Tuple[int, int]]:
+    rows_n, cols_n = shape
+    rows = rng.choice(np.arange(1, rows_n + 1), size=PIVOTS, replace=False)
+    cols = rng.choice(np.arange(cols_n), size=PIVOTS, replace=False)
+    return list(zip(rows, cols))
+
+
+def run(print_function: Callable = print):
+    rng = np.random.default_rng(SEED)
+    print_function(f"{'shape':>12} | {'loop [s/pivot]':>15} | {'vectorized [s/pivot]':>21} | {'speedup':>8}")
+    for shape in SHAPES:
+        table = random_table(shape, rng)
+        positions = pivot_positions(shape, rng)
+
+        reference = table.copy()
+        start = time.perf_counter()
+        for row, col in positions:
+            reference = loop_pivot(reference, row, col)
+        loop_time = (time.perf_counter() - start) / PIVOTS
+
+        tableaux = Tableaux(None, table)
+        start = time.perf_counter()
+        for row, col in positions:
+            tableaux.pivot(row, col)
+        vectorized_time = (time.perf_counter() - start) / PIVOTS
+
+        assert np.allclose(reference, tableaux.table), "vectorized pivot diverged from the reference loop"
+        print_function(f"{f'{shape[0]}x{shape[1]}':>12} | {loop_time:>15.6f} | {vectorized_time:>21.6f} | {loop_time / vectorized_time:>7.1f}x")
+
+
+if __name__ == '__main__':
+    run()
@@ -30,6 +30,14 @@ def run():
         assert math.isclose(bounds_pair[0], expected_bounds[i][0], abs_tol=tolerance), f"left bound of the coefficient range seems to be incorrect, expected {expected_bounds[i][0]}, got {bounds_pair[0]}"
         assert math.isclose(bounds_pair[1], expected_bounds[i][1], abs_tol=tolerance), f"right bound of the coefficient range seems to be incorrect, expected {expected_bounds[i][1]}, got {bounds_pair[1]}"
 
+    # the tableaux of a presolved solution belongs to the reduced model, its columns aren't the variables of the model
+    try:
+        ObjectiveSensitivityAnalyser().analyse(model.solve(presolve=True))
+    except Exception as error:
+        assert "presolve" in str(error), f"Unexpected error: {error}"
+    else:
+        raise AssertionError("Cost coefficients of a presolved solution can't be analysed")
+
     logging.info("Congratulations! This cost coefficients analysis look alright :)")
 
 if __name__ == '__main__':
@@ -0,0 +1,86 @@
+import logging
+from saport.simplex.model import Model
+from saport.simplex.solverfactory import Engine
+from saport.simplex.analyser import Analyser
+import numpy as np
+import math
+
+def solvable_model():
+    model = Model("example_08_solvable")
+    x1 = model.create_variable("x1")
+    x2 = model.create_variable("x2")
+    x3 = model.create_variable("x3")
+    model.add_constraint(6*x1 + 5*x2 + 8*x3 <= 60)
+    model.add_constraint(10*x1 + 20*x2 + 10*x3 <= 150)
+    model.add_constraint(x1 <= 8)
+    model.maximize(5*x1 + 4.5*x2 + 6*x3)
+    return model
+
+def artificial_vars_model():
+    model = Model("example_08_artificial_vars")
+    x1 = model.create_variable("x1")
+    x2 = model.create_variable("x2")
+    model.add_constraint(2*x1 - x2 <= -1)
+    model.add_constraint(x1 + x2 == 3)
+    model.maximize(x1 + 3 * x2)
+    return model
+
+def min_model():
+    model = Model("example_08_min")
+    x1 = model.create_variable("x1")
+    x2 = model.create_variable("x2")
+    x3 = model.create_variable("x3")
+    model.add_constraint(x1 + 3*x2 + 2*x3 <= 10)
+    model.add_constraint(-1*x1 - 5*x2 - 1*x3 >= -8)
+    model.minimize(-8 * x1 - 10 * x2 - 7 * x3)
+    return model
+
+def unbounded_model():
+    model = Model("example_08_unbounded")
+    x1 = model.create_variable("x1")
+    x2 = model.create_variable("x2")
+    x3 = model.create_variable("x3")
+    model.add_constraint(x1 + 3*x2 + 2*x3 >= 10)
+    model.add_constraint(x1 + 5*x2 + 1*x3 >= -7)
+    model.maximize(5 * x1 + 8 * x2)
+    return model
+
+def unfeasible_model():
+    model = Model("example_08_unfeasible")
+    x1 = model.create_variable("x1")
+    x2 = model.create_variable("x2")
+    model.add_constraint(2*x1 - x2 <= -1)
+    model.add_constraint(x1 + x2 == 3)
+    model.add_constraint(x1 + x2 >= 4)
+    model.maximize(x1 + 3 * x2)
+    return model
+
+def run():
+    for create_model in [solvable_model, artificial_vars_model, min_model, unbounded_model, unfeasible_model]:
+        tableaux_solution = create_model().solve(Engine.TABLEAUX)
+        revised_solution = create_model().solve(Engine.REVISED)
+        name = tableaux_solution.model.name
+
+        assert tableaux_solution.is_feasible == revised_solution.is_feasible, f"engines disagree on feasibility of {name}"
+        assert tableaux_solution.is_bounded == revised_solution.is_bounded, f"engines disagree on boundedness of {name}"
+        if tableaux_solution.assignment == None:
+            continue
+
+        assert np.allclose(tableaux_solution.assignment, revised_solution.assignment), f"engines found different solutions for {name}"
+        assert np.allclose(tableaux_solution.tableaux.table, revised_solution.tableaux.table), f"engines ended with different tableaux for {name}"
+        assert np.allclose(tableaux_solution.initial_tableaux.table, revised_solution.initial_tableaux.table), f"engines started with different tableaux for {name}"
+
+    analyser = Analyser()
+    tableaux_results = analyser.analyse(solvable_model().solve(Engine.TABLEAUX))
+    revised_results = analyser.analyse(solvable_model().solve(Engine.REVISED))
+    for tool_name, results in tableaux_results.items():
+        for (expected, got) in zip(results, revised_results[tool_name]):
+            for (e, g) in zip(expected, got):
+                assert math.isclose(e, g, abs_tol=0.001), f"{tool_name} results differ between engines: expected {expected}, got {got}"
+
+    logging.info("Congratulations! The revised simplex engine agrees with the tableaux one :)")
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    run()
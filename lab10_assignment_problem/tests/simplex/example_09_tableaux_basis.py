@@ -0,0 +1,39 @@
+import logging
+from saport.simplex.model import Model
+from saport.simplex.tableaux import Tableaux
+import numpy as np
+
+def run():
+    model = Model("example_09_tableaux_basis")
+
+    x1 = model.create_variable("x1")
+    x2 = model.create_variable("x2")
+
+    model.add_constraint(x1 <= 150)
+    model.add_constraint(x2 <= 250)
+    model.add_constraint(2*x1 + x2 <= 500)
+
+    model.maximize(8 * x1 + 5 * x2)
+
+    solution = model.solve()
+    tableaux = solution.tableaux
+    basis = tableaux.extract_basis()
+
+    assert sorted(basis) == [0, 1, 2], f"basis tracked during pivots is incorrect: {basis}"
+    for (i, col) in enumerate(basis):
+        assert tableaux.is_basic(col) and tableaux.basis_row(col) == i + 1, f"variable {col} should be basic in row {i + 1}"
+    assert not tableaux.is_basic(3) and tableaux.basis_row(3) == None, "slack variable s1 shouldn't be basic"
+
+    # round-off noise in the table shouldn't break the basis detection
+    noisy_table = tableaux.table.copy()
+    noisy_table[:, basis] += 1e-12
+    noisy_tableaux = Tableaux(tableaux.model, noisy_table)
+    assert noisy_tableaux.extract_basis() == basis, "basis should be detected despite the round-off"
+    assert np.allclose(noisy_tableaux.extract_assignment(), tableaux.extract_assignment()), "assignment should survive the round-off"
+
+    logging.info("Congratulations! The basis is tracked correctly :)")
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    run()
@@ -0,0 +1,51 @@
+import logging
+from saport.simplex.model import Model
+from saport.simplex.solverfactory import Engine
+from saport.simplex.pricing import Pricing
+import math
+
+def degenerate_model():
+    # Beale's example, classic degenerate problem used to show cycling of the simplex method
+    model = Model("example_10_degenerate")
+
+    x4 = model.create_variable("x4")
+    x5 = model.create_variable("x5")
+    x6 = model.create_variable("x6")
+    x7 = model.create_variable("x7")
+
+    model.add_constraint(0.25*x4 - 8*x5 - x6 + 9*x7 <= 0)
+    model.add_constraint(0.5*x4 - 12*x5 - 0.5*x6 + 3*x7 <= 0)
+    model.add_constraint(x6 <= 1)
+
+    model.maximize(0.75*x4 - 20*x5 + 0.5*x6 - 6*x7)
+    return model
+
+def artificial_vars_model():
+    model = Model("example_10_artificial_vars")
+
+    x1 = model.create_variable("x1")
+    x2 = model.create_variable("x2")
+    x3 = model.create_variable("x3")
+
+    model.add_constraint(x1 + x2 + x3 == 10)
+    model.add_constraint(2*x1 - x2 >= 2)
+    model.add_constraint(x2 + 3*x3 <= 15)
+
+    model.minimize(3*x1 + 2*x2 + 4*x3)
+    return model
+
+def run():
+    for (create_model, expected) in [(degenerate_model, 1.25), (artificial_vars_model, 24.0)]:
+        for engine in Engine:
+            for pricing in Pricing:
+                solution = create_model().solve(engine, pricing)
+                assert math.isclose(solution.objective_value(), expected, abs_tol=0.0001), f"{pricing} pricing ({engine}) found an incorrect solution: expected {expected}, got {solution.objective_value()}"
+                assert solution.iterations > 0, f"{pricing} pricing ({engine}) didn't record the number of pivots"
+                logging.info(f"{solution.model.name}, {engine}, {pricing}: {solution.iterations} pivots")
+
+    logging.info("Congratulations! All the pricing rules found the optimum :)")
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    run()
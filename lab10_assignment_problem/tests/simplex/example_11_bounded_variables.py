@@ -0,0 +1,54 @@
+import logging
+from saport.simplex.model import Model
+from saport.simplex.solverfactory import Engine
+import math
+
+def create_model(bounds_as_constraints):
+    model = Model("example_11_bounded_variables")
+
+    x1 = model.create_variable("x1")
+    x2 = model.create_variable("x2")
+    x3 = model.create_variable("x3")
+
+    model.add_constraint(x1 + x2 + x3 <= 10)
+    model.add_constraint(x1 - x2 + 2*x3 >= 2)
+
+    if bounds_as_constraints:
+        model.add_constraint(x1 <= 4)
+        model.add_constraint(x2 >= 1)
+        model.add_constraint(x2 <= 3)
+        model.add_constraint(x3 <= 2.5)
+    else:
+        model.set_upper_bound(x1, 4)
+        model.set_lower_bound(x2, 1)
+        model.set_upper_bound(x2, 3)
+        model.set_upper_bound(x3, 2.5)
+
+    model.maximize(3*x1 + 2*x2 + 4*x3)
+    return model
+
+def run():
+    reference = create_model(True).solve()
+    expected_value = 3*4 + 2*3 + 4*2.5
+    assert math.isclose(reference.objective_value(), expected_value, abs_tol=0.0001), "Your algorithm found an incorrect solution for the model with the bound constraints"
+
+    for engine in Engine:
+        model = create_model(False)
+        solution = model.solve(engine)
+        assert len(solution.normal_model.constraints) == 2, f"Bounds shouldn't be turned into constraints ({engine})"
+        assert math.isclose(solution.objective_value(), expected_value, abs_tol=0.0001), f"Your algorithm ({engine}) found an incorrect solution: expected {expected_value}, got {solution.objective_value()}"
+        for (var, expected) in zip(model.variables, [4.0, 3.0, 2.5]):
+            assert math.isclose(solution.value(var), expected, abs_tol=0.0001), f"Your algorithm ({engine}) assigned {var.name} = {solution.value(var)}, expected {expected}"
+
+    unfeasible = create_model(False)
+    unfeasible.set_lower_bound(unfeasible.variables[0], 5)
+    for engine in Engine:
+        solution = unfeasible.solve(engine)
+        assert not solution.is_feasible, f"Your algorithm ({engine}) didn't notice that the lower bound exceeds the upper bound"
+
+    logging.info("Congratulations! Bounded variables are handled without extra constraints :)")
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    run()
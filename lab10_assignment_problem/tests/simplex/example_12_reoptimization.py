@@ -0,0 +1,49 @@
+import logging
+from saport.simplex.model import Model
+from saport.simplex.solverfactory import Engine, SolverFactory
+from saport.simplex.expressions.expression import Expression
+import math
+
+def create_model():
+    model = Model("example_12_reoptimization")
+
+    xs = [model.create_variable(f"x{i}") for i in range(6)]
+
+    model.add_constraint(Expression.from_vectors(xs, [2, 3, 1, 4, 2, 1]) <= 25.5)
+    model.add_constraint(Expression.from_vectors(xs, [1, 4, 2, 1, 3, 2]) <= 31)
+    model.add_constraint(Expression.from_vectors(xs, [3, 1, 4, 2, 1, 3]) <= 36.5)
+    model.add_constraint(Expression.from_vectors(xs, [2, 2, 2, 3, 4, 1]) <= 29)
+
+    model.maximize(Expression.from_vectors(xs, [4, 5, 3, 6, 4, 2]))
+    return model
+
+def run():
+    # the sparse engine keeps no tableaux to re-optimize
+    for engine in [Engine.TABLEAUX, Engine.REVISED]:
+        solver = SolverFactory.solver(engine)
+        solution = solver.solve(create_model())
+        x2 = solution.model.variables[1]
+
+        # branch as the branch and bound would do on the fractional x2 = 3.5
+        cuts = [x2 <= math.floor(solution.value(x2))]
+        reoptimized = solver.reoptimize(solution, cuts, compare=True)
+
+        cold_model = create_model()
+        for cut in cuts:
+            cold_model.add_constraint(cut)
+        cold = cold_model.solve(engine)
+
+        assert math.isclose(reoptimized.objective_value(), cold.objective_value(), abs_tol=0.0001), f"Dual simplex ({engine}) found an incorrect solution: expected {cold.objective_value()}, got {reoptimized.objective_value()}"
+        assert reoptimized.saved_iterations == cold.iterations - reoptimized.iterations, f"Dual simplex ({engine}) reported incorrect number of saved pivots"
+        assert reoptimized.saved_iterations > 0, f"Dual simplex ({engine}) should need fewer pivots than solving the model from scratch"
+        logging.info(f"{engine}: {reoptimized.iterations} pivots after adding the cuts, {reoptimized.saved_iterations} saved")
+
+        unfeasible = solver.reoptimize(solution, [Expression.from_vectors(solution.model.variables, [1] * 6) >= 100])
+        assert not unfeasible.is_feasible, f"Dual simplex ({engine}) didn't notice the model became unfeasible"
+
+    logging.info("Congratulations! The dual simplex re-optimizes the models correctly :)")
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    run()
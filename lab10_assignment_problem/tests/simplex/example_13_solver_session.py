@@ -0,0 +1,74 @@
+import logging
+from copy import deepcopy
+from saport.simplex.model import Model
+from saport.simplex.solverfactory import Engine
+from saport.simplex.session import SolverSession
+import math
+
+def create_model():
+    model = Model("example_13_solver_session")
+
+    x1 = model.create_variable("x1")
+    x2 = model.create_variable("x2")
+    x3 = model.create_variable("x3")
+
+    model.add_constraint(2*x1 + x2 + x3 <= 14)
+    model.add_constraint(4*x1 + 2*x2 + 3*x3 <= 28)
+    model.add_constraint(2*x1 + 5*x2 + 5*x3 <= 30)
+    model.add_constraint(x1 + x2 + x3 >= 2)
+
+    model.maximize(x1 + 2*x2 - x3)
+    return model
+
+def check(session, engine, edit):
+    solution = session.solve()
+    expected = deepcopy(session.model).solve(engine)
+    assert math.isclose(solution.objective_value(), expected.objective_value(), abs_tol=0.0001), f"Session ({engine}) found an incorrect solution after {edit}: expected {expected.objective_value()}, got {solution.objective_value()}"
+    return expected.iterations
+
+def run():
+    # the sparse engine keeps no tableaux to re-optimize
+    for engine in [Engine.TABLEAUX, Engine.REVISED]:
+        session = SolverSession(create_model(), engine)
+        x1, x2, x3 = session.model.variables
+        cold_iterations = check(session, engine, "the first solve")
+
+        for factor in [3, 4, 5, 6]:
+            session.set_objective_coefficient(x1, factor)
+            cold_iterations += check(session, engine, f"changing the objective factor to {factor}")
+
+        for bound in [5, 3, 1]:
+            session.set_upper_bound(x1, bound)
+            cold_iterations += check(session, engine, f"setting the upper bound to {bound}")
+
+        # the solutions keep their own tableaux and normal model, the next edits don't change them
+        solution = session.solution
+        (table, upper_bounds) = (solution.tableaux.table.copy(), list(solution.normal_model.upper_bounds))
+        assert solution.tableaux.model is solution.normal_model, f"Solution ({engine}) tableaux should belong to its normal model"
+
+        session.set_lower_bound(x3, 0.5)
+        cold_iterations += check(session, engine, "setting the lower bound")
+        session.set_upper_bound(x2, 2.5)
+        assert (solution.tableaux.table == table).all() and solution.normal_model.upper_bounds == upper_bounds, f"Session ({engine}) has changed the tableaux of an earlier solution"
+        cold_iterations += check(session, engine, "setting the upper bound of another variable")
+
+        cut = x1 + x2 <= 4
+        session.add_constraint(cut)
+        cold_iterations += check(session, engine, "adding a constraint")
+
+        session.remove_constraint(session.model.constraints[2])
+        cold_iterations += check(session, engine, "removing a constraint")
+
+        session.remove_constraint(cut)
+        cold_iterations += check(session, engine, "removing the added constraint")
+
+        assert session.cold_solves == 1, f"Session ({engine}) should solve the model from scratch only once, it did {session.cold_solves} times"
+        assert session.iterations < cold_iterations, f"Session ({engine}) should need fewer pivots ({session.iterations}) than the solves from scratch ({cold_iterations})"
+        logging.info(f"{engine}: {session.iterations} pivots in the session, {cold_iterations} when solving from scratch")
+
+    logging.info("Congratulations! The solver session re-optimizes the edited models correctly :)")
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    run()
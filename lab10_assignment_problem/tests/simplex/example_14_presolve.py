@@ -0,0 +1,68 @@
+import logging
+from saport.simplex.model import Model
+from saport.simplex.solverfactory import Engine
+from saport.simplex.analysis_tools.rhs_sensitivity import RHSSensitivityAnalyser
+import math
+
+def create_model():
+    model = Model("example_14_presolve")
+
+    x1 = model.create_variable("x1")
+    x2 = model.create_variable("x2")
+    x3 = model.create_variable("x3")
+    x4 = model.create_variable("x4")
+
+    model.add_constraint(x1 + 2*x2 + x3 <= 10)
+    # duplicate of the first row
+    model.add_constraint(2*x1 + 4*x2 + 2*x3 <= 24)
+    # singleton rows, that are just bounds
+    model.add_constraint(x2 <= 3)
+    model.add_constraint(-2*x3 >= -8)
+    # a row, that can't be violated within the bounds
+    model.add_constraint(x2 + x4 <= 100)
+    # empty row
+    model.add_constraint(0*x1 <= 5)
+    model.add_constraint(x1 + x2 + x3 + x4 >= 2)
+
+    # fixed variable
+    model.set_lower_bound(x4, 2)
+    model.set_upper_bound(x4, 2)
+
+    model.maximize(3*x1 + 2*x2 + 4*x3 + x4)
+    return model
+
+def run():
+    expected = create_model().solve()
+
+    for engine in Engine:
+        solution = create_model().solve(engine, presolve=True)
+        stats = solution.presolve_stats
+        assert math.isclose(solution.objective_value(), expected.objective_value(), abs_tol=0.0001), f"Presolved model ({engine}) has an incorrect solution: expected {expected.objective_value()}, got {solution.objective_value()}"
+        assert len(solution.assignment) == 4, f"Postsolve ({engine}) should map the assignment back to all the original variables"
+        assert math.isclose(solution.assignment[3], 2.0), f"Postsolve ({engine}) should restore the fixed variable"
+        assert stats.columns_removed == 1, f"Presolve ({engine}) should remove the fixed variable, removed {stats.columns_removed} columns"
+        assert stats.rows_removed >= 5, f"Presolve ({engine}) should remove at least the duplicate, singleton, dominated and empty rows, removed {stats.rows_removed}"
+        assert len(solution.normal_model.constraints) < len(expected.normal_model.constraints), f"Presolve ({engine}) should make the tableaux smaller"
+        logging.info(f"{engine}: {stats}")
+
+    # the dropped rows get zero, the singleton "-2*x3 >= -8" holds x3 at its bound, so it gets the reduced cost of x3
+    expected_duals = RHSSensitivityAnalyser().shadow_prices(expected)
+    for engine in [Engine.TABLEAUX, Engine.REVISED]:
+        duals = create_model().solve(engine, presolve=True).duals
+        assert len(duals) == 7, f"Dual postsolve ({engine}) should give a shadow price of every original constraint, got {duals}"
+        for (i, (dual, expected_dual)) in enumerate(zip(duals, expected_duals)):
+            assert math.isclose(dual, expected_dual, abs_tol=0.0001), f"Dual postsolve ({engine}) should give shadow price {expected_dual} to constraint {i}, got {dual}"
+    assert RHSSensitivityAnalyser().shadow_prices(create_model().solve(presolve=True)) == expected_duals, "Shadow prices of a presolved solution should be read from its duals"
+
+    unfeasible = create_model()
+    unfeasible.add_constraint(unfeasible.variables[1] >= 4)
+    solution = unfeasible.solve(presolve=True)
+    assert not solution.is_feasible, "Presolve should notice the conflicting bounds"
+    assert solution.tableaux == None, "Presolve should prove the model unfeasible without building the tableaux"
+
+    logging.info("Congratulations! The presolve reduces the model correctly :)")
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    run()
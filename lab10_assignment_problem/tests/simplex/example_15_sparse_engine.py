@@ -0,0 +1,44 @@
+import logging
+from saport.simplex.model import Model
+from saport.simplex.solverfactory import Engine
+from saport.simplex.sparse import SparseMatrix
+from saport.simplex.expressions.expression import Expression
+import math
+
+def create_model(n):
+    model = Model("example_15_sparse_engine")
+
+    # transportation-like model, every constraint touches only n out of n * n variables
+    x = [[model.create_variable(f"x{i}_{j}") for j in range(n)] for i in range(n)]
+    for i in range(n):
+        model.add_constraint(Expression(*x[i]) <= 10 + i)
+        model.add_constraint(Expression(*[x[j][i] for j in range(n)]) >= 5)
+
+    model.minimize(Expression(*[((3 * i + 5 * j) % 7 + 1) * x[i][j] for i in range(n) for j in range(n)]))
+    return model
+
+def run():
+    n = 8
+    expected = create_model(n).solve(Engine.TABLEAUX)
+    solution = create_model(n).solve(Engine.SPARSE)
+    assert math.isclose(solution.objective_value(), expected.objective_value(), abs_tol=0.0001), f"Sparse engine found an incorrect solution: expected {expected.objective_value()}, got {solution.objective_value()}"
+    assert solution.tableaux == None, "Sparse engine shouldn't build the tableaux"
+
+    model = create_model(n)
+    matrix = SparseMatrix.from_constraints(model.constraints, len(model.variables))
+    assert matrix.shape == (2 * n, n * n), f"Sparse matrix should have shape {(2 * n, n * n)}, got {matrix.shape}"
+    assert matrix.nnz() == 2 * n * n, f"Sparse matrix should keep only the {2 * n * n} nonzeros, got {matrix.nnz()}"
+
+    dense = matrix.to_dense()
+    x = [float(i % 5) for i in range(n * n)]
+    y = [float(i % 3) for i in range(2 * n)]
+    assert all(map(math.isclose, matrix.dot(x), dense.dot(x))), "Sparse product A * x differs from the dense one"
+    assert all(map(math.isclose, matrix.rdot(y), dense.T.dot(y))), "Sparse product y * A differs from the dense one"
+
+    logging.info(f"Sparse matrix keeps {matrix.nnz()} out of {2 * n * n * n} factors")
+    logging.info("Congratulations! The sparse engine works correctly :)")
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    run()
@@ -0,0 +1,53 @@
+import logging
+from saport.simplex.model import Model
+from saport.simplex.array_model import ArrayModel
+from saport.simplex.solverfactory import Engine
+from saport.simplex.expressions.constraint import ConstraintType
+from saport.simplex.expressions.objective import ObjectiveType
+import math
+
+def create_model(model):
+    x1 = model.create_variable("x1")
+    x2 = model.create_variable("x2")
+    x3 = model.create_variable("x3")
+
+    model.add_constraint(x1 + x2 + x3 <= 30)
+    model.add_constraint(x1 + 2*x2 + x3 >= 10)
+    model.add_constraint(2*x2 + x3 <= 20)
+    model.set_upper_bound(x1, 12)
+
+    model.maximize(2*x1 + x2 + 3*x3)
+    return model
+
+def run():
+    expected = create_model(Model("example_16_array_model")).solve()
+    model = create_model(ArrayModel("example_16_array_model"))
+
+    assert list(model.rows) == [0, 0, 0, 1, 1, 1, 2, 2], f"Array model stores wrong rows of the factors: {list(model.rows)}"
+    assert list(model.values) == [1, 1, 1, 1, 2, 1, 2, 1], f"Array model stores wrong factors: {list(model.values)}"
+    assert list(model.types) == [-1, 1, -1], f"Array model stores wrong constraint types: {list(model.types)}"
+    assert model.matrix().nnz() == 8, "Constraints matrix should keep only the stored factors"
+    assert model.to_model().is_equivalent(create_model(Model("equivalent"))), "Array model should translate to an equivalent Model"
+
+    for engine in Engine:
+        solution = model.solve(engine)
+        assert math.isclose(solution.objective_value(), expected.objective_value(), abs_tol=0.0001), f"Array model ({engine}) has an incorrect solution: expected {expected.objective_value()}, got {solution.objective_value()}"
+
+    # rows and objective can skip the expressions altogether
+    direct = ArrayModel("example_16_array_model_direct")
+    for name in ["x1", "x2", "x3"]:
+        direct.create_variable(name)
+    direct.add_row([0, 1, 2], [1, 1, 1], ConstraintType.LE, 30)
+    direct.add_row([0, 1, 2], [1, 2, 1], ConstraintType.GE, 10)
+    direct.add_row([1, 2], [2, 1], ConstraintType.LE, 20)
+    direct.set_upper_bound(direct.variables[0], 12)
+    direct.set_objective([2, 1, 3], ObjectiveType.MAX)
+    solution = direct.solve()
+    assert math.isclose(solution.objective_value(), expected.objective_value(), abs_tol=0.0001), f"Array model built from the rows has an incorrect solution: expected {expected.objective_value()}, got {solution.objective_value()}"
+
+    logging.info("Congratulations! The array model works correctly :)")
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    run()
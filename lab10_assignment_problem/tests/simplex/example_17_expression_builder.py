@@ -0,0 +1,42 @@
+import logging
+from saport.simplex.model import Model
+from saport.simplex.expressions.builder import ExpressionBuilder, quicksum
+import math
+import time
+
+def run():
+    model = Model("example_17_expression_builder")
+    x1 = model.create_variable("x1")
+    x2 = model.create_variable("x2")
+    x3 = model.create_variable("x3")
+
+    expression = quicksum([x1, 2*x2, 3*x1, x3 - x2])
+    assert expression.factors(model) == [4.0, 1.0, 1.0], f"Quicksum should merge the repeated variables, got {expression.factors(model)}"
+    assert len(expression.atoms) == 3, f"Quicksum should keep one atom per variable, got {len(expression.atoms)}"
+
+    builder = ExpressionBuilder(x1)
+    builder += 2*x2 + x3
+    builder -= x1 + x3
+    constraint = builder <= 5
+    assert constraint.expression.factors(model) == [0.0, 2.0, 0.0], f"Builder should subtract the whole expression, got {constraint.expression.factors(model)}"
+    assert constraint.bound == 5, "Builder should create constraints like the expressions do"
+
+    model.add_constraint(quicksum([x1, x2, x3]) <= 10)
+    model.maximize(quicksum(factor * var for (factor, var) in zip([1, 2, 3], model.variables)))
+    solution = model.solve()
+    assert math.isclose(solution.objective_value(), 30.0), f"Model built with quicksum has an incorrect solution: {solution.objective_value()}"
+
+    big_model = Model("example_17_expression_builder_big")
+    variables = [big_model.create_variable(f"y{i}") for i in range(20000)]
+    start = time.time()
+    expression = quicksum(i * var for (i, var) in enumerate(variables))
+    elapsed = time.time() - start
+    assert len(expression.atoms) == len(variables), "Quicksum should keep all the variables"
+    assert elapsed < 1.0, f"Quicksum should sum 20000 terms in linear time, it took {elapsed:.2f}s"
+
+    logging.info("Congratulations! The expression builder works correctly :)")
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    run()
@@ -0,0 +1,65 @@
+import logging
+from saport.simplex.model import Model
+from saport.simplex.array_model import ArrayModel
+from saport.simplex.sparse import SparseMatrix
+from saport.simplex.expressions.constraint import ConstraintType
+from saport.simplex.expressions.expression import RowExpression
+import numpy as np
+import math
+
+def create_model(model):
+    x1 = model.create_variable("x1")
+    x2 = model.create_variable("x2")
+    x3 = model.create_variable("x3")
+
+    model.add_constraint(x1 + x2 + x3 <= 30)
+    model.add_constraint(x1 + 2*x2 + x3 >= 10)
+    model.add_constraint(2*x2 + x3 <= 20)
+
+    model.maximize(2*x1 + x2 + 3*x3)
+    return model
+
+def create_bulk_model(model, factors):
+    xs = model.create_variables(3, "x")
+    model.add_constraints_from_arrays(factors, [30, 10, 20], [ConstraintType.LE, 1, -1])
+    model.maximize(2*xs[0] + xs[1] + 3*xs[2])
+    return model
+
+def run():
+    factors = np.array([[1, 1, 1], [1, 2, 1], [0, 2, 1]])
+    expected_model = create_model(Model("example_18_bulk_arrays"))
+    expected = expected_model.solve()
+
+    for model in [Model("example_18_bulk_arrays"), ArrayModel("example_18_bulk_arrays")]:
+        for matrix in [factors, SparseMatrix.from_dense(factors)]:
+            bulk_model = create_bulk_model(type(model)(model.name), matrix)
+            assert [var.name for var in bulk_model.variables] == ["x0", "x1", "x2"], "Variables should be named with the prefix and their number"
+            solution = bulk_model.solve()
+            assert math.isclose(solution.objective_value(), expected.objective_value(), abs_tol=0.0001), f"Model built from the arrays ({type(model).__name__}) has an incorrect solution: expected {expected.objective_value()}, got {solution.objective_value()}"
+
+    # the rows are kept as the slices of the matrix, their factors are read without creating the atoms
+    model = create_bulk_model(Model("example_18_bulk_arrays"), factors)
+    assert isinstance(model.constraints[1].expression, RowExpression), "Rows of the matrix should be kept as the row expressions"
+    assert model.constraints[1].expression.factors(model) == [1.0, 2.0, 1.0], f"Row expression has incorrect factors: {model.constraints[1].expression.factors(model)}"
+    assert model.dual().is_equivalent(expected_model.dual()), "Dual of the model built from the arrays should be equivalent to the one built from the expressions"
+    assert model.is_equivalent(expected_model), "Model built from the arrays should be equivalent to the one built from the expressions"
+    assert len(model.constraints[2].expression.atoms) == 2, "Only the nonzero factors should become atoms"
+
+    # columns of the matrix can refer to a subset of the variables
+    model.add_constraints_from_arrays(np.array([[1, 1]]), 25, ConstraintType.LE, [model.variables[0], model.variables[2]])
+    solution = model.solve()
+    assert math.isclose(solution.objective_value(), 70.0, abs_tol=0.0001), f"Constraint added for a subset of the variables is ignored: got {solution.objective_value()}"
+
+    try:
+        model.create_variables(2, "x")
+    except Exception as error:
+        assert "x0" in str(error), f"Unexpected error: {error}"
+    else:
+        raise AssertionError("Variable names should be unique")
+
+    logging.info("Congratulations! The bulk array API works correctly :)")
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    run()
@@ -0,0 +1,52 @@
+import logging
+from saport.simplex.model import Model
+from saport.simplex.solverfactory import Engine
+import math
+
+def create_model():
+    model = Model("example_19_model_copy")
+
+    x1 = model.create_variable("x1")
+    x2 = model.create_variable("x2")
+    x3 = model.create_variable("x3")
+
+    model.add_constraint(x1 + x2 + x3 <= 30)
+    model.add_constraint(x1 + 2*x2 + x3 >= 10)
+    model.add_constraint(-2*x2 - x3 >= -20)
+    model.set_lower_bound(x3, 1)
+
+    model.minimize(-2*x1 - x2 - 3*x3)
+    return model
+
+def snapshot(model):
+    return [str(c) for c in model.constraints] + [str(model.objective), str(model.lower_bounds), str(model.upper_bounds)]
+
+def run():
+    model = create_model()
+    before = snapshot(model)
+
+    copied = model.copy()
+    assert all(c1 is c2 for (c1, c2) in zip(model.constraints, copied.constraints)), "Copy should share the constraints with the original"
+    copied.add_constraint(copied.variables[0] <= 5)
+    copied.set_upper_bound(copied.variables[1], 3)
+    assert len(model.constraints) == 3 and model.upper_bounds[1] == float('inf'), "Changes of the copy shouldn't affect the original"
+
+    model.translate_to_standard_form()
+    model.dual()
+    for engine in Engine:
+        solution = model.solve(engine)
+        assert math.isclose(solution.objective_value(), -80.0, abs_tol=0.0001), f"Model ({engine}) has an incorrect solution: {solution.objective_value()}"
+        presolved = model.solve(engine, presolve=True)
+        assert math.isclose(presolved.objective_value(), -80.0, abs_tol=0.0001), f"Presolved model ({engine}) has an incorrect solution: {presolved.objective_value()}"
+    assert snapshot(model) == before, "Normalizing and solving the model shouldn't change the shared constraints and objective"
+
+    copied_solution = copied.solve()
+    assert math.isclose(copied_solution.objective_value(), -70.0, abs_tol=0.0001), f"Copied model has an incorrect solution: {copied_solution.objective_value()}"
+    assert snapshot(model) == before, "Solving the copy shouldn't change the original"
+
+    logging.info("Congratulations! The model copies share the constraints safely :)")
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    run()
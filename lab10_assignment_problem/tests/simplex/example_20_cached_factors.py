@@ -0,0 +1,49 @@
+import logging
+from saport.simplex.model import Model
+from saport.simplex.expressions.builder import quicksum
+import time
+
+def run():
+    model = Model("example_20_cached_factors")
+    x1 = model.create_variable("x1")
+    x2 = model.create_variable("x2")
+    x3 = model.create_variable("x3")
+
+    constraint = 2*x1 + x3 - 4*x1 <= 5
+    expression = constraint.expression
+    assert expression.factors(model) == [-2.0, 0.0, 1.0], f"Expression has incorrect factors: {expression.factors(model)}"
+    assert expression.coefficient(x1) == -2.0 and expression.coefficient(x2) == 0.0, "Expression has incorrect coefficients"
+    assert expression.simplify() is expression.simplify(), "Simplified expression should be built only once"
+
+    factors = expression.factors(model)
+    factors[0] = 100.0
+    assert expression.factors(model)[0] == -2.0, "Changing the returned factors shouldn't change the expression"
+
+    x4 = model.create_variable("x4")
+    assert expression.factors(model) == [-2.0, 0.0, 1.0, 0.0], "Factors should follow the number of the model variables"
+
+    constraint.invert()
+    assert constraint.expression.factors(model) == [2.0, 0.0, -1.0, 0.0], f"Inverted constraint has stale factors: {constraint.expression.factors(model)}"
+    expression.atoms = (x4 * 3,)
+    assert expression.factors(model) == [0.0, 0.0, 0.0, 3.0], f"Expression with replaced atoms has stale factors: {expression.factors(model)}"
+
+    model.maximize(x1 + 0*x3)
+    assert model.objective.depends_on_variable(model, x1), "Objective depends on x1"
+    assert not model.objective.depends_on_variable(model, x3), "Objective doesn't depend on x3"
+
+    # every query of a large objective should be O(1) after the first one
+    big_model = Model("example_20_cached_factors_big")
+    variables = big_model.create_variables(20000, "y")
+    big_model.maximize(quicksum(variables[::2]))
+    start = time.time()
+    dependent = [var for var in variables if big_model.objective.depends_on_variable(big_model, var)]
+    elapsed = time.time() - start
+    assert len(dependent) == 10000, f"Objective should depend on every second variable, got {len(dependent)}"
+    assert elapsed < 1.0, f"Checking the objective dependencies should be linear, it took {elapsed:.2f}s"
+
+    logging.info("Congratulations! The expression factors are cached correctly :)")
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    run()
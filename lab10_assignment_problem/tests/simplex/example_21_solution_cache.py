@@ -0,0 +1,54 @@
+import logging
+from saport.simplex.model import Model
+from saport.simplex.array_model import ArrayModel
+from saport.simplex.cache import SolutionCache, fingerprint
+from saport.simplex.solverfactory import Engine
+
+
+def create_model(name, prefix, bound = 150):
+    model = Model(name)
+    x1 = model.create_variable(f"{prefix}1")
+    x2 = model.create_variable(f"{prefix}2")
+    x3 = model.create_variable(f"{prefix}3")
+    model.add_constraint(x1 + x2 + x3 <= 30)
+    model.add_constraint(x1 + 2*x2 + x3 >= 10)
+    model.add_constraint(2*x2 + x3 <= 20)
+    model.maximize(2*x1 + x2 + 3*x3)
+    model.add_constraint(x1 <= bound)
+    return model
+
+
+def run():
+    model = create_model("example_21_solution_cache", "x")
+    renamed = create_model("example_21_solution_cache_renamed", "y")
+    changed = create_model("example_21_solution_cache_changed", "x", bound = 5)
+    assert fingerprint(model) == fingerprint(renamed), "Models differing only in the names should have the same fingerprint"
+    assert fingerprint(model) != fingerprint(changed), "Different models should have different fingerprints"
+    assert model.is_equivalent(renamed) and not model.is_equivalent(changed), "Models are compared incorrectly"
+    assert fingerprint(ArrayModel.from_model(model)) == fingerprint(model), "Array model should have the same fingerprint as the model"
+
+    cache = SolutionCache(max_size = 2)
+    solution = model.solve(cache = cache)
+    renamed_solution = renamed.solve(cache = cache)
+    assert (cache.hits, cache.misses) == (1, 1), f"Renamed model should be found in the cache, got {cache.hits} hits and {cache.misses} misses"
+    assert renamed_solution.objective_value() == solution.objective_value() == 80, "Cached solution has incorrect objective value"
+    assert renamed_solution.model.name == renamed.name, "Cached solution should belong to the requesting model"
+    assert renamed_solution.assignment is not solution.assignment, "Cached solutions shouldn't share the assignment"
+
+    model.solve(Engine.REVISED, cache = cache)
+    assert cache.misses == 2, "Solutions of different engines should be cached separately"
+    changed_solution = changed.solve(cache = cache)
+    assert changed_solution.objective_value() == 70 and len(cache) == 2, "Changed model should have its own solution"
+
+    model.solve(cache = cache)
+    assert cache.misses == 4, "The least recently used solution should have been dropped"
+
+    cache.clear()
+    assert len(cache) == 0 and cache.hits == cache.misses == 0, "Cleared cache should be empty"
+
+    logging.info("Congratulations! The solutions are cached correctly :)")
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    run()
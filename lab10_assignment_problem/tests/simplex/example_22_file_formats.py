@@ -0,0 +1,110 @@
+import logging
+import os
+import tempfile
+from saport.simplex.model import Model
+from saport.simplex.formats.mps import read_mps, write_mps
+from saport.simplex.formats.lp import read_lp, write_lp
+
+MPS_FILE = """* ranged and bounded problem
+NAME          example_22_mps
+OBJSENSE
+    MAX
+ROWS
+ N  profit
+ L  lim1
+ G  lim2
+ E  myeqn
+ N  unused
+COLUMNS
+    x1        profit    1.0        lim1      1.0
+    x1        lim2      1.0
+    MARKER    'MARKER'  'INTORG'
+    x2        profit    2.0        lim1      1.0
+    x2        myeqn     -1.0       unused    7.0
+    MARKER    'MARKER'  'INTEND'
+    x3        profit    -1.0       myeqn     1.0
+RHS
+    rhs       lim1      4.0        lim2      1.0
+    rhs       myeqn     -0.5
+RANGES
+    rng       lim1      2.5
+BOUNDS
+ UP bnd       x1        4.0
+ LO bnd       x2        -1.0
+ UP bnd       x2        1.0
+ BV bnd       x3
+ENDATA
+"""
+
+LP_FILE = """\\ Problem name: example_22_lp
+Minimize
+ cost: 2 x + 3y
+   - z
+Subject To
+ c1: x + y >= 2
+ c2: - x + 2 z
+     <= 4
+ 3 x - y = -1
+Bounds
+ x <= 10
+ -2 <= z <= 3
+ y >= 0.5
+Generals
+ x
+End
+"""
+
+
+def run():
+    directory = tempfile.mkdtemp()
+    mps_path = os.path.join(directory, "example.mps")
+    with open(mps_path, "w") as file:
+        file.write(MPS_FILE)
+    mps_model = read_mps(mps_path)
+    assert mps_model.name == "example_22_mps", f"Model has incorrect name: {mps_model.name}"
+    assert [var.name for var in mps_model.variables] == ["x1", "x2", "x3"], "Variables should keep the order of the file"
+    assert mps_model.types.tolist() == [-1, 1, 0, 1], f"Ranged row should become two constraints, got types {mps_model.types.tolist()}"
+    assert mps_model.bounds.tolist() == [4.0, 1.0, -0.5, 1.5], f"Model has incorrect bounds: {mps_model.bounds.tolist()}"
+    assert mps_model.lower_bounds.tolist() == [0.0, -1.0, 0.0] and mps_model.upper_bounds.tolist() == [4.0, 1.0, 1.0], "Variable bounds are read incorrectly"
+    assert mps_model.solve().objective_value() == 4.5, "MPS model has incorrect solution"
+
+    lp_path = os.path.join(directory, "example.lp")
+    with open(lp_path, "w") as file:
+        file.write(LP_FILE)
+    lp_model = read_lp(lp_path)
+    assert lp_model.name == "example_22_lp" and lp_model.objective_factors.tolist() == [2.0, 3.0, -1.0], "LP objective is read incorrectly"
+    assert lp_model.matrix().to_dense().tolist() == [[1.0, 1.0, 0.0], [-1.0, 0.0, 2.0], [3.0, -1.0, 0.0]], "LP constraints are read incorrectly"
+    assert lp_model.bounds.tolist() == [2.0, 4.0, -1.0] and lp_model.types.tolist() == [1, -1, 0], "LP constraint bounds are read incorrectly"
+    assert lp_model.lower_bounds.tolist() == [0.0, 0.5, -2.0] and lp_model.upper_bounds.tolist() == [10.0, float('inf'), 3.0], "LP variable bounds are read incorrectly"
+
+    model = Model("example_22_file_formats")
+    x1 = model.create_variable("x1")
+    x2 = model.create_variable("x2")
+    x3 = model.create_variable("x3")
+    model.add_constraint(x1 + x2 + x3 <= 30)
+    model.add_constraint(x1 + 2*x2 + x3 >= 10)
+    model.add_constraint(2*x2 + x3 == 20)
+    model.set_upper_bound(x1, 5)
+    model.maximize(2*x1 + x2 + 3*x3)
+    for (write, read, name) in ((write_mps, read_mps, "model.mps.gz"), (write_lp, read_lp, "model.lp")):
+        path = os.path.join(directory, name)
+        write(model, path)
+        copy = read(path).to_model()
+        assert copy.is_equivalent(model) and copy.name == model.name, f"Model read back from {name} is different"
+        assert copy.solve().objective_value() == model.solve().objective_value(), f"Model read back from {name} has a different solution"
+
+    with open(lp_path, "w") as file:
+        file.write("Maximize\n x\nSubject To\n x <= 1\nBounds\n x free\nEnd\n")
+    try:
+        read_lp(lp_path)
+    except Exception as error:
+        assert "free variables" in str(error), f"Unexpected error: {error}"
+    else:
+        raise AssertionError("Free variables aren't supported")
+
+    logging.info("Congratulations! The models are read and written correctly :)")
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    run()
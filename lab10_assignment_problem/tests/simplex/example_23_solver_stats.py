@@ -0,0 +1,106 @@
+import logging
+from saport.simplex.model import Model
+from saport.simplex.array_model import ArrayModel
+from saport.simplex.solverfactory import Engine, SolverFactory, Retention
+from saport.simplex.stats import Phase, SolverHook
+
+
+class RecordingHook(SolverHook):
+
+    def __init__(self):
+        self.events = []
+
+    def on_normalize(self, model, normal_model):
+        self.events.append("normalize")
+
+    def on_presolve(self, model, reduced_model, stats):
+        self.events.append("presolve")
+
+    def on_pivot(self, phase, entering, leaving, degenerate):
+        self.events.append(phase)
+
+    def on_terminate(self, solution):
+        self.events.append("terminate")
+        self.solution = solution
+
+
+def create_model():
+    model = Model("example_23_solver_stats")
+    x1 = model.create_variable("x1")
+    x2 = model.create_variable("x2")
+    x3 = model.create_variable("x3")
+    model.add_constraint(x1 + x2 + x3 <= 30)
+    model.add_constraint(x1 + 2*x2 + x3 >= 10)
+    model.add_constraint(2*x2 + x3 <= 20)
+    model.maximize(2*x1 + x2 + 3*x3)
+    return model
+
+
+def run():
+    for engine in Engine:
+        hook = RecordingHook()
+        solution = create_model().solve(engine, hook = hook)
+        stats = solution.stats
+        assert solution.objective_value() == 80, f"Model ({engine}) has incorrect solution"
+        assert hook.solution is solution, f"Hook ({engine}) should be notified about the solution"
+        assert hook.events[0] == "normalize" and hook.events[-1] == "terminate", f"Hook ({engine}) got events in incorrect order: {hook.events}"
+        assert stats.pivots() == solution.iterations > 0, f"Stats ({engine}) counted {stats.pivots()} pivots, but the solver did {solution.iterations}"
+        assert stats.phase_one_pivots == hook.events.count(Phase.ONE) > 0, f"Stats ({engine}) counted incorrect number of the first phase pivots"
+        assert stats.phase_two_pivots == hook.events.count(Phase.TWO), f"Stats ({engine}) counted incorrect number of the second phase pivots"
+        assert stats.degenerate_pivots + stats.bound_flips <= stats.pivots(), f"Stats ({engine}) counted too many degenerate pivots"
+        stages = stats.normalize_time + stats.tableaux_time + stats.copy_time + stats.phase_one_time + stats.phase_two_time
+        assert 0 < stages <= stats.total_time, f"Stats ({engine}) have incorrect timings:\n{stats}"
+        logging.info(f"{engine}:\n{stats}")
+
+    # x1 enters first and the row with zero bound limits it to zero, so the first pivot doesn't move the solution
+    degenerate_model = Model("example_23_degenerate")
+    y1 = degenerate_model.create_variable("y1")
+    y2 = degenerate_model.create_variable("y2")
+    degenerate_model.add_constraint(y1 - y2 <= 0)
+    degenerate_model.add_constraint(y1 <= 2)
+    degenerate_model.add_constraint(y2 <= 3)
+    degenerate_model.maximize(2*y1 + y2)
+    for engine in Engine:
+        solution = degenerate_model.solve(engine)
+        assert solution.objective_value() == 7 and solution.stats.degenerate_pivots == 1, f"Stats ({engine}) should count one degenerate pivot, got {solution.stats.degenerate_pivots}"
+
+    # the first phase ends with an artificial variable basic at zero, driving it out is a degenerate pivot as well
+    artificial_model = Model("example_23_artificial")
+    z1 = artificial_model.create_variable("z1")
+    z2 = artificial_model.create_variable("z2")
+    artificial_model.add_constraint(z1 + z2 == 0)
+    artificial_model.add_constraint(2*z1 + z2 == 0)
+    artificial_model.maximize(2*z1)
+    for engine in Engine:
+        hook = RecordingHook()
+        solution = artificial_model.solve(engine, hook = hook, retention = Retention.HISTORY)
+        (phase, _, basis) = solution.history[solution.stats.phase_one_pivots - 1]
+        assert phase == Phase.ONE and (basis < 2).all(), f"Pivots ({engine}) driving out the artificial variables should be recorded, the last first phase basis is {basis}"
+        assert solution.stats.phase_one_pivots == hook.events.count(Phase.ONE) == len(solution.history) == solution.iterations, f"Stats ({engine}) and hook should count the pivots driving out the artificial variables"
+        assert solution.stats.degenerate_pivots == solution.iterations, f"Stats ({engine}) should count every pivot at zero level as degenerate"
+
+    hook = RecordingHook()
+    solution = create_model().solve(presolve = True, hook = hook)
+    assert hook.events[0] == "presolve" and solution.stats.presolve_time > 0, "Hook should be notified about the presolve"
+
+    array_model = ArrayModel.from_model(create_model())
+    solution = array_model.solve(hook = hook)
+    assert solution.stats.pivots() == solution.iterations and hook.solution is solution, "Array model solve should collect the stats too"
+
+    solver = SolverFactory.solver(Engine.TABLEAUX, hook = hook)
+    solution = solver.solve(create_model())
+    x1 = solution.model.variables[0]
+    reoptimized = solver.reoptimize(solution, [x1 <= 5])
+    assert reoptimized.stats.dual_pivots == reoptimized.iterations > 0, "Re-optimization should count the dual simplex pivots"
+    assert solution.stats is not reoptimized.stats, "Every solve should have its own stats"
+
+    # without a hook nothing is called, the stats are collected anyway
+    solution = create_model().solve()
+    assert solution.stats.pivots() == solution.iterations, "Stats should be collected without a hook"
+
+    logging.info("Congratulations! The solver statistics are collected correctly :)")
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    run()
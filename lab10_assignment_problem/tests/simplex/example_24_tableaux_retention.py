@@ -0,0 +1,70 @@
+import logging
+import os
+import numpy as np
+from saport.simplex.model import Model
+from saport.simplex.analyser import Analyser
+from saport.simplex.solverfactory import Engine, SolverFactory
+from saport.simplex.history import Retention
+
+
+def create_model():
+    model = Model("example_24_tableaux_retention")
+    x1 = model.create_variable("x1")
+    x2 = model.create_variable("x2")
+    x3 = model.create_variable("x3")
+    model.add_constraint(x1 + x2 + x3 <= 30)
+    model.add_constraint(x1 + 2*x2 + x3 >= 10)
+    model.add_constraint(2*x2 + x3 <= 20)
+    model.maximize(2*x1 + x2 + 3*x3)
+    return model
+
+
+def run():
+    for engine in [Engine.TABLEAUX, Engine.REVISED]:
+        lean = create_model().solve(engine, retention = Retention.NONE)
+        assert lean.objective_value() == 80, f"Lean solution ({engine}) has incorrect objective value"
+        assert lean.tableaux == None and lean.initial_tableaux == None and lean.normal_model == None, f"Lean solution ({engine}) should keep only the assignment"
+
+        final = create_model().solve(engine, retention = Retention.FINAL)
+        assert final.initial_tableaux == None and final.tableaux != None and final.normal_model != None, f"Solution ({engine}) should keep only the final tableaux"
+        assert Analyser().analyse(final) != None, f"Final tableaux ({engine}) should be enough for the analysers"
+
+        default = create_model().solve(engine)
+        assert default.initial_tableaux != None and default.tableaux != None, f"Solution ({engine}) should keep both tableaux by default"
+        assert default.initial_tableaux.model is default.tableaux.model is default.normal_model, f"Tableaux ({engine}) should share the normal model instead of copying it"
+        assert default.initial_tableaux.table is not default.tableaux.table, f"Initial tableaux ({engine}) should have its own table"
+
+        full = create_model().solve(engine, retention = Retention.HISTORY)
+        history = full.history
+        assert len(history) == full.iterations > 0, f"History ({engine}) should have an entry for every pivot, got {len(history)}"
+        (phase, table, basis) = history[-1]
+        if engine == Engine.TABLEAUX:
+            assert np.allclose(table, full.tableaux.table), "Last history entry should be the final tableaux"
+        else:
+            assert table is None, f"Revised engine doesn't build the tables, got {table}"
+        assert sorted(basis[basis >= 0].tolist()) == sorted(b for b in full.tableaux.basis if b >= 0), f"Last history entry ({engine}) should have the final basis"
+        directory = history.directory
+        history.close()
+        assert not os.path.exists(directory), f"History ({engine}) should remove its files"
+
+    lean = create_model().solve(retention = Retention.NONE)
+    try:
+        Analyser().analyse(lean)
+    except Exception as error:
+        assert "no tableaux" in str(error), f"Unexpected error: {error}"
+    else:
+        raise AssertionError("Lean solution can't be analysed")
+
+    # without the tableaux re-optimization falls back to solving the model from scratch
+    solver = SolverFactory.solver(Engine.TABLEAUX, retention = Retention.NONE)
+    solution = solver.solve(create_model())
+    x1 = solution.model.variables[0]
+    reoptimized = solver.reoptimize(solution, [x1 <= 5])
+    assert reoptimized.objective_value() == 70 and reoptimized.stats.dual_pivots == 0, "Lean solution should be re-optimized from scratch"
+
+    logging.info("Congratulations! The tableaux are kept as requested :)")
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    run()
@@ -0,0 +1,53 @@
+import logging
+import numpy as np
+from saport.simplex.model import Model
+from saport.simplex.batch import solve_batch
+
+
+def create_model(bounds = (30, 10, 20), factors = (2, 1, 3)):
+    model = Model("example_25_batch_solving")
+    x1 = model.create_variable("x1")
+    x2 = model.create_variable("x2")
+    x3 = model.create_variable("x3")
+    model.add_constraint(x1 + x2 + x3 <= bounds[0])
+    model.add_constraint(x1 + 2*x2 + x3 >= bounds[1])
+    model.add_constraint(2*x2 + x3 <= bounds[2])
+    model.maximize(factors[0]*x1 + factors[1]*x2 + factors[2]*x3)
+    return model
+
+
+def run():
+    rng = np.random.default_rng(25)
+    rhs_list = [(30, 10, 20), (40, 10, 20), (30, 10, 10)] + [tuple(rng.integers(5, 50, 3)) for _ in range(20)] + [(10, 40, 20)]
+    batch = solve_batch(create_model(), rhs_list = rhs_list)
+    assert len(batch) == len(rhs_list) and batch.assignments.shape == (len(rhs_list), 3), "Batch should have one row per scenario"
+    assert batch.objective_values[0] == 80, f"First scenario should have objective value 80, got {batch.objective_values[0]}"
+    assert batch.warm_started[1:].any(), "Later scenarios should start from the optimal basis of the earlier ones"
+    assert not batch.is_feasible[-1] and np.isnan(batch.objective_values[-1]), "Last scenario is unfeasible"
+    for (i, rhs) in enumerate(rhs_list):
+        solution = create_model(bounds = rhs).solve()
+        assert solution.is_feasible == batch.is_feasible[i], f"Scenario {i} has incorrect feasibility"
+        if solution.is_feasible:
+            assert np.isclose(solution.objective_value(), batch.objective_values[i]), f"Scenario {i} should have objective value {solution.objective_value()}, got {batch.objective_values[i]}"
+            model = create_model(bounds = rhs)
+            assert np.isclose(model.objective.evaluate(batch.assignments[i]), batch.objective_values[i]), f"Scenario {i} has assignment inconsistent with its objective value"
+
+    cost_list = [(2, 1, 3), (3, 1, 2), (1, 5, 1), (-1, -1, -1), (2, 1, 3)]
+    batch = solve_batch(create_model(), cost_list = cost_list)
+    for (i, factors) in enumerate(cost_list):
+        solution = create_model(factors = factors).solve()
+        assert np.isclose(solution.objective_value(), batch.objective_values[i]), f"Objective {i} should have value {solution.objective_value()}, got {batch.objective_values[i]}"
+    assert batch.iterations[-1] == 0, "Objective optimal in the current basis shouldn't need any pivots"
+
+    # scenario i pairs the i-th right-hand side with the i-th objective
+    batch = solve_batch(create_model(), rhs_list = rhs_list[:2], cost_list = [(2, 1, 3), (0, 1, 0)])
+    assert np.allclose(batch.objective_values, [80, 10]), f"Paired scenarios have incorrect objective values: {batch.objective_values}"
+    try:
+        solve_batch(create_model(), rhs_list = rhs_list, cost_list = cost_list)
+    except Exception as error:
+        assert "scenario" in str(error), f"Unexpected error: {error}"
+    else:
+        raise AssertionError("Lists of different lengths can't be paired")
+
+    logging.info("Congratulations! Batch of the scenarios gives the same solutions as solving them one by one :)")
+    logging.info(f"Objective values of the last batch: {batch.objective_values}")
@@ -0,0 +1,43 @@
+import logging
+import time
+from saport.simplex.model import Model
+from saport.simplex.solverfactory import Engine
+from saport.parallel import Task, TaskStatus, simplex_task, solve_many
+
+
+def create_model(bound):
+    model = Model(f"example_26_parallel_solving_{bound}")
+    x1 = model.create_variable("x1")
+    x2 = model.create_variable("x2")
+    x3 = model.create_variable("x3")
+    model.add_constraint(x1 + x2 + x3 <= bound)
+    model.add_constraint(x1 + 2*x2 + x3 >= 10)
+    model.add_constraint(2*x2 + x3 <= 20)
+    model.maximize(2*x1 + x2 + 3*x3)
+    return model
+
+
+def run():
+    bounds = [30, 40, 5, 50]
+    tasks = [simplex_task(create_model(bound), Engine.TABLEAUX) for bound in bounds]
+    tasks.append(Task(time.sleep, (10,), "sleep", timelimit = 0.5))
+    results = list(solve_many(tasks, workers = 2))
+    assert sorted(result.index for result in results) == list(range(len(tasks))), "Every task should have exactly one result"
+
+    for result in results:
+        if result.name == "sleep":
+            assert result.status == TaskStatus.TIMEOUT and result.time < 5, f"Sleeping task should be cancelled after its time limit, got {result.status} after {result.time:.2f}s"
+            continue
+        assert result.status == TaskStatus.DONE, f"Task {result.name} failed: {result.error}"
+        expected = create_model(bounds[result.index]).solve()
+        assert result.value.is_feasible == expected.is_feasible, f"Task {result.name} has incorrect feasibility"
+        if expected.is_feasible:
+            assert abs(result.value.objective_value - expected.objective_value()) < 1e-9, f"Task {result.name} should have objective value {expected.objective_value()}, got {result.value.objective_value}"
+
+    # an infinite time limit means no deadline at all
+    (unlimited,) = solve_many([Task(time.sleep, (0.2,), "unlimited sleep", float("inf"))], workers = 1)
+    assert unlimited.status == TaskStatus.DONE, f"Task without a time limit should finish, got {unlimited.status}: {unlimited.error}"
+    (unlimited,) = solve_many([Task(time.sleep, (0.2,), "unlimited sleep")], workers = 1, timelimit = float("inf"))
+    assert unlimited.status == TaskStatus.DONE, f"Tasks with the infinite limit of solve_many should finish, got {unlimited.status}: {unlimited.error}"
+
+    logging.info("Congratulations! Models solved in the worker processes have the same solutions :)")
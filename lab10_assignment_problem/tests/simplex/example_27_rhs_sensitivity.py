@@ -0,0 +1,71 @@
+import logging
+import math
+from saport.simplex.model import Model
+from saport.simplex.analyser import Analyser
+from saport.simplex.analysis_tools.rhs_sensitivity import RHSSensitivityAnalyser
+from saport.simplex.solverfactory import Engine
+
+
+def production_model():
+    model = Model("example_27_rhs_sensitivity")
+    x1 = model.create_variable("x1")
+    x2 = model.create_variable("x2")
+    x3 = model.create_variable("x3")
+    model.add_constraint(6*x1 + 5*x2 + 8*x3 <= 60)
+    model.add_constraint(10*x1 + 20*x2 + 10*x3 <= 150)
+    model.add_constraint(x1 <= 8)
+    model.maximize(5*x1 + 4.5*x2 + 6*x3)
+    return model
+
+
+def mixed_model():
+    model = Model("example_27_rhs_sensitivity_mixed")
+    y1 = model.create_variable("y1")
+    y2 = model.create_variable("y2")
+    y3 = model.create_variable("y3")
+    model.add_constraint(y1 + y2 + y3 == 10)
+    model.add_constraint(2*y1 + y2 >= 8)
+    model.add_constraint(y2 + 3*y3 <= 18)
+    model.minimize(3*y1 + 2*y2 + 4*y3)
+    return model
+
+
+def check(results, expected_results):
+    tolerance = 0.001
+    for (i, (result, expected)) in enumerate(zip(results, expected_results)):
+        for (value, expected_value) in zip(result, expected):
+            assert math.isclose(value, expected_value, abs_tol=tolerance), f"constraint {i} seems to have incorrect shadow price or bound range, expected {expected}, got {result}"
+
+
+def run():
+    analyser = Analyser()
+    solution = production_model().solve()
+    results = analyser.analyse(solution)
+    analyser.interpret_results(solution, results, logging.info)
+    rhs_results = results[RHSSensitivityAnalyser.name()]
+    check(rhs_results, [(0.786, 37.5, 65.5), (0.029, 128.0, 240.0), (0.0, 6.429, float("inf"))])
+
+    # the shadow prices are the optimal dual variables
+    dual_solution = production_model().dual().solve()
+    check([(price,) for (price, _, _) in rhs_results], [(value,) for value in dual_solution.assignment])
+
+    # equality constraints have no slack column, ">=" constraints have a surplus one
+    for engine in [Engine.TABLEAUX, Engine.REVISED]:
+        rhs_results = RHSSensitivityAnalyser().analyse(mixed_model().solve(engine))
+        check(rhs_results, [(2.0, 8.0, 18.0), (0.0, float("-inf"), 10.0), (0.0, 10.0, float("inf"))])
+
+    # a presolved solution gets only the shadow prices of the dual postsolve, the cost analysis is skipped
+    presolved = production_model().solve(presolve=True)
+    presolved_results = analyser.analyse(presolved)
+    analyser.interpret_results(presolved, presolved_results, logging.info)
+    assert list(presolved_results.keys()) == [RHSSensitivityAnalyser.name()], f"Only the right-hand side analysis should accept a presolved solution, got {list(presolved_results.keys())}"
+    for (i, (price, lower, upper)) in enumerate(presolved_results[RHSSensitivityAnalyser.name()]):
+        assert math.isclose(price, dual_solution.assignment[i], abs_tol=0.001), f"constraint {i} of the presolved solution should have shadow price {dual_solution.assignment[i]}, got {price}"
+        assert math.isnan(lower) and math.isnan(upper), f"ranges of the presolved solution should be unknown, got {(lower, upper)}"
+
+    logging.info("Congratulations! This right-hand side analysis looks alright :)")
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    run()
@@ -0,0 +1,59 @@
+import logging
+import math
+from saport.simplex.model import Model
+from saport.simplex.analysis_tools.parametric import ParametricAnalyser, ParametricEnd
+
+
+def create_model(bounds = (60, 150, 8), factors = (5, 4.5, 6)):
+    model = Model("example_28_parametric_analysis")
+    x1 = model.create_variable("x1")
+    x2 = model.create_variable("x2")
+    x3 = model.create_variable("x3")
+    model.add_constraint(6*x1 + 5*x2 + 8*x3 <= bounds[0])
+    model.add_constraint(10*x1 + 20*x2 + 10*x3 <= bounds[1])
+    model.add_constraint(x1 <= bounds[2])
+    model.maximize(factors[0]*x1 + factors[1]*x2 + factors[2]*x3)
+    return model
+
+
+def check(result, expected_breakpoints, solve_at):
+    breakpoints = result.breakpoints()
+    assert len(breakpoints) == len(expected_breakpoints), f"expected breakpoints {expected_breakpoints}, got {breakpoints}"
+    for (breakpoint, expected) in zip(breakpoints, expected_breakpoints):
+        assert math.isclose(breakpoint, expected, abs_tol=0.001), f"expected breakpoints {expected_breakpoints}, got {breakpoints}"
+    assert result.pivots == len(breakpoints), f"every breakpoint should cost one pivot, got {result.pivots} pivots for {len(breakpoints)} breakpoints"
+
+    # the value function agrees with solving the model from scratch
+    for theta in [0, 1, 5.5, 10, 30, 50, 70]:
+        if theta > result.segments[-1].end:
+            continue
+        expected = solve_at(theta).objective_value()
+        assert math.isclose(result.value(theta), expected, abs_tol=0.001), f"optimal value at t = {theta} should be {expected}, got {result.value(theta)}"
+
+
+def run():
+    solution = create_model().solve()
+    analyser = ParametricAnalyser()
+
+    more_resource = analyser.analyse_rhs(solution, [1, 0, 0])
+    analyser.interpret_results(solution, more_resource, logging.info)
+    check(more_resource, [5.5, 44.0, 60.0], lambda t: create_model(bounds = (60 + t, 150, 8)).solve())
+    assert more_resource.end == ParametricEnd.LIMIT and more_resource.segments[-1].slope == 0, "resource becomes worthless after the last breakpoint"
+    assert math.isclose(more_resource.segments[0].slope, 0.786, abs_tol=0.001), "first slope should be the shadow price of the constraint"
+
+    less_resource = analyser.analyse_rhs(solution, [-1, 0, 0])
+    check(less_resource, [22.5], lambda t: create_model(bounds = (60 - t, 150, 8)).solve())
+    assert less_resource.end == ParametricEnd.UNFEASIBLE and math.isclose(less_resource.segments[-1].end, 60.0), "model is unfeasible with a negative bound"
+
+    higher_cost = analyser.analyse_objective(solution, [0, 0, 1])
+    check(higher_cost, [0.571, 1.2], lambda t: create_model(factors = (5, 4.5, 6 + t)).solve())
+
+    limited = analyser.analyse_objective(solution, [0, 0, -1], limit = 10)
+    assert len(limited.segments) == 1 and limited.segments[0].end == 10 and limited.pivots == 0, "lower cost of a nonbasic variable keeps the basis"
+
+    logging.info("Congratulations! The parametric analysis walks through the right bases :)")
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    run()
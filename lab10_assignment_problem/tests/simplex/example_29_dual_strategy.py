@@ -0,0 +1,104 @@
+import logging
+import math
+import numpy as np
+from saport.simplex.model import Model
+from saport.simplex.array_model import ArrayModel
+from saport.simplex.cache import SolutionCache
+from saport.simplex.solverfactory import Engine, Strategy
+from saport.simplex.expressions.constraint import ConstraintType
+
+
+def create_game_model(rewards):
+    # the max model of a mixed game (see MixedSolver.create_max_model), it has a row for every action of the opponent
+    model = ArrayModel("example_29_dual_strategy (game)")
+    v = model.create_variable("v")
+    xs = model.create_variables(rewards.shape[0], "x")
+    model.add_constraints_from_arrays(np.ones((1, rewards.shape[0])), 1, ConstraintType.EQ, xs)
+    model.add_constraints_from_arrays(np.column_stack([np.ones(rewards.shape[1]), -rewards.T]), 0, ConstraintType.LE)
+    model.maximize(v)
+    return model
+
+
+def check_same(primal_solution, dual_solution, model):
+    assert dual_solution.is_feasible == primal_solution.is_feasible and dual_solution.is_bounded == primal_solution.is_bounded, "dual strategy should recognize the same kind of solution"
+    if primal_solution.assignment == None:
+        return
+    assert math.isclose(dual_solution.objective_value(), primal_solution.objective_value(), abs_tol=0.0001), f"dual strategy should find the optimum {primal_solution.objective_value()}, got {dual_solution.objective_value()}"
+    assignment = dual_solution.assignment
+    for (var, lower, upper) in zip(model.variables, model.lower_bounds, model.upper_bounds):
+        assert lower - 0.0001 <= assignment[var.index] <= upper + 0.0001, f"{var.name} = {assignment[var.index]} should be in [{lower}, {upper}]"
+    for constraint in model.constraints:
+        value = constraint.expression.evaluate(assignment)
+        satisfied = {ConstraintType.LE: value <= constraint.bound + 0.0001, ConstraintType.EQ: abs(value - constraint.bound) <= 0.0001, ConstraintType.GE: value >= constraint.bound - 0.0001}
+        assert satisfied[constraint.type], f"assignment found through the dual violates {constraint}"
+
+
+def run():
+    # dual of a model with an equality gets a pair of variables for its free dual variable
+    primal = Model("example_29_dual_strategy")
+    x0 = primal.create_variable("x0")
+    x1 = primal.create_variable("x1")
+    primal.add_constraint(x0 + x1 == 4)
+    primal.add_constraint(x0 - x1 <= 2)
+    primal.maximize(3*x0 + x1)
+
+    expected_dual = Model("example_29_dual_strategy (expected dual)")
+    y0 = expected_dual.create_variable("y0")
+    y1 = expected_dual.create_variable("y1")
+    y2 = expected_dual.create_variable("y2")
+    expected_dual.add_constraint(y0 + y1 - y2 >= 3)
+    expected_dual.add_constraint(y0 - y1 - y2 >= 1)
+    expected_dual.minimize(4*y0 + 2*y1 - 4*y2)
+    assert primal.dual().is_equivalent(expected_dual), "equality should be split into two opposite constraints in the dual"
+    check_same(primal.solve(), primal.solve(strategy = Strategy.DUAL), primal)
+
+    # the bounds of the variables become constraints of the dual, a negative lower bound makes the dual constraint an equality
+    bounded = primal.copy()
+    bounded.set_lower_bound(x1, -1)
+    bounded.set_upper_bound(x0, 2.5)
+    assert bounded.dual().constraints[1].type == ConstraintType.EQ, "variable with a negative lower bound should get an equality dual constraint"
+    for engine in [Engine.TABLEAUX, Engine.REVISED]:
+        check_same(bounded.solve(engine), bounded.solve(engine, strategy = "dual"), bounded)
+
+    # a tall game is solved through the dual automatically, the small models stay primal
+    rewards = np.array([[3.0, -1.0, 2.0, 0.0, 4.0, 1.0, -2.0, 5.0], [-2.0, 4.0, 0.0, 3.0, -1.0, 2.0, 6.0, -3.0]])
+    game = create_game_model(rewards).to_model()
+    assert game._solves_dual(Strategy.AUTO, Engine.TABLEAUX, False), "model with many more rows than variables should be solved through its dual"
+    assert not primal._solves_dual(Strategy.AUTO, Engine.TABLEAUX, False), "model with more variables than rows should be solved directly"
+    assert not game._solves_dual(Strategy.AUTO, Engine.SPARSE, False), "sparse engine can't solve the model through its dual"
+    game_solution = game.solve(strategy = Strategy.AUTO)
+    check_same(game.solve(), game_solution, game)
+    assert game_solution.tableaux == None, "tableaux of the dual doesn't belong to the model"
+    assert game_solution.iterations > 0, "solution should report the pivots of the dual"
+
+    # array models and the cache solve the dual model the same way
+    cache = SolutionCache()
+    array_solution = create_game_model(rewards).solve(Engine.REVISED, cache = cache, strategy = "auto")
+    check_same(game_solution, array_solution, game)
+    create_game_model(rewards).solve(Engine.REVISED, cache = cache, strategy = "auto")
+    assert cache.hits == 1, "dual model of an identical model should be taken from the cache"
+
+    # unbounded dual proves the model unfeasible, an unfeasible dual leaves the decision to the model itself
+    unfeasible = primal.copy()
+    unfeasible.add_constraint(x0 + x1 >= 5)
+    check_same(unfeasible.solve(), unfeasible.solve(strategy = Strategy.DUAL), unfeasible)
+    unbounded = Model("example_29_dual_strategy (unbounded)")
+    z0 = unbounded.create_variable("z0")
+    z1 = unbounded.create_variable("z1")
+    unbounded.add_constraint(z0 - z1 <= 2)
+    unbounded.maximize(z0 + z1)
+    check_same(unbounded.solve(), unbounded.solve(strategy = Strategy.DUAL), unbounded)
+
+    try:
+        primal.solve(Engine.SPARSE, strategy = Strategy.DUAL)
+    except Exception as error:
+        assert "sparse engine" in str(error), f"unexpected error: {error}"
+    else:
+        raise AssertionError("dual strategy shouldn't be allowed with the sparse engine")
+
+    logging.info("Congratulations! The models seem to be correctly solved through their duals :)")
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    run()
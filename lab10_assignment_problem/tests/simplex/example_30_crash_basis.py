@@ -0,0 +1,53 @@
+import logging
+import math
+from saport.simplex.model import Model
+from saport.simplex.solver import Solver
+from saport.simplex.solverfactory import Engine
+
+
+def create_model(waste_bound = 100):
+    # "total" and "waste" appear in a single equality each, so they can start in the basis instead of the artificial variables
+    model = Model("example_30_crash_basis")
+    x1 = model.create_variable("x1")
+    x2 = model.create_variable("x2")
+    total = model.create_variable("total")
+    waste = model.create_variable("waste")
+    model.add_constraint(2*x1 + 3*x2 + waste == 12)
+    model.add_constraint(x1 + x2 - total == 0)
+    model.add_constraint(x1 - x2 <= 2)
+    model.set_upper_bound(waste, waste_bound)
+    model.maximize(3*x1 + 4*x2 - 2*waste)
+    return model
+
+
+def run():
+    solver = Solver()
+    solution = solver.solve(create_model())
+    assert len(solver.artificial_variables) == 0, f"crash basis should cover all the equalities, got artificial variables {list(solver.artificial_variables.values())}"
+    assert sorted(solver.crash_variables.values()) == [0, 1], f"crash variables should be basic in the equality rows, got {solver.crash_variables}"
+    assert solution.stats.phase_one_pivots == 0, "the crash basis is feasible, the first phase shouldn't pivot"
+    expected = create_model().solve(Engine.REVISED)
+    assert math.isclose(solution.objective_value(), expected.objective_value(), abs_tol=0.0001), f"expected optimum {expected.objective_value()}, got {solution.objective_value()}"
+
+    # the second phase starts on the same table, only the columns of the normal model are left
+    columns_n = len(solution.normal_model.variables)
+    assert solution.initial_tableaux.table.shape == (4, columns_n + 1), f"initial tableaux should have {columns_n} columns, got {solution.initial_tableaux.table.shape}"
+    assert solution.tableaux.table.shape == (4, columns_n + 1), f"final tableaux should have {columns_n} columns, got {solution.tableaux.table.shape}"
+
+    # a crash variable has to fit its bounds, otherwise the row gets an artificial variable
+    bounded_solution = solver.solve(create_model(waste_bound = 5))
+    assert list(solver.crash_variables.values()) == [1] and list(solver.artificial_variables.values()) == [0], "waste = 12 exceeds its bound, so its row should get an artificial variable"
+    bounded_expected = create_model(waste_bound = 5).solve(Engine.REVISED)
+    assert math.isclose(bounded_solution.objective_value(), bounded_expected.objective_value(), abs_tol=0.0001), f"expected optimum {bounded_expected.objective_value()}, got {bounded_solution.objective_value()}"
+
+    unfeasible = create_model()
+    unfeasible.add_constraint(unfeasible.variables[0] + unfeasible.variables[1] >= 7)
+    unfeasible_solution = solver.solve(unfeasible)
+    assert not unfeasible_solution.is_feasible, "model with 2 * x1 + 3 * x2 <= 12 and x1 + x2 >= 7 should be unfeasible"
+
+    logging.info("Congratulations! The first phase seems to start from the crash basis :)")
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    run()
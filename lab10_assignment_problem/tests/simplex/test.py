@@ -1,6 +1,6 @@
 import importlib
 import os
-test_modules = ['example_01_solvable', 'example_02_solvable', 'example_03_unbounded', 'example_04_solvable_artificial_vars', 'example_05_unfeasible', 'example_06_dual', 'example_07_cost_sensitivity']
+test_modules = ['example_01_solvable', 'example_02_solvable', 'example_03_unbounded', 'example_04_solvable_artificial_vars', 'example_05_unfeasible', 'example_06_dual', 'example_07_cost_sensitivity', 'example_08_revised_engine', 'example_09_tableaux_basis', 'example_10_pricing_rules', 'example_11_bounded_variables', 'example_12_reoptimization', 'example_13_solver_session', 'example_14_presolve', 'example_15_sparse_engine', 'example_16_array_model', 'example_17_expression_builder', 'example_18_bulk_arrays', 'example_19_model_copy', 'example_20_cached_factors', 'example_21_solution_cache', 'example_22_file_formats', 'example_23_solver_stats', 'example_24_tableaux_retention', 'example_25_batch_solving', 'example_26_parallel_solving', 'example_27_rhs_sensitivity', 'example_28_parametric_analysis', 'example_29_dual_strategy', 'example_30_crash_basis']
 test_dir = 'tests.simplex'
 print("Running tests...")
 success = True